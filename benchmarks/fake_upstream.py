@@ -0,0 +1,118 @@
+"""Local stand-ins for the Slack webhook and Telegram Bot APIs.
+
+Slack webhooks are served under ``/services/...`` and answer ``ok``;
+Telegram is served at ``/bot<token>/sendMessage`` and answers like the Bot
+API. Both can add latency, fail a fraction of requests with 500 and throttle
+a fraction with 429 (``Retry-After`` header for Slack,
+``parameters.retry_after`` for Telegram). ``GET /__stats`` returns counters.
+
+Point the app at it with:
+    SLACK_WEBHOOK_PREFIXES=http://127.0.0.1:<port>/
+    TELEGRAM_API_BASE_URL=http://127.0.0.1:<port>
+
+Usage:
+    python benchmarks/fake_upstream.py --port 18080 --latency-ms 50 --error-rate 0.01 --throttle-rate 0.01
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+from typing import Any, Dict
+
+from aiohttp import web
+
+class FakeUpstream:
+    """aiohttp application imitating both upstream APIs"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.stats: Dict[str, int] = {"slack": 0, "telegram": 0, "errors": 0, "throttled": 0}
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/services/{path:.*}", self._slack)
+        app.router.add_post("/bot{token}/sendMessage", self._telegram)
+        app.router.add_get("/__stats", self._stats)
+        return app
+
+    async def _delay_and_pick(self, channel: str) -> str:
+        self.stats[channel] += 1
+        if self.latency_ms or self.jitter_ms:
+            await asyncio.sleep(max(0.0, self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000)
+        roll = random.random()
+        if roll < self.throttle_rate:
+            self.stats["throttled"] += 1
+            return "throttled"
+        if roll < self.throttle_rate + self.error_rate:
+            self.stats["errors"] += 1
+            return "error"
+        return "ok"
+
+    async def _slack(self, request: web.Request) -> web.Response:
+        await request.read()
+        outcome = await self._delay_and_pick("slack")
+        if outcome == "throttled":
+            return web.Response(status=429, text="rate_limited", headers={"Retry-After": str(self.retry_after)})
+        if outcome == "error":
+            return web.Response(status=500, text="internal_error")
+        return web.Response(text="ok")
+
+    async def _telegram(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        outcome = await self._delay_and_pick("telegram")
+        if outcome == "throttled":
+            return web.json_response({
+                "ok": False,
+                "error_code": 429,
+                "description": f"Too Many Requests: retry after {self.retry_after}",
+                "parameters": {"retry_after": self.retry_after}
+            }, status=429)
+        if outcome == "error":
+            return web.json_response({"ok": False, "error_code": 500, "description": "Internal Server Error"}, status=500)
+        return web.json_response({"ok": True, "result": {"message_id": self.stats["telegram"], "chat": {"id": body.get("chat_id")}}})
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats)
+
+def serve(port: int, options: Dict[str, Any]) -> None:
+    """Run the stand-in until the process is terminated"""
+    web.run_app(FakeUpstream(**options).create_app(), host="127.0.0.1", port=port, print=None, access_log=None)
+
+def start_process(port: int, **options: Any) -> multiprocessing.Process:
+    """Run the stand-in in a child process, so it does not compete with the caller for the GIL"""
+    process = multiprocessing.Process(target=serve, args=(port, options), daemon=True)
+    process.start()
+    return process
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    args = parser.parse_args()
+    print(json.dumps({"listening": f"http://127.0.0.1:{args.port}"}))
+    serve(args.port, {
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "error_rate": args.error_rate,
+        "throttle_rate": args.throttle_rate,
+        "retry_after": args.retry_after
+    })
+
+if __name__ == "__main__":
+    main()
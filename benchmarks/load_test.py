@@ -0,0 +1,285 @@
+"""Load-test the real API against local Slack/Telegram stand-ins.
+
+Starts benchmarks/fake_upstream.py in a child process, starts the app as
+it is deployed (``flask``: ``python src/main.py``; ``gunicorn``: the
+gevent command from the Dockerfile; ``uvicorn``: the ASGI entrypoint), then
+drives ``POST /api/v1/notifications/send`` with a fixed number of
+concurrent clients. Every request carries a unique title, so duplicate
+suppression never short-circuits it. Outbound rate limits are disabled
+unless --keep-rate-limits is given, so the figures measure the service
+rather than the configured pacing.
+
+Reports req/s, latency percentiles, status codes, resident memory of the
+server process tree before and after the run, and the stand-in's counters
+as one JSON document (appended as a line to --output as well, to compare
+revisions).
+
+Usage:
+    python benchmarks/load_test.py --server gunicorn --requests 5000 --concurrency 32 \\
+        --latency-ms 50 --error-rate 0.01 --throttle-rate 0.01 --output results.jsonl
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import fake_upstream
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API_KEY = "load-test-key"
+
+def server_command(server: str, port: int, workers: int) -> List[str]:
+    if server == "flask":
+        return [sys.executable, "src/main.py"]
+    if server == "gunicorn":
+        return [
+            sys.executable, "-m", "gunicorn", "--bind", f"127.0.0.1:{port}", "--workers", str(workers),
+            "--worker-class", "gevent", "--timeout", "30", "src.main:app"
+        ]
+    if server == "uvicorn":
+        return [
+            sys.executable, "-m", "uvicorn", "asgi:app", "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning"
+        ]
+    raise ValueError(f"Unknown server: {server}")
+
+def server_env(args: argparse.Namespace, metrics_dir: str) -> Dict[str, str]:
+    upstream = f"http://127.0.0.1:{args.upstream_port}"
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.path.join(ROOT, "src"),
+        "API_KEY": API_KEY,
+        "HOST": "127.0.0.1",
+        "PORT": str(args.port),
+        "LOG_LEVEL": "WARNING",
+        "SLACK_WEBHOOK_PREFIXES": f"{upstream}/",
+        "TELEGRAM_API_BASE_URL": upstream,
+        "PROMETHEUS_MULTIPROC_DIR": metrics_dir
+    }
+    if not args.keep_rate_limits:
+        env.update({
+            "RATE_LIMIT_SLACK_PER_WEBHOOK": "0",
+            "RATE_LIMIT_TELEGRAM_PER_CHAT": "0",
+            "RATE_LIMIT_TELEGRAM_PER_BOT": "0"
+        })
+    for item in args.env:
+        key, _, value = item.partition("=")
+        env[key] = value
+    return env
+
+def tree_rss_bytes(pid: int) -> int:
+    """Resident memory of a process and all its descendants (Linux /proc)"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat:
+                # The command name may contain spaces; fields resume after its closing parenthesis
+                ppid = int(stat.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/status") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+    return total
+
+def make_payload(index: int, args: argparse.Namespace) -> Dict[str, Any]:
+    upstream = f"http://127.0.0.1:{args.upstream_port}"
+    destination = index % args.destinations
+    channels: Dict[str, Any] = {}
+    if args.channels in ("slack", "both"):
+        channels["slack"] = {"webhook_url": f"{upstream}/services/load/{destination}"}
+    if args.channels in ("telegram", "both"):
+        channels["telegram"] = {"bot_token": "123456:load", "chat_id": str(-1000 - destination)}
+    return {
+        "title": f"Load test notification {index}",
+        "message": "Synthetic load from benchmarks/load_test.py",
+        "level": ("INFO", "WARNING", "ERROR")[index % 3],
+        "metadata": {"index": index, "host": f"web-{index % 20}"},
+        "source": "load-test",
+        "channels": channels
+    }
+
+async def wait_until_ready(url: str, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Server did not become ready at {url}")
+            await asyncio.sleep(0.2)
+
+async def drive(args: argparse.Namespace, count: int, offset: int) -> Dict[str, Any]:
+    url = f"http://127.0.0.1:{args.port}/api/v1/notifications/send"
+    if args.async_delivery:
+        url += "?async=true"
+    headers = {"X-API-Key": API_KEY}
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    next_index = iter(range(offset, offset + count))
+
+    async def client(session: aiohttp.ClientSession) -> None:
+        for index in next_index:
+            started = time.perf_counter()
+            try:
+                async with session.post(url, json=make_payload(index, args), headers=headers) as response:
+                    await response.read()
+                    statuses[str(response.status)] += 1
+            except aiohttp.ClientError as e:
+                statuses[type(e).__name__] += 1
+            latencies.append(time.perf_counter() - started)
+
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        started = time.perf_counter()
+        await asyncio.gather(*(client(session) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] * 1000, 2)
+
+    return {
+        "requests": len(latencies),
+        "seconds": round(elapsed, 3),
+        "req_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+        "max_ms": round(ordered[-1] * 1000, 2),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 2),
+        "statuses": dict(statuses)
+    }
+
+async def fetch_json(url: str) -> Optional[Dict[str, Any]]:
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                return await response.json()
+    except aiohttp.ClientError:
+        return None
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    upstream = fake_upstream.start_process(
+        args.upstream_port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after
+    )
+    with tempfile.TemporaryDirectory() as metrics_dir:
+        server = subprocess.Popen(
+            server_command(args.server, args.port, args.workers),
+            cwd=ROOT,
+            env=server_env(args, metrics_dir),
+            stdout=subprocess.DEVNULL,
+            stderr=None if args.server_logs else subprocess.DEVNULL
+        )
+        try:
+            await wait_until_ready(f"http://127.0.0.1:{args.upstream_port}/__stats", 10)
+            await wait_until_ready(f"http://127.0.0.1:{args.port}/api/v1/notifications/health", 30)
+
+            await drive(args, args.warmup, 0)
+            rss_before = tree_rss_bytes(server.pid)
+            results = await drive(args, args.requests, args.warmup)
+            rss_after = tree_rss_bytes(server.pid)
+            upstream_stats = await fetch_json(f"http://127.0.0.1:{args.upstream_port}/__stats")
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+            upstream.terminate()
+
+    return {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "config": {
+            "server": args.server,
+            "workers": args.workers if args.server != "flask" else 1,
+            "concurrency": args.concurrency,
+            "channels": args.channels,
+            "destinations": args.destinations,
+            "async_delivery": args.async_delivery,
+            "upstream_latency_ms": args.latency_ms,
+            "upstream_error_rate": args.error_rate,
+            "upstream_throttle_rate": args.throttle_rate
+        },
+        "results": {
+            **results,
+            "rss_before_mb": round(rss_before / 1024 / 1024, 1),
+            "rss_after_mb": round(rss_after / 1024 / 1024, 1),
+            "rss_growth_mb": round((rss_after - rss_before) / 1024 / 1024, 1)
+        },
+        "upstream": upstream_stats
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--server", choices=["flask", "gunicorn", "uvicorn"], default="gunicorn")
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn/uvicorn worker processes")
+    parser.add_argument("--port", type=int, default=18000)
+    parser.add_argument("--upstream-port", type=int, default=18081)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--channels", choices=["slack", "telegram", "both"], default="slack")
+    parser.add_argument("--destinations", type=int, default=10, help="distinct webhooks/chats")
+    parser.add_argument("--async-delivery", action="store_true", help="send with ?async=true")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="upstream latency")
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of upstream 500s")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of upstream 429s")
+    parser.add_argument("--retry-after", type=int, default=1, help="seconds advertised on injected 429s")
+    parser.add_argument("--keep-rate-limits", action="store_true", help="keep the app's outbound rate limits")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="extra server setting")
+    parser.add_argument("--server-logs", action="store_true", help="show server stderr")
+    parser.add_argument("--output", help="append the result as a JSON line to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "a") as output:
+            output.write(json.dumps(report) + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Measure memory retained per stored notification in the in-memory store.
+
+``objects`` keeps the Notification instances themselves in an arrival list
+plus an id index, which is what the store used to retain. ``compact`` is
+InMemoryNotificationRepository with its _StoredNotification records and all
+of its indexes. Memory is traced with tracemalloc after the notifications
+are saved and every other reference to them is dropped, so only what the
+store retains is counted.
+
+Usage:
+    PYTHONPATH=src python benchmarks/memory_benchmark.py --notifications 1000000
+"""
+import argparse
+import asyncio
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from domain.entities.notification import Notification
+from domain.value_objects.log_level import LogLevel
+from infrastructure.repositories.in_memory_notification_repository import InMemoryNotificationRepository
+
+class ObjectStore:
+    """Retains Notification objects as they are"""
+
+    def __init__(self):
+        self.log: List[Notification] = []
+        self.by_id: Dict[Any, Notification] = {}
+
+    async def save(self, notification: Notification) -> None:
+        self.log.append(notification)
+        self.by_id[notification.id] = notification
+
+def make_notification(i: int, levels: List[LogLevel]) -> Notification:
+    return Notification.create(
+        title=f"High CPU usage on web-{i % 50}",
+        message=f"CPU usage above 90% for the last 5 minutes (sample {i})",
+        level=levels[i % len(levels)],
+        metadata={"cpu": "93%", "host": f"web-{i % 50}"} if i % 2 else None,
+        source=f"service-{i % 10}"
+    )
+
+async def fill(store: Any, count: int) -> None:
+    levels = list(LogLevel)
+    for i in range(count):
+        await store.save(make_notification(i, levels))
+
+def measure(name: str, factory: Callable[[], Any], count: int) -> Dict[str, Any]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    store = factory()
+    asyncio.run(fill(store, count))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    return {
+        "case": name,
+        "notifications": count,
+        "retained_mb": round(retained / 1024 / 1024, 1),
+        "bytes_per_notification": round(retained / count),
+        "fill_seconds": round(elapsed, 2)
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notifications", type=int, default=1000000)
+    args = parser.parse_args()
+
+    results = [
+        measure("objects", ObjectStore, args.notifications),
+        measure("compact", lambda: InMemoryNotificationRepository(max_items=args.notifications), args.notifications)
+    ]
+    for result in results:
+        print(json.dumps(result))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Measure how long urgent notifications wait in the delivery queue under an INFO flood.
+
+The queue is filled with ``--flood`` INFO jobs, then the worker pool is
+started and a DISASTER job is enqueued every 1/``--rate`` seconds for
+``--duration`` seconds. Deliveries are simulated by a service that sleeps
+``--service-ms`` per job, so only queueing is measured.
+
+``fifo`` is the queue in arrival order (fairness interval 1, no reserved
+workers), which is how it behaved before priorities. ``priority`` uses the
+defaults from Settings: priority order, every 10th claim oldest-first and
+one worker reserved for CRITICAL and above. With priorities the DISASTER
+wait stays flat as the flood grows, while INFO keeps being delivered.
+
+Usage:
+    PYTHONPATH=src python benchmarks/priority_benchmark.py --flood 1000 5000 20000
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from typing import Any, Dict, List
+
+from application.dtos.delivery_job_dto import DeliveryJobDTO
+from application.interfaces.delivery_queue import DeliveryQueueInterface
+from application.services.priority_scheduler import PriorityScheduler
+from domain.value_objects.log_level import LogLevel
+from infrastructure.config.settings import Settings
+from infrastructure.queues.delivery_worker_pool import DeliveryWorkerPool
+from infrastructure.queues.in_memory_delivery_queue import InMemoryDeliveryQueue
+from infrastructure.queues.sqlite_delivery_queue import SqliteDeliveryQueue
+
+class SleepingService:
+    """Stands in for the notification service: records queue waits and sleeps"""
+
+    def __init__(self, service_seconds: float):
+        self.service_seconds = service_seconds
+        self.waits: Dict[str, List[float]] = {level.value: [] for level in LogLevel}
+
+    async def deliver_job(self, job: DeliveryJobDTO, last_attempt: bool = True) -> Dict[str, Any]:
+        self.waits[job.notification["level"]].append(time.time() - job.created_at)
+        await asyncio.sleep(self.service_seconds)
+        return {"status": "DELIVERED", "channels": {}}
+
+def make_job(level: LogLevel) -> DeliveryJobDTO:
+    return DeliveryJobDTO(
+        job_id=str(uuid.uuid4()),
+        notification={"level": level.value},
+        channels={},
+        priority=level.priority
+    )
+
+def make_queue(backend: str, path: str, max_size: int, fairness_interval: int) -> DeliveryQueueInterface:
+    scheduler = PriorityScheduler(fairness_interval)
+    if backend == "sqlite":
+        return SqliteDeliveryQueue(path, max_size=max_size, poll_interval=0.05, scheduler=scheduler)
+    return InMemoryDeliveryQueue(max_size=max_size, scheduler=scheduler)
+
+def percentile(values: List[float], fraction: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+async def run(mode: str, flood: int, args: argparse.Namespace, path: str) -> Dict[str, Any]:
+    settings = Settings(API_KEY="benchmark")
+    fifo = mode == "fifo"
+    queue = make_queue(args.backend, path, flood + 10000, 1 if fifo else settings.DELIVERY_FAIRNESS_INTERVAL)
+    service = SleepingService(args.service_ms / 1000)
+    pool = DeliveryWorkerPool(
+        queue,
+        service,
+        workers=args.workers,
+        reserved_workers=0 if fifo else settings.DELIVERY_RESERVED_WORKERS,
+        reserved_min_priority=LogLevel(settings.DELIVERY_RESERVED_MIN_LEVEL).priority
+    )
+
+    for _ in range(flood):
+        await queue.enqueue(make_job(LogLevel.INFO))
+    await pool.start()
+
+    sent = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < args.duration:
+        await queue.enqueue(make_job(LogLevel.DISASTER))
+        sent += 1
+        await asyncio.sleep(1 / args.rate)
+    # Give the last urgent jobs a moment to be picked up
+    await asyncio.sleep(0.2)
+    await pool.stop()
+    await queue.close()
+
+    urgent = service.waits[LogLevel.DISASTER.value]
+    info = service.waits[LogLevel.INFO.value]
+    return {
+        "backend": args.backend,
+        "mode": mode,
+        "flood": flood,
+        "disaster_sent": sent,
+        "disaster_delivered": len(urgent),
+        "disaster_p50_ms": round(statistics.median(urgent) * 1000, 1) if urgent else None,
+        "disaster_p95_ms": round(percentile(urgent, 0.95) * 1000, 1) if urgent else None,
+        "disaster_max_ms": round(max(urgent) * 1000, 1) if urgent else None,
+        "info_delivered": len(info)
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flood", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--backend", choices=["memory", "sqlite"], default="memory")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--service-ms", type=float, default=5.0)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--rate", type=float, default=20.0, help="DISASTER jobs per second")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for flood in args.flood:
+            for mode in ("fifo", "priority"):
+                path = os.path.join(directory, f"{mode}-{flood}.db")
+                print(json.dumps(asyncio.run(run(mode, flood, args, path))))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Measure Slack and Telegram payload rendering, legacy vs. precompiled.
+
+``legacy`` is the original ``Notification.to_slack_payload`` /
+``to_telegram_payload`` code, including per-access LogLevel lookup dicts.
+``compiled`` is PayloadRenderer with its per-notification cache cold (every
+notification rendered once). ``fanout`` renders each notification for
+several destinations, as multi-destination sends and retries do.
+
+Both renderers are checked to produce identical payloads before timing.
+
+Usage:
+    PYTHONPATH=src python benchmarks/render_benchmark.py --notifications 20000
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from domain.entities.notification import Notification
+from domain.services.payload_renderer import PayloadRenderer
+from domain.value_objects.channel_config import SlackConfig
+from domain.value_objects.log_level import LogLevel
+
+def legacy_emoji(level: LogLevel) -> str:
+    emojis = {
+        LogLevel.INFO: "ℹ️",
+        LogLevel.WARNING: "⚠️",
+        LogLevel.ERROR: "❌",
+        LogLevel.CRITICAL: "🚨",
+        LogLevel.DISASTER: "💀"
+    }
+    return emojis[level]
+
+def legacy_slack_color(level: LogLevel) -> str:
+    colors = {
+        LogLevel.INFO: "#36a64f",
+        LogLevel.WARNING: "#ff9500",
+        LogLevel.ERROR: "#ff0000",
+        LogLevel.CRITICAL: "#8b0000",
+        LogLevel.DISASTER: "#4b0082"
+    }
+    return colors[level]
+
+def legacy_slack(notification: Notification, config: SlackConfig) -> Dict[str, Any]:
+    timestamp_str = notification.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+    attachment = {
+        "color": legacy_slack_color(notification.level),
+        "title": f"{legacy_emoji(notification.level)} {notification.title}",
+        "text": notification.message,
+        "fields": [
+            {"title": "Level", "value": notification.level.value, "short": True},
+            {"title": "Timestamp", "value": timestamp_str, "short": True}
+        ],
+        "footer": f"Notification ID: {notification.id}",
+        "ts": int(notification.timestamp.timestamp())
+    }
+    if notification.source:
+        attachment["fields"].append({"title": "Source", "value": notification.source, "short": True})
+    if notification.metadata:
+        metadata_text = "\n".join([f"• *{k}*: {v}" for k, v in notification.metadata.items()])
+        attachment["fields"].append({"title": "Metadata", "value": metadata_text, "short": False})
+
+    return {"attachments": [attachment], **config.to_dict()}
+
+def legacy_telegram(notification: Notification) -> str:
+    timestamp_str = notification.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+    message_parts = [
+        f"{legacy_emoji(notification.level)} *{notification.title}*",
+        "",
+        f"📝 {notification.message}",
+        "",
+        f"🏷️ *Level:* `{notification.level.value}`",
+        f"🕐 *Time:* `{timestamp_str}`"
+    ]
+    if notification.source:
+        message_parts.append(f"🔍 *Source:* `{notification.source}`")
+    if notification.metadata:
+        message_parts.append("")
+        message_parts.append("📊 *Metadata:*")
+        for key, value in notification.metadata.items():
+            message_parts.append(f"• *{key}:* `{value}`")
+    message_parts.extend(["", f"🆔 `{notification.id}`"])
+
+    return "\n".join(message_parts)
+
+def make_notifications(count: int) -> List[Notification]:
+    levels = list(LogLevel)
+    notifications = []
+    for i in range(count):
+        notifications.append(Notification.create(
+            title=f"High CPU usage on web-{i % 50}",
+            message="CPU usage above 90% for the last 5 minutes",
+            level=levels[i % len(levels)],
+            metadata={"cpu": "93%", "host": f"web-{i % 50}", "region": "us-east-1"} if i % 2 else {},
+            source="monitoring" if i % 3 else None
+        ))
+    return notifications
+
+def measure(name: str, fn: Callable[[Notification], Any], notifications: List[Notification], repeat: int = 1) -> Dict[str, Any]:
+    start = time.perf_counter()
+    for notification in notifications:
+        for _ in range(repeat):
+            fn(notification)
+    elapsed = time.perf_counter() - start
+    renders = len(notifications) * repeat
+    return {"case": name, "renders": renders, "renders_per_sec": round(renders / elapsed, 1)}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notifications", type=int, default=20000)
+    parser.add_argument("--fanout", type=int, default=5, help="destinations per notification")
+    args = parser.parse_args()
+
+    config = SlackConfig(webhook_url="https://hooks.slack.com/services/BENCH", channel="#alerts")
+
+    # Identical output is a precondition for comparing speed
+    check = PayloadRenderer()
+    for notification in make_notifications(100):
+        assert check.render_slack(notification, config) == legacy_slack(notification, config)
+        assert check.render_telegram(notification) == legacy_telegram(notification)
+
+    # Fresh notifications per case so no case sees another's cached renders
+    def fresh() -> List[Notification]:
+        return make_notifications(args.notifications)
+
+    results = [
+        measure("legacy_slack", lambda n: legacy_slack(n, config), fresh()),
+        measure("compiled_slack", lambda n, r=PayloadRenderer(): r.render_slack(n, config), fresh()),
+        measure("legacy_telegram", legacy_telegram, fresh()),
+        measure("compiled_telegram", PayloadRenderer().render_telegram, fresh()),
+        measure("legacy_slack_fanout", lambda n: legacy_slack(n, config), fresh(), args.fanout),
+        measure("compiled_slack_fanout", lambda n, r=PayloadRenderer(): r.render_slack(n, config), fresh(), args.fanout),
+        measure("legacy_telegram_fanout", legacy_telegram, fresh(), args.fanout),
+        measure("compiled_telegram_fanout", PayloadRenderer().render_telegram, fresh(), args.fanout)
+    ]
+    for result in results:
+        print(json.dumps(result))
+
+if __name__ == "__main__":
+    main()
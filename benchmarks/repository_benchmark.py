@@ -0,0 +1,117 @@
+"""Measure notification save latency for the memory and SQLite stores.
+
+``memory`` is InMemoryNotificationRepository. ``sqlite`` is the write-behind
+SqliteNotificationRepository: save() buffers and a background task commits
+batches. ``sqlite_sync`` commits every save in its own transaction, which is
+what a naive SQLite store would do on the request path; it is here to show
+what write-behind saves.
+
+Each case reports save latency percentiles, overall throughput (including
+writing what is still buffered at the end) and the latency of a filtered
+page query afterwards.
+
+Usage:
+    PYTHONPATH=src python benchmarks/repository_benchmark.py --notifications 20000
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from domain.entities.notification import Notification
+from domain.repositories.notification_repository import NotificationRepositoryInterface
+from domain.value_objects.log_level import LogLevel
+from infrastructure.repositories.in_memory_notification_repository import InMemoryNotificationRepository
+from infrastructure.repositories.sqlite_notification_repository import SqliteNotificationRepository
+
+class SyncSqliteNotificationRepository(SqliteNotificationRepository):
+    """Commits every save before returning"""
+
+    async def save(self, notification: Notification) -> None:
+        await super().save(notification)
+        await self._flush()
+
+def make_notifications(count: int) -> List[Notification]:
+    levels = list(LogLevel)
+    return [
+        Notification.create(
+            title=f"High CPU usage on web-{i % 50}",
+            message="CPU usage above 90% for the last 5 minutes",
+            level=levels[i % len(levels)],
+            metadata={"cpu": "93%", "host": f"web-{i % 50}"},
+            source=f"service-{i % 10}"
+        )
+        for i in range(count)
+    ]
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def measure(
+    name: str,
+    factory: Callable[[], NotificationRepositoryInterface],
+    notifications: List[Notification]
+) -> Dict[str, Any]:
+    repository = factory()
+    await repository.start()
+
+    latencies = []
+    start = time.perf_counter()
+    for notification in notifications:
+        t0 = time.perf_counter()
+        await repository.save(notification)
+        latencies.append(time.perf_counter() - t0)
+        # Let the background writer run, as it would between requests
+        await asyncio.sleep(0)
+
+    # The first read writes whatever is still buffered
+    t0 = time.perf_counter()
+    await repository.find_all(limit=1)
+    drain_ms = (time.perf_counter() - t0) * 1000
+    elapsed = time.perf_counter() - start
+
+    t0 = time.perf_counter()
+    page = await repository.find_page(limit=50, level=LogLevel.CRITICAL, source="service-3")
+    query_ms = (time.perf_counter() - t0) * 1000
+    await repository.close()
+
+    return {
+        "case": name,
+        "saves": len(notifications),
+        "save_p50_ms": round(statistics.median(latencies) * 1000, 4),
+        "save_p99_ms": round(percentile(latencies, 99) * 1000, 4),
+        "save_max_ms": round(max(latencies) * 1000, 3),
+        "saves_per_sec": round(len(notifications) / elapsed, 1),
+        "drain_ms": round(drain_ms, 3),
+        "page_query_ms": round(query_ms, 3),
+        "page_items": len(page.items)
+    }
+
+async def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = [
+            ("memory", lambda: InMemoryNotificationRepository(max_items=args.notifications)),
+            ("sqlite", lambda: SqliteNotificationRepository(
+                os.path.join(tmp, "write_behind.db"), max_items=args.notifications
+            )),
+            ("sqlite_sync", lambda: SyncSqliteNotificationRepository(
+                os.path.join(tmp, "sync.db"), max_items=args.notifications
+            ))
+        ]
+        for name, factory in cases:
+            count = args.notifications if name != "sqlite_sync" else min(args.notifications, args.sync_notifications)
+            print(json.dumps(await measure(name, factory, make_notifications(count))))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notifications", type=int, default=20000)
+    parser.add_argument("--sync-notifications", type=int, default=2000, help="saves for the sqlite_sync case")
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Compare the legacy per-request event loop against the persistent loop.
+
+Both modes serve the real NotificationController over HTTP (threaded
+werkzeug server) and deliver through a channel that POSTs to a local
+upstream. In ``legacy`` mode every request runs ``asyncio.run`` and opens
+a fresh client session, as /send did before; in ``persistent`` mode the
+use case runs on one long-lived loop with a pooled session.
+
+Usage:
+    PYTHONPATH=src python benchmarks/request_path_benchmark.py --requests 2000 --concurrency 16
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import logging
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import aiohttp
+from aiohttp import web
+from flask import Flask
+from werkzeug.serving import make_server
+
+from application.services.channel_registry import ChannelRegistry
+from application.use_cases.send_notification import SendNotificationUseCase
+from domain.services.notification_channel import NotificationChannelInterface
+from infrastructure.config.settings import Settings
+from infrastructure.external_services.http_session import PooledHttpSession
+from infrastructure.repositories.in_memory_notification_repository import InMemoryNotificationRepository
+from infrastructure.runtime.event_loop import BackgroundEventLoop
+from interface.controllers.notification_controller import NotificationController
+
+API_KEY = "benchmark-key"
+
+class UpstreamChannel(NotificationChannelInterface):
+    """Channel that POSTs every notification to the local upstream"""
+
+    name = "slack"
+
+    def __init__(self, url: str, pooled: bool):
+        self._url = url
+        self._pooled = pooled
+        self._http = PooledHttpSession("benchmark")
+
+    def render(self, notification, config) -> Dict[str, Any]:
+        return {"id": str(notification.id)}
+
+    async def send(self, notification, config) -> Dict[str, Any]:
+        payload = self.render(notification, config)
+        if not self._pooled:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(self._url, json=payload) as response:
+                    return {"status": "sent", "response": await response.text()}
+
+        session = await self._http.get()
+        async with session.post(self._url, json=payload) as response:
+            return {"status": "sent", "response": await response.text()}
+
+    def validate_config(self, config) -> bool:
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return self._http.get_stats()
+
+    async def close(self) -> None:
+        await self._http.close()
+
+class PerRequestLoop:
+    """Reproduces the old path: a new event loop for every request"""
+
+    def run(self, coro, timeout=None):
+        return asyncio.run(coro)
+
+def start_upstream(latency: float) -> int:
+    async def handler(request: web.Request) -> web.Response:
+        await request.read()
+        if latency:
+            await asyncio.sleep(latency)
+        return web.Response(text="ok")
+
+    ready = threading.Event()
+    port_holder: List[int] = []
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_post("/hook", handler)
+        runner = web.AppRunner(app, access_log=None)
+        loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        loop.run_until_complete(site.start())
+        port_holder.append(site._server.sockets[0].getsockname()[1])
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    ready.wait()
+    return port_holder[0]
+
+def build_app(mode: str, upstream_port: int) -> Flask:
+    channel = UpstreamChannel(f"http://127.0.0.1:{upstream_port}/hook", pooled=mode != "legacy")
+    service = SendNotificationUseCase(
+        notification_repository=InMemoryNotificationRepository(),
+        channels=ChannelRegistry.of(channel)
+    )
+    if mode == "legacy":
+        runner = PerRequestLoop()
+    else:
+        runner = BackgroundEventLoop("benchmark-loop")
+        runner.start()
+
+    app = Flask("benchmark")
+    controller = NotificationController(service, Settings(API_KEY=API_KEY), runner)
+    app.register_blueprint(controller.blueprint)
+    return app
+
+def drive(port: int, total: int, concurrency: int) -> List[float]:
+    body = json.dumps({
+        "title": "Benchmark",
+        "message": "request path benchmark",
+        "level": "ERROR",
+        "slack_webhook_url": "https://hooks.slack.com/services/BENCH"
+    })
+    headers = {"X-API-Key": API_KEY, "Content-Type": "application/json"}
+    per_worker = total // concurrency
+
+    def worker(_: int) -> List[float]:
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        latencies = []
+        for _ in range(per_worker):
+            start = time.perf_counter()
+            conn.request("POST", "/api/v1/notifications/send", body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - start)
+            if response.status != 201:
+                raise RuntimeError(f"Unexpected status {response.status}")
+        conn.close()
+        return latencies
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        return [lat for chunk in pool.map(worker, range(concurrency)) for lat in chunk]
+
+def run_mode(mode: str, args: argparse.Namespace, upstream_port: int) -> Dict[str, Any]:
+    server = make_server("127.0.0.1", 0, build_app(mode, upstream_port), threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        drive(server.server_port, args.concurrency * 5, args.concurrency)  # warm-up
+        start = time.perf_counter()
+        latencies = drive(server.server_port, args.requests, args.concurrency)
+        elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "requests": len(latencies),
+        "concurrency": args.concurrency,
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 3)
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--upstream-latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--mode", choices=["legacy", "persistent", "both"], default="both")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    upstream_port = start_upstream(args.upstream_latency)
+    modes = ["legacy", "persistent"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        print(json.dumps(run_mode(mode, args, upstream_port)))
+
+if __name__ == "__main__":
+    main()
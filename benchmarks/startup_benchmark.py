@@ -0,0 +1,109 @@
+"""Measure worker startup with lazily loaded channel adapters.
+
+Every run is a fresh interpreter, so module imports are paid again: it
+times importing app_factory, create_app, the first send to Slack (which
+imports and builds the adapter in ``lazy`` mode) and a second send.
+``eager`` imports the Slack and Telegram adapters, and with them aiohttp,
+before app_factory, as create_app used to. Sends go to a local stdlib HTTP
+server through the Flask test client; medians over --runs are reported.
+
+Usage:
+    PYTHONPATH=src python benchmarks/startup_benchmark.py --runs 15
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Dict, List
+
+STAGES = ("import_ms", "create_app_ms", "first_send_ms", "second_send_ms")
+
+class UpstreamHandler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+def child(mode: str) -> None:
+    started = time.perf_counter()
+    if mode == "eager":
+        import infrastructure.external_services.slack_service  # noqa: F401
+        import infrastructure.external_services.telegram_service  # noqa: F401
+    from app_factory import create_app
+    from infrastructure.config.settings import Settings
+    imported = time.perf_counter()
+
+    server = HTTPServer(("127.0.0.1", 0), UpstreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    created = time.perf_counter()
+    app = create_app(Settings(
+        API_KEY="benchmark-key",
+        LOG_LEVEL="WARNING",
+        SLACK_WEBHOOK_PREFIXES=base_url
+    ))
+    client = app.test_client()
+    ready = time.perf_counter()
+    aiohttp_at_startup = "aiohttp" in sys.modules
+
+    sends = []
+    for i in range(2):
+        sending = time.perf_counter()
+        response = client.post(
+            "/api/v1/notifications/send",
+            headers={"X-API-Key": "benchmark-key"},
+            json={"title": f"Startup {i}", "message": "m", "level": "INFO", "channels": {"slack": {"webhook_url": f"{base_url}hook"}}}
+        )
+        sends.append(time.perf_counter() - sending)
+        assert response.status_code == 201, response.get_data(as_text=True)
+
+    app.extensions["notification_broker"]["shutdown"]()
+    server.shutdown()
+    print(json.dumps({
+        "import_ms": (imported - started) * 1000,
+        "create_app_ms": (ready - created) * 1000,
+        "first_send_ms": sends[0] * 1000,
+        "second_send_ms": sends[1] * 1000,
+        "aiohttp_at_startup": aiohttp_at_startup
+    }))
+
+def run_mode(mode: str, runs: int) -> Dict[str, Any]:
+    samples: List[Dict[str, Any]] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", mode],
+            capture_output=True, text=True, check=True, env=os.environ.copy()
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    result: Dict[str, Any] = {"mode": mode, "runs": runs}
+    for stage in STAGES:
+        result[stage] = round(statistics.median(sample[stage] for sample in samples), 1)
+    result["startup_ms"] = round(result["import_ms"] + result["create_app_ms"], 1)
+    result["aiohttp_at_startup"] = all(sample["aiohttp_at_startup"] for sample in samples)
+    return result
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--child", choices=["lazy", "eager"])
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+    for mode in ("eager", "lazy"):
+        print(json.dumps(run_mode(mode, args.runs)))
+
+if __name__ == "__main__":
+    main()
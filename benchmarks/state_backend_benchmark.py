@@ -0,0 +1,133 @@
+"""Measure the latency the state backends add to a send.
+
+Each send paces on its destination (one pace() call over its scopes) and
+claims its duplicate-suppression window (one set-if-absent). Every backend
+runs the same mix:
+
+``sequential``: one send at a time, which is the latency a lone request sees.
+``concurrent``: --concurrency sends in flight, as under load. The SQLite and
+Redis backends batch what is submitted in one event loop iteration into a
+single transaction or pipeline; ``unbatched`` runs the same load with
+batching off (one transaction or round trip per operation) to show what
+batching saves.
+
+Redis uses --redis-url, or an in-process fakeredis server if that package is
+installed (functional, but its timings are not a real server's).
+
+Usage:
+    PYTHONPATH=src python benchmarks/state_backend_benchmark.py --sends 5000
+    PYTHONPATH=src python benchmarks/state_backend_benchmark.py --redis-url redis://localhost:6379/15
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+from application.interfaces.state_backend import StateBackendInterface
+from application.services.in_memory_state_backend import InMemoryStateBackend
+from infrastructure.state.redis_state_backend import RedisStateBackend
+from infrastructure.state.sqlite_state_backend import SqliteStateBackend
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def send(state: StateBackendInterface, index: int, destinations: int) -> float:
+    started = time.perf_counter()
+    destination = index % destinations
+    # Generous limits: the benchmark measures the bookkeeping, not the waits
+    await state.pace([(f"bot:{destination % 4}", 1e6, 1e6), (f"chat:{destination}", 1e6, 1e6)], 5.0)
+    await state.set(f"dedup:{uuid.uuid4().hex}", "1", ttl=60, only_if_absent=True)
+    return time.perf_counter() - started
+
+async def measure(
+    name: str,
+    factory: Callable[[], StateBackendInterface],
+    sends: int,
+    concurrency: int,
+    destinations: int
+) -> Dict[str, Any]:
+    state = factory()
+    await state.start()
+    for i in range(100):
+        await send(state, i, destinations)
+
+    if concurrency == 1:
+        started = time.perf_counter()
+        latencies = [await send(state, i, destinations) for i in range(sends)]
+    else:
+        latencies: List[float] = []
+        counter = iter(range(sends))
+
+        async def client() -> None:
+            for i in counter:
+                latencies.append(await send(state, i, destinations))
+
+        started = time.perf_counter()
+        await asyncio.gather(*[client() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    stats = state.get_stats()
+    await state.close()
+
+    return {
+        "case": name,
+        "sends_per_sec": sends / elapsed,
+        "p50_us": percentile(latencies, 50) * 1e6,
+        "p99_us": percentile(latencies, 99) * 1e6,
+        "ops_per_batch": stats["ops"] / stats["batches"] if stats.get("batches") else None
+    }
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    directory = tempfile.mkdtemp(prefix="state-bench-")
+    paths = (os.path.join(directory, f"state-{i}.db") for i in range(1000))
+
+    # Each backend is built from its max_batch; memory has nothing to batch
+    backends: Dict[str, Callable[[int], StateBackendInterface]] = {
+        "memory": lambda max_batch: InMemoryStateBackend(max_keys=1000000),
+        "sqlite": lambda max_batch: SqliteStateBackend(next(paths), max_batch=max_batch)
+    }
+    if args.redis_url:
+        backends["redis"] = lambda max_batch: RedisStateBackend(args.redis_url, max_batch=max_batch)
+    else:
+        try:
+            import fakeredis
+        except ImportError:
+            print("redis: skipped (no --redis-url and fakeredis is not installed)")
+        else:
+            backends["redis (fakeredis)"] = lambda max_batch: RedisStateBackend(
+                "",
+                max_batch=max_batch,
+                client=fakeredis.aioredis.FakeRedis(decode_responses=True)
+            )
+
+    results = []
+    for name, backend in backends.items():
+        batched = lambda: backend(256)
+        results.append(await measure(f"{name} sequential", batched, args.sends, 1, args.destinations))
+        results.append(await measure(f"{name} concurrent", batched, args.sends, args.concurrency, args.destinations))
+        if name != "memory":
+            unbatched = lambda: backend(1)
+            results.append(await measure(f"{name} unbatched", unbatched, args.sends, args.concurrency, args.destinations))
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sends", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--destinations", type=int, default=100)
+    parser.add_argument("--redis-url", default="", help="Redis server to measure (default: fakeredis if installed)")
+    args = parser.parse_args()
+
+    print(f"{'case':<32}{'sends/s':>10}{'p50 us':>10}{'p99 us':>10}{'ops/batch':>11}")
+    for result in asyncio.run(run(args)):
+        per_batch = f"{result['ops_per_batch']:.1f}" if result["ops_per_batch"] is not None else "-"
+        print(
+            f"{result['case']:<32}{result['sends_per_sec']:>10.0f}{result['p50_us']:>10.1f}"
+            f"{result['p99_us']:>10.1f}{per_batch:>11}"
+        )
+
+if __name__ == "__main__":
+    main()
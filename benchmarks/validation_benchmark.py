@@ -0,0 +1,85 @@
+"""Measure the request fast path: JSON decode, schema validation and JSON encode.
+
+``stdlib`` decodes and encodes with the json module, the way Flask's default
+JSON provider does (sorted keys). ``orjson`` uses the orjson functions
+FastJSONProvider calls. Both validate through
+NotificationSerializer.deserialize_send_request, so the difference between
+them is the JSON work alone; ``validate`` is reported separately.
+
+Payloads: ``typical`` is a small alert with a Slack destination, ``metadata``
+carries a large metadata object and ``fanout`` sends to many Telegram chats.
+
+Usage:
+    PYTHONPATH=src python benchmarks/validation_benchmark.py --iterations 20000
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+import orjson
+
+from interface.serializers.notification_serializers import NotificationSerializer
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SORT_KEYS
+
+def make_payloads() -> Dict[str, Dict[str, Any]]:
+    typical = {
+        "title": "High CPU usage on web-1",
+        "message": "CPU usage above 90% for the last 5 minutes",
+        "level": "WARNING",
+        "source": "monitoring",
+        "metadata": {"cpu": "93%", "host": "web-1"},
+        "channels": {"slack": {"webhook_url": "https://hooks.slack.com/services/T000/B000/XXXX"}}
+    }
+    metadata = {
+        **typical,
+        "metadata": {f"key_{i}": {"value": i, "labels": [f"label-{j}" for j in range(5)]} for i in range(200)}
+    }
+    fanout = {
+        **typical,
+        "channels": {"telegram": {"bot_token": "123456:ABC", "chat_ids": [str(-1000000 - i) for i in range(50)]}}
+    }
+    return {"typical": typical, "metadata": metadata, "fanout": fanout}
+
+def response_for(dto: Any) -> Dict[str, Any]:
+    return {"success": True, "data": {"notification_id": "8b553faa-c806-4910-8fa6-9eab62a40e92", "channels": dto.channels}}
+
+def time_per_op(fn: Callable[[], Any], iterations: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+def measure(name: str, payload: Dict[str, Any], iterations: int) -> Dict[str, Any]:
+    body = json.dumps(payload).encode()
+    decoded = json.loads(body)
+
+    def stdlib() -> bytes:
+        dto = NotificationSerializer.deserialize_send_request(json.loads(body))
+        return json.dumps(response_for(dto), sort_keys=True).encode()
+
+    def fast() -> bytes:
+        dto = NotificationSerializer.deserialize_send_request(orjson.loads(body))
+        return orjson.dumps(response_for(dto), option=ORJSON_OPTIONS)
+
+    assert json.loads(stdlib()) == orjson.loads(fast())
+    return {
+        "payload": name,
+        "bytes": len(body),
+        "validate_us": round(time_per_op(lambda: NotificationSerializer.deserialize_send_request(decoded), iterations), 1),
+        "stdlib_us": round(time_per_op(stdlib, iterations), 1),
+        "orjson_us": round(time_per_op(fast, iterations), 1)
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    for name, payload in make_payloads().items():
+        print(json.dumps(measure(name, payload, args.iterations)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+# Gunicorn reads this file from the working directory automatically.
+# Hooks keep Prometheus multiprocess metrics consistent across worker restarts.
+import glob
+import os
+
+def on_starting(server):
+    """Drop metric files left by a previous run"""
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, "*.db")):
+            os.remove(path)
+
+def child_exit(server, worker):
+    """Stop counting a dead worker's live gauges"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -1,50 +1,416 @@
-import logging
-from flask import Flask
-from flask_cors import CORS
-
-from infrastructure.config.settings import Settings
-from infrastructure.repositories.in_memory_notification_repository import InMemoryNotificationRepository
-from infrastructure.external_services.slack_service import SlackNotificationChannel
-from infrastructure.external_services.telegram_service import TelegramNotificationChannel
-from application.use_cases.send_notification import SendNotificationUseCase
-from interface.controllers.notification_controller import NotificationController
-
-def create_app(settings: Settings = None) -> Flask:
-    """Application factory"""
-    if settings is None:
-        settings = Settings.from_env()
-    
-    # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, settings.LOG_LEVEL),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    
-    # Create Flask app
-    app = Flask(__name__)
-    app.config["DEBUG"] = settings.DEBUG
-    
-    # Enable CORS
-    CORS(app)
-    
-    # Initialize dependencies
-    notification_repository = InMemoryNotificationRepository()
-    slack_channel = SlackNotificationChannel()
-    telegram_channel = TelegramNotificationChannel()
-    
-    notification_service = SendNotificationUseCase(
-        notification_repository=notification_repository,
-        slack_channel=slack_channel,
-        telegram_channel=telegram_channel
-    )
-    
-    # Create controllers
-    notification_controller = NotificationController(
-        notification_service=notification_service,
-        settings=settings
-    )
-    
-    # Register blueprints
-    app.register_blueprint(notification_controller.blueprint)
-    
-    return app
\ No newline at end of file
+import atexit
+import json
+import logging
+from typing import TYPE_CHECKING, Optional
+from flask import Flask
+from flask_cors import CORS
+
+from infrastructure.config.settings import Settings
+from infrastructure.config.destination_file import DestinationFile
+from infrastructure.repositories.in_memory_notification_repository import InMemoryNotificationRepository
+from infrastructure.repositories.in_memory_dead_letter_store import InMemoryDeadLetterStore
+from infrastructure.channels.channel_loader import ChannelContext, channel_loaders, discover_channels
+from infrastructure.runtime.event_loop import BackgroundEventLoop
+from infrastructure.runtime.log_pipeline import configure_logging, stop_logging
+from infrastructure.runtime.periodic_task import PeriodicTask
+from infrastructure.runtime.sampling_profiler import SamplingProfiler
+from domain.services.payload_renderer import PayloadRenderer
+from domain.repositories.notification_repository import NotificationRepositoryInterface
+from domain.value_objects.log_level import LogLevel
+from infrastructure.queues.in_memory_delivery_queue import InMemoryDeliveryQueue
+from infrastructure.queues.delivery_worker_pool import DeliveryWorkerPool
+from application.interfaces.delivery_queue import DeliveryQueueInterface
+from application.interfaces.dead_letter_store import DeadLetterStoreInterface
+from application.interfaces.metrics import MetricsInterface, NullMetrics
+from application.interfaces.state_backend import StateBackendInterface
+from application.services.retry_policy import RetryPolicy
+from application.services.channel_registry import ChannelRegistry
+from application.services.circuit_breaker import CircuitBreakerRegistry
+from application.services.rate_limiter import RateLimiterRegistry
+from application.services.deduplicator import Deduplicator
+from application.services.idempotency_cache import IdempotencyCache
+from application.services.load_shedder import LoadShedder
+from application.services.priority_scheduler import PriorityScheduler
+from application.use_cases.send_notification import SendNotificationUseCase
+from application.use_cases.query_notifications import QueryNotificationsUseCase
+from application.use_cases.replay_dead_letters import ReplayDeadLettersUseCase
+from interface.controllers.notification_controller import NotificationController
+from interface.controllers.dead_letter_controller import DeadLetterController
+from interface.controllers.metrics_controller import MetricsController
+from interface.serializers.json_codec import FastJSONProvider
+from interface.middlewares.metrics_middleware import track_request_metrics
+from interface.middlewares.timing_middleware import track_request_timing
+
+if TYPE_CHECKING:
+    from infrastructure.external_services.http_session import PooledHttpSession
+
+logger = logging.getLogger(__name__)
+
+def _create_http_session(name: str, settings: Settings) -> "PooledHttpSession":
+    # Imported with the first channel that needs it: aiohttp is a large share of startup time
+    from infrastructure.external_services.http_session import PooledHttpSession
+    return PooledHttpSession(
+        name,
+        limit=settings.HTTP_POOL_LIMIT,
+        limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+        dns_cache_ttl=settings.HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+        timeout=settings.HTTP_TIMEOUT
+    )
+
+def _create_delivery_queue(settings: Settings) -> DeliveryQueueInterface:
+    backend = settings.DELIVERY_QUEUE_BACKEND
+    scheduler = PriorityScheduler(settings.DELIVERY_FAIRNESS_INTERVAL)
+    if backend == "sqlite":
+        from infrastructure.queues.sqlite_delivery_queue import SqliteDeliveryQueue
+        return SqliteDeliveryQueue(
+            settings.DELIVERY_QUEUE_SQLITE_PATH,
+            max_size=settings.DELIVERY_QUEUE_MAX_SIZE,
+            visibility_timeout=settings.DELIVERY_VISIBILITY_TIMEOUT,
+            scheduler=scheduler
+        )
+    if backend == "redis":
+        from infrastructure.queues.redis_delivery_queue import RedisDeliveryQueue
+        return RedisDeliveryQueue(
+            settings.REDIS_URL,
+            max_size=settings.DELIVERY_QUEUE_MAX_SIZE,
+            visibility_timeout=settings.DELIVERY_VISIBILITY_TIMEOUT,
+            scheduler=scheduler
+        )
+    if backend != "memory":
+        raise ValueError(f"Unknown DELIVERY_QUEUE_BACKEND: {backend}")
+    return InMemoryDeliveryQueue(max_size=settings.DELIVERY_QUEUE_MAX_SIZE, scheduler=scheduler)
+
+def _create_notification_repository(settings: Settings) -> NotificationRepositoryInterface:
+    backend = settings.NOTIFICATION_STORE_BACKEND
+    if backend == "sqlite":
+        from infrastructure.repositories.sqlite_notification_repository import SqliteNotificationRepository
+        return SqliteNotificationRepository(
+            settings.NOTIFICATION_STORE_SQLITE_PATH,
+            max_items=settings.NOTIFICATION_STORE_MAX_ITEMS,
+            max_age=settings.NOTIFICATION_STORE_MAX_AGE,
+            flush_interval=settings.NOTIFICATION_STORE_FLUSH_INTERVAL,
+            batch_size=settings.NOTIFICATION_STORE_BATCH_SIZE
+        )
+    if backend != "memory":
+        raise ValueError(f"Unknown NOTIFICATION_STORE_BACKEND: {backend}")
+    return InMemoryNotificationRepository(
+        max_items=settings.NOTIFICATION_STORE_MAX_ITEMS,
+        max_age=settings.NOTIFICATION_STORE_MAX_AGE
+    )
+
+def _create_dead_letter_store(settings: Settings) -> Optional[DeadLetterStoreInterface]:
+    if settings.DEAD_LETTER_MAX_ITEMS <= 0:
+        return None
+    backend = settings.DEAD_LETTER_BACKEND
+    if backend == "sqlite":
+        from infrastructure.repositories.sqlite_dead_letter_store import SqliteDeadLetterStore
+        return SqliteDeadLetterStore(
+            settings.DEAD_LETTER_SQLITE_PATH,
+            max_items=settings.DEAD_LETTER_MAX_ITEMS,
+            max_age=settings.DEAD_LETTER_MAX_AGE
+        )
+    if backend != "memory":
+        raise ValueError(f"Unknown DEAD_LETTER_BACKEND: {backend}")
+    return InMemoryDeadLetterStore(max_items=settings.DEAD_LETTER_MAX_ITEMS, max_age=settings.DEAD_LETTER_MAX_AGE)
+
+def _create_metrics(settings: Settings) -> MetricsInterface:
+    if not settings.METRICS_ENABLED:
+        return NullMetrics()
+    from infrastructure.metrics.prometheus_metrics import PrometheusMetrics
+    return PrometheusMetrics(
+        shared_queue=settings.DELIVERY_QUEUE_BACKEND != "memory",
+        shared_store=settings.NOTIFICATION_STORE_BACKEND != "memory"
+    )
+
+def _create_state_backend(settings: Settings) -> Optional[StateBackendInterface]:
+    """Shared state for rate limits, duplicate windows and idempotency keys; None keeps them per worker"""
+    backend = settings.STATE_BACKEND
+    if backend == "sqlite":
+        from infrastructure.state.sqlite_state_backend import SqliteStateBackend
+        return SqliteStateBackend(settings.STATE_SQLITE_PATH)
+    if backend == "redis":
+        from infrastructure.state.redis_state_backend import RedisStateBackend
+        return RedisStateBackend(settings.STATE_REDIS_URL or settings.REDIS_URL)
+    if backend != "memory":
+        raise ValueError(f"Unknown STATE_BACKEND: {backend}")
+    return None
+
+def _create_rate_limiter(settings: Settings, state: Optional[StateBackendInterface]) -> RateLimiterRegistry:
+    rates = {
+        "slack.destination": settings.RATE_LIMIT_SLACK_PER_WEBHOOK,
+        "telegram.chat": settings.RATE_LIMIT_TELEGRAM_PER_CHAT,
+        "telegram.bot": settings.RATE_LIMIT_TELEGRAM_PER_BOT
+    }
+    # A rate of 0 disables pacing for that scope
+    limits = {scope: (rate, settings.RATE_LIMIT_BURST) for scope, rate in rates.items() if rate > 0}
+    return RateLimiterRegistry(limits=limits, max_wait=settings.RATE_LIMIT_MAX_WAIT, state=state)
+
+def _create_deduplicator(settings: Settings, state: Optional[StateBackendInterface]) -> Optional[Deduplicator]:
+    if settings.DEDUP_WINDOW_SECONDS <= 0:
+        return None
+    metadata_keys = [key.strip() for key in settings.DEDUP_METADATA_KEYS.split(",") if key.strip()]
+    return Deduplicator(
+        window=settings.DEDUP_WINDOW_SECONDS,
+        metadata_keys=metadata_keys,
+        max_entries=settings.DEDUP_MAX_ENTRIES,
+        state=state
+    )
+
+def _create_idempotency_cache(settings: Settings, state: Optional[StateBackendInterface]) -> Optional[IdempotencyCache]:
+    if settings.IDEMPOTENCY_TTL_SECONDS <= 0:
+        return None
+    return IdempotencyCache(
+        ttl=settings.IDEMPOTENCY_TTL_SECONDS,
+        max_entries=settings.IDEMPOTENCY_MAX_ENTRIES,
+        state=state
+    )
+
+def _create_load_shedder(settings: Settings, metrics: MetricsInterface) -> Optional[LoadShedder]:
+    if not (settings.ADMISSION_MAX_IN_FLIGHT or settings.ADMISSION_MAX_QUEUE_DEPTH or settings.ADMISSION_KEY_RATE):
+        return None
+    return LoadShedder(
+        max_in_flight=settings.ADMISSION_MAX_IN_FLIGHT,
+        max_queue_depth=settings.ADMISSION_MAX_QUEUE_DEPTH,
+        protected_priority=LogLevel(settings.ADMISSION_PROTECTED_LEVEL).priority,
+        key_rate=settings.ADMISSION_KEY_RATE,
+        key_burst=settings.ADMISSION_KEY_BURST,
+        sample_rate=settings.ADMISSION_SAMPLE_RATE,
+        retry_after=settings.ADMISSION_RETRY_AFTER,
+        metrics=metrics
+    )
+
+def _create_profiler(settings: Settings, event_loop: BackgroundEventLoop) -> Optional[SamplingProfiler]:
+    if settings.PROFILE_EVERY_N_REQUESTS <= 0:
+        return None
+    return SamplingProfiler(
+        every=settings.PROFILE_EVERY_N_REQUESTS,
+        interval=settings.PROFILE_INTERVAL_MS / 1000,
+        output_dir=settings.PROFILE_DIR,
+        # Looked up per request: under ASGI the loop is only attached at startup
+        loop_thread_id=lambda: event_loop.thread_id
+    )
+
+def _create_channel_registry(settings: Settings, renderer: PayloadRenderer) -> ChannelRegistry:
+    """Built-in and installed channels, each imported when first used"""
+    context = ChannelContext(
+        settings=settings,
+        renderer=renderer,
+        http_session=lambda name: _create_http_session(name, settings)
+    )
+    return ChannelRegistry(channel_loaders(discover_channels(), context))
+
+def _create_renderer(settings: Settings) -> PayloadRenderer:
+    """Compile message templates once at startup; invalid templates fail fast"""
+    templates = None
+    if settings.TEMPLATES_PATH:
+        with open(settings.TEMPLATES_PATH, encoding="utf-8") as f:
+            templates = json.load(f)
+    return PayloadRenderer(templates)
+
+def create_app(settings: Settings = None, event_loop: BackgroundEventLoop = None) -> Flask:
+    """Application factory"""
+    if settings is None:
+        settings = Settings.from_env()
+    
+    # Configure logging; records are written by a background thread, with secrets masked
+    log_pipeline = configure_logging(
+        level=settings.LOG_LEVEL,
+        log_format=settings.LOG_FORMAT,
+        queue_size=settings.LOG_QUEUE_SIZE,
+        webhook_prefixes=[prefix.strip() for prefix in settings.SLACK_WEBHOOK_PREFIXES.split(",") if prefix.strip()]
+    )
+    
+    # Create Flask app
+    app = Flask(__name__)
+    app.config["DEBUG"] = settings.DEBUG
+    app.json = FastJSONProvider(app)
+    
+    # Enable CORS
+    CORS(app)
+    
+    # Persistent event loop shared by every request in this worker
+    if event_loop is None:
+        event_loop = BackgroundEventLoop()
+        event_loop.start()
+    
+    # Initialize dependencies
+    metrics = _create_metrics(settings)
+    notification_repository = _create_notification_repository(settings)
+    delivery_queue = _create_delivery_queue(settings)
+    dead_letters = _create_dead_letter_store(settings)
+    state = _create_state_backend(settings)
+    renderer = _create_renderer(settings)
+    channels = _create_channel_registry(settings, renderer)
+    preload_channels = [name.strip() for name in settings.CHANNELS_PRELOAD.split(",") if name.strip()]
+    unknown_channels = [name for name in preload_channels if name not in channels]
+    if unknown_channels:
+        raise ValueError(f"Unknown CHANNELS_PRELOAD channels: {', '.join(unknown_channels)}")
+    
+    notification_service = SendNotificationUseCase(
+        notification_repository=notification_repository,
+        channels=channels,
+        batch_concurrency=settings.BATCH_CONCURRENCY,
+        fanout_concurrency=settings.FANOUT_CONCURRENCY,
+        delivery_queue=delivery_queue,
+        retry_policy=RetryPolicy(
+            max_attempts=settings.RETRY_MAX_ATTEMPTS,
+            base_delay=settings.RETRY_BASE_DELAY,
+            max_delay=settings.RETRY_MAX_DELAY
+        ),
+        circuit_breakers=CircuitBreakerRegistry(
+            failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.CIRCUIT_RESET_TIMEOUT,
+            metrics=metrics
+        ),
+        rate_limiter=_create_rate_limiter(settings, state),
+        deduplicator=_create_deduplicator(settings, state),
+        dead_letters=dead_letters,
+        metrics=metrics
+    )
+    worker_pool = DeliveryWorkerPool(
+        delivery_queue,
+        notification_service,
+        workers=settings.DELIVERY_WORKERS,
+        max_attempts=settings.DELIVERY_MAX_ATTEMPTS,
+        reserved_workers=settings.DELIVERY_RESERVED_WORKERS,
+        reserved_min_priority=LogLevel(settings.DELIVERY_RESERVED_MIN_LEVEL).priority
+    )
+    summary_flusher = PeriodicTask("repeat-summaries", 1.0, notification_service.flush_suppressed)
+    # Jobs left claimed by a worker that died are requeued while the app runs, not only at startup
+    delivery_recovery = PeriodicTask("delivery-recovery", settings.DELIVERY_RECOVERY_INTERVAL, delivery_queue.recover_stale)
+    
+    async def sample_metrics() -> None:
+        metrics.set_queue_depth(await delivery_queue.depth())
+        metrics.set_queue_depth_by_level(await delivery_queue.depth_by_level())
+        metrics.set_repository_size(await notification_repository.count())
+    
+    metrics_sampler = PeriodicTask("metrics-sampler", settings.METRICS_SAMPLE_INTERVAL, sample_metrics)
+    
+    # Admission control reads the queue depth from a sample instead of querying it per request
+    load_shedder = _create_load_shedder(settings, metrics)
+    
+    async def sample_queue_depth() -> None:
+        load_shedder.set_queue_depth(await delivery_queue.depth())
+    
+    admission_sampler = PeriodicTask("admission-sampler", settings.ADMISSION_SAMPLE_INTERVAL, sample_queue_depth)
+    
+    # Named destinations are validated at startup (failing fast) and reloaded when the file changes
+    destination_file = DestinationFile(settings.DESTINATIONS_PATH) if settings.DESTINATIONS_PATH else None
+    if destination_file is not None:
+        count = notification_service.load_destinations(destination_file.read())
+        logger.info("Loaded %s destinations from %s", count, destination_file.path)
+    
+    async def reload_destinations() -> None:
+        definitions = destination_file.read_if_changed()
+        if definitions is not None:
+            # A channel first used by the new file is imported off the loop; unknown ones fail validation below
+            await channels.load({
+                definition["channel"] for definition in definitions.values()
+                if isinstance(definition, dict) and isinstance(definition.get("channel"), str) and definition["channel"] in channels
+            })
+            count = notification_service.load_destinations(definitions)
+            logger.info("Reloaded %s destinations from %s", count, destination_file.path)
+    
+    destinations_reloader = PeriodicTask("destinations-reload", settings.DESTINATIONS_RELOAD_INTERVAL, reload_destinations)
+    
+    # Create controllers
+    notification_controller = NotificationController(
+        notification_service=notification_service,
+        settings=settings,
+        event_loop=event_loop,
+        query_service=QueryNotificationsUseCase(notification_repository),
+        idempotency_cache=_create_idempotency_cache(settings, state),
+        load_shedder=load_shedder,
+        log_pipeline=log_pipeline
+    )
+    
+    # Register blueprints
+    app.register_blueprint(notification_controller.blueprint)
+    if dead_letters is not None:
+        dead_letter_service = ReplayDeadLettersUseCase(
+            dead_letters,
+            notification_service,
+            rate=settings.DEAD_LETTER_REPLAY_RATE,
+            concurrency=settings.DEAD_LETTER_REPLAY_CONCURRENCY,
+            metrics=metrics
+        )
+        app.register_blueprint(DeadLetterController(dead_letter_service, settings, event_loop).blueprint)
+    if settings.METRICS_ENABLED:
+        app.register_blueprint(MetricsController(metrics).blueprint)
+        track_request_metrics(app, metrics)
+    profiler = _create_profiler(settings, event_loop)
+    if settings.SERVER_TIMING_ENABLED or settings.SLOW_REQUEST_MS or profiler is not None:
+        track_request_timing(
+            app,
+            server_timing=settings.SERVER_TIMING_ENABLED,
+            slow_request_ms=settings.SLOW_REQUEST_MS,
+            profiler=profiler
+        )
+    
+    closed = {"done": False}
+    
+    async def astart() -> None:
+        """Start the store, background delivery workers and repeat summaries on the event loop"""
+        await channels.load(preload_channels)
+        await notification_repository.start()
+        if dead_letters is not None:
+            await dead_letters.start()
+        if state is not None:
+            await state.start()
+        await worker_pool.start()
+        if settings.DELIVERY_QUEUE_BACKEND != "memory":
+            await delivery_recovery.start()
+        await summary_flusher.start()
+        if settings.METRICS_ENABLED:
+            await metrics_sampler.start()
+        if load_shedder is not None and load_shedder.max_queue_depth:
+            await admission_sampler.start()
+        if destination_file is not None:
+            await destinations_reloader.start()
+    
+    async def aclose() -> None:
+        """Stop workers and close pooled connections from within the event loop"""
+        if closed["done"]:
+            return
+        closed["done"] = True
+        await destinations_reloader.stop()
+        await admission_sampler.stop()
+        await metrics_sampler.stop()
+        await summary_flusher.stop()
+        await delivery_recovery.stop()
+        await worker_pool.stop()
+        await delivery_queue.close()
+        await notification_service.close()
+        if state is not None:
+            await state.close()
+        if dead_letters is not None:
+            await dead_letters.close()
+        # Last, so notifications saved while stopping are still written
+        await notification_repository.close()
+    
+    def shutdown() -> None:
+        """Close pooled connections and stop the event loop"""
+        if not closed["done"] and event_loop.is_running:
+            try:
+                event_loop.run(aclose(), timeout=5)
+            except Exception as e:
+                logger.error("Error during shutdown: %s", e)
+        event_loop.stop()
+        if log_pipeline is not None:
+            stop_logging(log_pipeline)
+    
+    # Under ASGI the loop is attached (and astart awaited) at lifespan startup
+    if event_loop.is_running:
+        event_loop.run(astart())
+    
+    atexit.register(shutdown)
+    app.extensions["notification_broker"] = {
+        "event_loop": event_loop,
+        "notification_service": notification_service,
+        "astart": astart,
+        "aclose": aclose,
+        "shutdown": shutdown
+    }
+    
+    return app
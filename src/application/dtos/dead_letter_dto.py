@@ -0,0 +1,40 @@
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, Optional
+
+@dataclass
+class DeadLetterDTO:
+    letter_id: str
+    notification: Dict[str, Any]  # Notification.to_dict()
+    channel: str  # slack or telegram
+    destination: str  # secret-free destination label, as used by breakers and limits
+    config: Optional[Dict[str, Any]]  # channel config to redeliver with; None for named destinations
+    error: str
+    attempts: int
+    destination_name: Optional[str] = None  # set for named destinations, resolved again on replay
+    replays: int = 0
+    failed_at: float = field(default_factory=time.time)
+    seq: int = 0  # position in the store, assigned when added
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DeadLetterDTO":
+        return cls(**data)
+    
+    def to_public_dict(self) -> Dict[str, Any]:
+        """Public view of the dead letter, without channel secrets"""
+        return {
+            "id": self.letter_id,
+            "notification_id": self.notification.get("id"),
+            "title": self.notification.get("title"),
+            "level": self.notification.get("level"),
+            "channel": self.channel,
+            "destination": self.destination,
+            "destination_name": self.destination_name,
+            "error": self.error,
+            "attempts": self.attempts,
+            "replays": self.replays,
+            "failed_at": self.failed_at
+        }
@@ -0,0 +1,39 @@
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, List, Optional, Union
+
+from domain.value_objects.delivery_status import DeliveryStatus
+from domain.value_objects.log_level import LogLevel
+
+@dataclass
+class DeliveryJobDTO:
+    job_id: str
+    notification: Dict[str, Any]  # Notification.to_dict()
+    channels: Dict[str, Union[Dict[str, Any], List[Dict[str, Any]]]]  # channel_name -> config or list of configs
+    status: str = DeliveryStatus.QUEUED.value
+    priority: int = LogLevel.INFO.priority  # LogLevel.priority of the notification
+    attempts: int = 0
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DeliveryJobDTO":
+        return cls(**data)
+    
+    def to_status_dict(self) -> Dict[str, Any]:
+        """Public view of the job, without channel secrets"""
+        return {
+            "notification_id": self.job_id,
+            "status": self.status,
+            "attempts": self.attempts,
+            "channels": list(self.channels.keys()),
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
+        }
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, Union
+
+class DeadLetterServiceInterface(ABC):
+    
+    @abstractmethod
+    async def list_dead_letters(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        channel: Optional[str] = None,
+        destination: Optional[str] = None,
+        since: Optional[Union[str, float]] = None,
+        until: Optional[Union[str, float]] = None
+    ) -> Dict[str, Any]:
+        """List dead letters newest first, one page at a time"""
+        pass
+    
+    @abstractmethod
+    async def start_replay(
+        self,
+        channel: Optional[str] = None,
+        destination: Optional[str] = None,
+        since: Optional[Union[str, float]] = None,
+        until: Optional[Union[str, float]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Start redelivering matching dead letters in the background"""
+        pass
+    
+    @abstractmethod
+    def get_replay(self, replay_id: str) -> Optional[Dict[str, Any]]:
+        """Progress of a replay started by this worker"""
+        pass
+    
+    @abstractmethod
+    def cancel_replay(self, replay_id: str) -> Optional[Dict[str, Any]]:
+        """Stop a running replay; letters not yet sent stay stored"""
+        pass
+    
+    @abstractmethod
+    async def get_stats(self) -> Dict[str, Any]:
+        """Dead letter and replay counters"""
+        pass
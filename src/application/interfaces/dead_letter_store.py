@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional
+
+from ..dtos.dead_letter_dto import DeadLetterDTO
+
+@dataclass
+class DeadLetterFilter:
+    channel: Optional[str] = None
+    destination: Optional[str] = None  # label or destination name
+    since: Optional[float] = None  # failed_at >= since
+    until: Optional[float] = None  # failed_at < until
+    
+    def matches(self, letter: DeadLetterDTO) -> bool:
+        if self.channel is not None and letter.channel != self.channel:
+            return False
+        if self.destination is not None and self.destination not in (letter.destination, letter.destination_name):
+            return False
+        if self.since is not None and letter.failed_at < self.since:
+            return False
+        if self.until is not None and letter.failed_at >= self.until:
+            return False
+        return True
+
+@dataclass
+class DeadLetterPage:
+    items: List[DeadLetterDTO]
+    next_cursor: Optional[str] = None
+
+class DeadLetterStoreInterface(ABC):
+    """Deliveries that failed for good, kept until they are replayed or expire"""
+    
+    async def start(self) -> None:
+        """Prepare storage (optional)"""
+        pass
+    
+    async def close(self) -> None:
+        """Release resources (optional)"""
+        pass
+    
+    @abstractmethod
+    async def add(self, letters: List[DeadLetterDTO]) -> None:
+        """Store dead letters, assigning their seq"""
+        pass
+    
+    @abstractmethod
+    async def find_page(
+        self,
+        letter_filter: DeadLetterFilter,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        oldest_first: bool = False
+    ) -> DeadLetterPage:
+        """Find matching dead letters, newest first unless oldest_first, after an opaque cursor"""
+        pass
+    
+    @abstractmethod
+    async def update(self, letter: DeadLetterDTO) -> None:
+        """Record the outcome of a failed replay (error, attempts, replays)"""
+        pass
+    
+    @abstractmethod
+    async def remove(self, letter_ids: List[str]) -> None:
+        """Drop dead letters, once replayed successfully"""
+        pass
+    
+    @abstractmethod
+    async def count(self) -> int:
+        """Number of stored dead letters"""
+        pass
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
+
+from ..dtos.delivery_job_dto import DeliveryJobDTO
+
+class DeliveryQueueInterface(ABC):
+    
+    @abstractmethod
+    async def enqueue(self, job: DeliveryJobDTO) -> None:
+        """Add a job to the queue"""
+        pass
+    
+    @abstractmethod
+    async def dequeue(self, min_priority: int = 0) -> DeliveryJobDTO:
+        """Wait for the next job of at least min_priority and mark it as processing"""
+        pass
+    
+    @abstractmethod
+    async def requeue(self, job: DeliveryJobDTO, delay: float) -> None:
+        """Put a processing job back in the queue, available after delay seconds"""
+        pass
+    
+    @abstractmethod
+    async def complete(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """Record the final outcome of a job"""
+        pass
+    
+    @abstractmethod
+    async def get_job(self, job_id: str) -> Optional[DeliveryJobDTO]:
+        """Find a job by ID"""
+        pass
+    
+    @abstractmethod
+    async def depth(self) -> int:
+        """Number of jobs waiting to be processed"""
+        pass
+    
+    @abstractmethod
+    async def depth_by_level(self) -> Dict[str, int]:
+        """Number of jobs waiting to be processed, per log level"""
+        pass
+    
+    async def start(self) -> None:
+        """Open connections and recover unfinished jobs"""
+        pass
+    
+    async def recover_stale(self) -> int:
+        """Requeue jobs claimed longer ago than the visibility timeout; returns how many"""
+        return 0
+    
+    async def close(self) -> None:
+        """Release queue resources"""
+        pass
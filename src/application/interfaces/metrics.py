@@ -0,0 +1,128 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Tuple
+
+class MetricsInterface(ABC):
+    """Operational metrics; every method is called on the request path and must be cheap"""
+    
+    @abstractmethod
+    def observe_request(self, endpoint: str, method: str, status: int, seconds: float) -> None:
+        """Record an HTTP request handled by the API"""
+        pass
+    
+    @abstractmethod
+    def observe_delivery(self, channel: str, outcome: str, seconds: float) -> None:
+        """Record one channel delivery, from first attempt to final outcome"""
+        pass
+    
+    @abstractmethod
+    def observe_upstream(self, channel: str, seconds: float) -> None:
+        """Record a single call to a channel's upstream API"""
+        pass
+    
+    @abstractmethod
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """Record time spent in a processing stage (save, rate_limit_wait, queue_wait)"""
+        pass
+    
+    @abstractmethod
+    def observe_queue_wait(self, level: str, seconds: float) -> None:
+        """Record how long a job of a log level waited in the delivery queue"""
+        pass
+    
+    @abstractmethod
+    def record_retry(self, channel: str) -> None:
+        """Count a retried channel attempt"""
+        pass
+    
+    @abstractmethod
+    def record_shed(self, reason: str, level: str) -> None:
+        """Count a notification rejected by admission control"""
+        pass
+    
+    @abstractmethod
+    def record_dead_letter(self, channel: str) -> None:
+        """Count a delivery that failed for good and was dead-lettered"""
+        pass
+    
+    @abstractmethod
+    def record_replay(self, channel: str, outcome: str) -> None:
+        """Count a dead letter replayed, by outcome (delivered, failed)"""
+        pass
+    
+    @abstractmethod
+    def record_circuit_transition(self, channel: str, from_state: str, to_state: str) -> None:
+        """Count a circuit breaker changing state"""
+        pass
+    
+    @abstractmethod
+    def set_circuit_breakers(self, states: Dict[str, int]) -> None:
+        """Report the number of circuit breakers in each state"""
+        pass
+    
+    @abstractmethod
+    def set_queue_depth(self, depth: int) -> None:
+        """Report the number of jobs waiting in the delivery queue"""
+        pass
+    
+    @abstractmethod
+    def set_queue_depth_by_level(self, depths: Dict[str, int]) -> None:
+        """Report the number of jobs waiting in the delivery queue per log level"""
+        pass
+    
+    @abstractmethod
+    def set_repository_size(self, size: int) -> None:
+        """Report the number of stored notifications"""
+        pass
+    
+    @abstractmethod
+    def export(self) -> Tuple[bytes, str]:
+        """Current metrics in exposition format, with their content type"""
+        pass
+
+class NullMetrics(MetricsInterface):
+    """Discards everything; used when metrics are disabled"""
+    
+    def observe_request(self, endpoint: str, method: str, status: int, seconds: float) -> None:
+        pass
+    
+    def observe_delivery(self, channel: str, outcome: str, seconds: float) -> None:
+        pass
+    
+    def observe_upstream(self, channel: str, seconds: float) -> None:
+        pass
+    
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        pass
+    
+    def observe_queue_wait(self, level: str, seconds: float) -> None:
+        pass
+    
+    def record_retry(self, channel: str) -> None:
+        pass
+    
+    def record_shed(self, reason: str, level: str) -> None:
+        pass
+    
+    def record_dead_letter(self, channel: str) -> None:
+        pass
+    
+    def record_replay(self, channel: str, outcome: str) -> None:
+        pass
+    
+    def record_circuit_transition(self, channel: str, from_state: str, to_state: str) -> None:
+        pass
+    
+    def set_circuit_breakers(self, states: Dict[str, int]) -> None:
+        pass
+    
+    def set_queue_depth(self, depth: int) -> None:
+        pass
+    
+    def set_queue_depth_by_level(self, depths: Dict[str, int]) -> None:
+        pass
+    
+    def set_repository_size(self, size: int) -> None:
+        pass
+    
+    def export(self) -> Tuple[bytes, str]:
+        return b"", "text/plain; charset=utf-8"
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
+
+class NotificationQueryServiceInterface(ABC):
+    
+    @abstractmethod
+    async def get_notification(self, notification_id: str) -> Optional[Dict[str, Any]]:
+        """Find a stored notification by ID"""
+        pass
+    
+    @abstractmethod
+    async def list_notifications(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        level: Optional[str] = None,
+        source: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """List stored notifications newest first, one page at a time"""
+        pass
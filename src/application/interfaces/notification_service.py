@@ -1,11 +1,57 @@
-from abc import ABC, abstractmethod
-from typing import Dict, Any
-
-from ..dtos.notification_dto import SendNotificationDTO
-
-class NotificationServiceInterface(ABC):
-    
-    @abstractmethod
-    async def send_notification(self, dto: SendNotificationDTO) -> Dict[str, Any]:
-        """Send notification to specified channels"""
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Optional
+
+from ..dtos.notification_dto import SendNotificationDTO
+from ..dtos.delivery_job_dto import DeliveryJobDTO
+from ..dtos.dead_letter_dto import DeadLetterDTO
+
+class NotificationServiceInterface(ABC):
+    
+    @abstractmethod
+    async def send_notification(self, dto: SendNotificationDTO) -> Dict[str, Any]:
+        """Send notification to specified channels"""
+        pass
+    
+    @abstractmethod
+    async def send_batch(
+        self,
+        dtos: List[SendNotificationDTO],
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Send many notifications, returning per-item results in input order"""
+        pass
+    
+    @abstractmethod
+    async def enqueue_notification(self, dto: SendNotificationDTO) -> Dict[str, Any]:
+        """Save notification and queue it for background delivery"""
+        pass
+    
+    @abstractmethod
+    async def deliver_job(self, job: DeliveryJobDTO, last_attempt: bool = True) -> Dict[str, Any]:
+        """Deliver a queued notification"""
+        pass
+    
+    @abstractmethod
+    async def redeliver(self, letter: DeadLetterDTO) -> Dict[str, Any]:
+        """Send a dead letter to its destination again, returning the channel result"""
+        pass
+    
+    @abstractmethod
+    async def get_delivery_status(self, notification_id: str) -> Optional[Dict[str, Any]]:
+        """Look up the delivery state of a queued notification"""
+        pass
+    
+    @abstractmethod
+    async def flush_suppressed(self) -> int:
+        """Send summaries for duplicates suppressed in closed windows"""
+        pass
+    
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Return per-channel delivery statistics"""
+        pass
+    
+    @abstractmethod
+    async def close(self) -> None:
+        """Release resources held by the service"""
         pass
\ No newline at end of file
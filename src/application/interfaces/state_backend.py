@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+# One pacing limit: (key, rate per second, burst)
+PaceLimit = Tuple[str, float, float]
+
+class StateBackendInterface(ABC):
+    """Small key-value state behind rate limits, duplicate suppression and idempotency keys.
+    
+    Values are strings and keys may expire after ttl seconds. Every operation
+    is atomic on its own, so a backend shared between workers gives them one
+    view of the limits, windows and keys.
+    """
+    
+    async def start(self) -> None:
+        """Connect or prepare storage (optional)"""
+        pass
+    
+    async def close(self) -> None:
+        """Release resources (optional)"""
+        pass
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Value of a key, or None if missing or expired"""
+        pass
+    
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: str,
+        ttl: Optional[float] = None,
+        only_if_absent: bool = False
+    ) -> Optional[str]:
+        """Store a value.
+        
+        With only_if_absent a live value is kept and returned instead; None
+        means the value was stored.
+        """
+        pass
+    
+    @abstractmethod
+    async def pop(self, key: str) -> Optional[str]:
+        """Delete a key, returning its value"""
+        pass
+    
+    @abstractmethod
+    async def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        """Add to a counter and return the new value; ttl applies when the counter is created"""
+        pass
+    
+    @abstractmethod
+    async def pace(self, limits: Sequence[PaceLimit], max_wait: float) -> float:
+        """Reserve the next slot on every limit at once and return the seconds to wait for it.
+        
+        Limits are GCRA: each key holds the theoretical arrival time of its
+        next slot, a sliding-window rate limit equivalent to a token bucket
+        without per-event storage. Nothing is reserved when the wait is over
+        max_wait; the wait is returned all the same.
+        """
+        pass
+    
+    @abstractmethod
+    async def block(self, limit: PaceLimit, seconds: float) -> None:
+        """Hold the next slot of a limit for at least seconds from now"""
+        pass
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {}
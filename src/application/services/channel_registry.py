@@ -0,0 +1,65 @@
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Mapping
+
+from domain.exceptions.domain_exceptions import UnsupportedChannelException
+from domain.services.notification_channel import NotificationChannelInterface
+
+ChannelLoader = Callable[[], NotificationChannelInterface]
+
+class ChannelRegistry:
+    """Delivery channels by name, each imported and built on first use.
+    
+    Channels are registered as loaders, so an adapter (and its client
+    libraries) is only loaded once a notification is sent through it or a
+    named destination uses it; workers start just as fast with channels
+    nobody uses. Once loaded, dispatch is a dict lookup.
+    
+    get() loads a channel on the calling thread; load() builds channels on
+    the default executor instead, which is how sends load them, so the
+    event loop keeps running while a channel is imported.
+    """
+    
+    def __init__(self, loaders: Mapping[str, ChannelLoader]):
+        self._loaders = dict(loaders)
+        self._channels: Dict[str, NotificationChannelInterface] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def of(cls, *channels: NotificationChannelInterface) -> "ChannelRegistry":
+        """Registry of channels already built, under the names they declare"""
+        return cls({channel.name: (lambda channel=channel: channel) for channel in channels})
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._loaders
+    
+    @property
+    def names(self) -> List[str]:
+        return list(self._loaders)
+    
+    def get(self, name: str) -> NotificationChannelInterface:
+        channel = self._channels.get(name)
+        if channel is not None:
+            return channel
+        with self._lock:
+            channel = self._channels.get(name)
+            if channel is None:
+                loader = self._loaders.get(name)
+                if loader is None:
+                    raise UnsupportedChannelException(f"Unsupported channel: {name}")
+                channel = self._channels[name] = loader()
+        return channel
+    
+    async def load(self, names: Iterable[str]) -> None:
+        """Build channels on the default executor, so their imports do not stall the event loop"""
+        loop = asyncio.get_running_loop()
+        for name in names:
+            if name not in self._channels:
+                await loop.run_in_executor(None, self.get, name)
+    
+    def loaded(self) -> Dict[str, NotificationChannelInterface]:
+        """Channels built so far"""
+        return dict(self._channels)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {name: channel.get_stats() for name, channel in self.loaded().items()}
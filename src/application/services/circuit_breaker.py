@@ -0,0 +1,142 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Dict, Any, Optional
+
+from application.interfaces.metrics import MetricsInterface, NullMetrics
+from domain.exceptions.domain_exceptions import CircuitOpenException
+
+logger = logging.getLogger(__name__)
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """Per-destination breaker: opens after consecutive failures, probes after a cool-down"""
+    
+    def __init__(
+        self,
+        name: str,
+        registry: "CircuitBreakerRegistry",
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0
+    ):
+        self.name = name
+        self._registry = registry
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+    
+    def before_call(self) -> None:
+        """Raise CircuitOpenException if the call must not go through"""
+        if self.state == CircuitState.CLOSED:
+            return
+        
+        if self.state == CircuitState.OPEN:
+            remaining = self._opened_at + self._reset_timeout - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenException(
+                    f"Circuit open for {self.name}, retry in {remaining:.1f}s",
+                    retry_after=remaining
+                )
+            self._transition(CircuitState.HALF_OPEN)
+        
+        # Half-open: let a single probe through
+        if self._probing:
+            raise CircuitOpenException(f"Circuit half-open for {self.name}, probe in flight", retry_after=1.0)
+        self._probing = True
+    
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probing = False
+        if self.state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+    
+    def release(self) -> None:
+        """Give back a probe slot without recording an outcome"""
+        self._probing = False
+    
+    def record_failure(self) -> None:
+        self._probing = False
+        self._failures += 1
+        if self.state == CircuitState.HALF_OPEN or (
+            self.state == CircuitState.CLOSED and self._failures >= self._failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._transition(CircuitState.OPEN)
+    
+    def _transition(self, new_state: CircuitState) -> None:
+        old_state = self.state
+        self.state = new_state
+        self._registry.record_transition(self, old_state, new_state)
+
+class CircuitBreakerRegistry:
+    """Circuit breakers keyed by destination, bounded by LRU eviction.
+    
+    Transitions are counted in metrics by channel, and the number of
+    breakers in each state is kept up to date as a gauge; destinations only
+    appear (hashed) in logs and stats.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_breakers: int = 10000,
+        metrics: Optional[MetricsInterface] = None
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._max_breakers = max_breakers
+        self._metrics = metrics or NullMetrics()
+        self._breakers: "OrderedDict[str, CircuitBreaker]" = OrderedDict()
+        self._transitions: Dict[str, int] = {}
+        self._states = {state.value: 0 for state in CircuitState}
+    
+    @staticmethod
+    def destination_label(channel_name: str, destination_key: str) -> str:
+        """Stable, secret-free label for a destination (URLs and tokens are hashed)"""
+        digest = hashlib.sha256(destination_key.encode()).hexdigest()[:12]
+        return f"{channel_name}:{digest}"
+    
+    def get(self, channel_name: str, destination_key: str) -> CircuitBreaker:
+        name = self.destination_label(channel_name, destination_key)
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, self, self._failure_threshold, self._reset_timeout)
+            self._breakers[name] = breaker
+            self._states[breaker.state.value] += 1
+            while len(self._breakers) > self._max_breakers:
+                _, evicted = self._breakers.popitem(last=False)
+                self._states[evicted.state.value] -= 1
+            self._metrics.set_circuit_breakers(self._states)
+        else:
+            self._breakers.move_to_end(name)
+        return breaker
+    
+    def record_transition(self, breaker: CircuitBreaker, old_state: CircuitState, new_state: CircuitState) -> None:
+        transition = f"{old_state.value}->{new_state.value}"
+        self._transitions[transition] = self._transitions.get(transition, 0) + 1
+        # A breaker evicted while its call was in flight is no longer counted
+        if self._breakers.get(breaker.name) is breaker:
+            self._states[old_state.value] -= 1
+            self._states[new_state.value] += 1
+            self._metrics.set_circuit_breakers(self._states)
+        # Names are "<channel>:<hash>"
+        self._metrics.record_circuit_transition(breaker.name.partition(":")[0], old_state.value, new_state.value)
+        log = logger.warning if new_state == CircuitState.OPEN else logger.info
+        log("Circuit breaker %s: %s", breaker.name, transition)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "states": dict(self._states),
+            "transitions": dict(self._transitions),
+            "open": [name for name, breaker in self._breakers.items() if breaker.state != CircuitState.CLOSED]
+        }
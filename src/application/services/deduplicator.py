@@ -0,0 +1,168 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence
+
+from application.interfaces.state_backend import StateBackendInterface
+from application.services.in_memory_state_backend import InMemoryStateBackend
+from domain.entities.notification import Notification
+from domain.value_objects.log_level import LogLevel
+
+class SuppressionWindow:
+    """A notification this worker sent and the duplicates seen since"""
+    
+    def __init__(self, fingerprint: str, notification: Notification, channels: Dict[str, Any], closes_at: float):
+        self.fingerprint = fingerprint
+        self.notification = notification
+        self.channels = channels
+        self.closes_at = closes_at
+        self.opened_at = time.time()
+        self.count = 0
+        self.last_seen: Optional[float] = None
+
+@dataclass
+class Duplicate:
+    """A copy of a recently sent notification that was counted instead of sent"""
+    notification_id: str
+    timestamp: str
+    repeat_count: int
+
+class Deduplicator:
+    """Suppresses repeats of the same notification within a time window.
+    
+    The first copy is sent and opens a window; later copies with the same
+    fingerprint are only counted. When a window closes with duplicates in it,
+    it is handed back for a "repeated N times" summary and re-armed, so a
+    long storm produces one summary per window instead of one message per copy.
+    
+    Windows and their counts live in a state backend. With a shared backend a
+    copy is suppressed whichever worker receives it, and the worker that sent
+    the first copy owns the window and sends its summary.
+    """
+    
+    def __init__(
+        self,
+        window: float = 60.0,
+        metadata_keys: Sequence[str] = (),
+        max_entries: int = 10000,
+        state: Optional[StateBackendInterface] = None
+    ):
+        self.window = window
+        self._metadata_keys = tuple(metadata_keys)
+        self._max_entries = max_entries
+        # A window key and a duplicate counter per fingerprint
+        self._state = state or InMemoryStateBackend(max_keys=max_entries * 2)
+        self._windows: "OrderedDict[str, SuppressionWindow]" = OrderedDict()
+        self._evicted: List[SuppressionWindow] = []
+        self._stats = {"suppressed": 0, "summaries": 0}
+    
+    def fingerprint(
+        self,
+        title: str,
+        level: LogLevel,
+        source: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        channels: Dict[str, Any]
+    ) -> str:
+        """Hash of what makes two notifications "the same alert" for the same destinations"""
+        metadata = metadata or {}
+        key = [
+            title,
+            level.value,
+            source,
+            [metadata.get(name) for name in self._metadata_keys],
+            channels
+        ]
+        return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+    
+    @staticmethod
+    def _key(fingerprint: str) -> str:
+        return f"dedup:{fingerprint}"
+    
+    def _count_key(self, fingerprint: str, notification_id: str) -> str:
+        # Per window, so a late count never lands in the next window's summary
+        return f"{self._key(fingerprint)}:{notification_id}"
+    
+    async def claim(
+        self,
+        fingerprint: str,
+        notification: Notification,
+        channels: Dict[str, Any]
+    ) -> Optional[Duplicate]:
+        """Open a window for a notification about to be sent, or count it as a duplicate.
+        
+        Returns None if the notification should be sent, or the duplicate of
+        the notification whose window is open.
+        """
+        holder = await self._state.set(
+            self._key(fingerprint),
+            f"{notification.id}|{notification.timestamp.isoformat()}",
+            ttl=self.window,
+            only_if_absent=True
+        )
+        if holder is None:
+            self._open(fingerprint, notification, channels)
+            return None
+        
+        notification_id, timestamp = holder.split("|", 1)
+        # Kept past the window, until its owner collects it
+        count = await self._state.incr(self._count_key(fingerprint, notification_id), ttl=self.window * 2)
+        window = self._windows.get(fingerprint)
+        if window is not None and str(window.notification.id) == notification_id:
+            window.last_seen = time.time()
+        self._stats["suppressed"] += 1
+        return Duplicate(notification_id, timestamp, count)
+    
+    def _open(self, fingerprint: str, notification: Notification, channels: Dict[str, Any]) -> None:
+        # Closes no earlier than the window key expires, so a re-arm can claim it again
+        previous = self._windows.pop(fingerprint, None)
+        if previous is not None:
+            self._evicted.append(previous)
+        self._windows[fingerprint] = SuppressionWindow(
+            fingerprint, notification, channels, time.monotonic() + self.window
+        )
+        while len(self._windows) > self._max_entries:
+            # Don't lose the count; summarize it on the next flush
+            self._evicted.append(self._windows.popitem(last=False)[1])
+    
+    async def closed_windows(self) -> List[SuppressionWindow]:
+        """Pop the windows of this worker that closed with duplicates pending a summary.
+        
+        Windows without duplicates are dropped; the rest are tracked again
+        once rearm() is called with their summary.
+        """
+        now = time.monotonic()
+        due, self._evicted = self._evicted, []
+        for fingerprint, window in list(self._windows.items()):
+            if window.closes_at <= now:
+                del self._windows[fingerprint]
+                due.append(window)
+        
+        closed = []
+        for window in due:
+            count = await self._state.pop(self._count_key(window.fingerprint, str(window.notification.id)))
+            if not count:
+                continue
+            window.count = int(count)
+            if window.last_seen is None:
+                # Every copy reached another worker; the window's end is the best bound
+                window.last_seen = min(time.time(), window.opened_at + self.window)
+            closed.append(window)
+        return closed
+    
+    async def rearm(self, window: SuppressionWindow, summary: Notification) -> None:
+        """Restart a window with its summary, unless another worker opened one meanwhile"""
+        self._stats["summaries"] += 1
+        holder = await self._state.set(
+            self._key(window.fingerprint),
+            f"{summary.id}|{summary.timestamp.isoformat()}",
+            ttl=self.window,
+            only_if_absent=True
+        )
+        if holder is None:
+            self._open(window.fingerprint, summary, window.channels)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._stats, "tracked": len(self._windows), "window_seconds": self.window}
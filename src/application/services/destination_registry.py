@@ -0,0 +1,61 @@
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+# Key under "channels" that lists named destinations, e.g. {"destinations": ["ops-slack"]}
+NAMED_DESTINATIONS = "destinations"
+
+class NamedDestination:
+    """A server-side destination, built and validated once when loaded"""
+    
+    __slots__ = ("name", "channel", "config", "destination_key", "rate_limit_scopes", "label")
+    
+    def __init__(
+        self,
+        name: str,
+        channel: str,
+        config: Any,
+        destination_key: str,
+        rate_limit_scopes: Dict[str, str],
+        label: str
+    ):
+        self.name = name
+        self.channel = channel
+        self.config = config
+        self.destination_key = destination_key
+        self.rate_limit_scopes = rate_limit_scopes
+        self.label = label
+
+class DestinationRegistry:
+    """Named destinations, replaced as a whole on every (re)load.
+    
+    Requests and queued jobs carry only names; a name is resolved when the
+    notification is sent, so a reload applies to jobs already queued.
+    """
+    
+    def __init__(self):
+        self._destinations: Dict[str, NamedDestination] = {}
+        self._loaded_at: Optional[float] = None
+        self._loads = 0
+    
+    def replace(self, destinations: Iterable[NamedDestination]) -> None:
+        self._destinations = {destination.name: destination for destination in destinations}
+        self._loaded_at = time.time()
+        self._loads += 1
+    
+    def get(self, name: str) -> Optional[NamedDestination]:
+        return self._destinations.get(name)
+    
+    def unknown(self, names: Iterable[str]) -> List[str]:
+        """Names that are not currently defined"""
+        return [name for name in names if name not in self._destinations]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "count": len(self._destinations),
+            "by_channel": {
+                channel: sum(1 for destination in self._destinations.values() if destination.channel == channel)
+                for channel in sorted({destination.channel for destination in self._destinations.values()})
+            },
+            "loads": self._loads,
+            "loaded_at": self._loaded_at
+        }
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from application.interfaces.state_backend import StateBackendInterface
+from application.services.in_memory_state_backend import InMemoryStateBackend
+from domain.exceptions.domain_exceptions import IdempotencyKeyMismatchException
+
+logger = logging.getLogger(__name__)
+
+class IdempotencyCache:
+    """Remembers the response of each idempotency key for a TTL.
+    
+    The first request with a key runs; repeats get its response back without
+    running again. A repeat arriving while the first is still in flight waits
+    for it. A key reused with a different request is rejected. Failures are
+    not cached: waiters see the same error (or, on other workers, run the
+    request themselves) and the next repeat runs again.
+    
+    Responses are kept as JSON in a state backend, so with a shared backend a
+    retry is answered by whichever worker it reaches; a repeat in flight on
+    another worker is polled for. Without one, entries are kept per worker
+    and the least recently used are evicted beyond max_entries.
+    
+    Must only be used from the event loop thread.
+    """
+    
+    def __init__(
+        self,
+        ttl: float = 86400.0,
+        max_entries: int = 10000,
+        state: Optional[StateBackendInterface] = None,
+        pending_ttl: float = 300.0,
+        poll_interval: float = 0.05
+    ):
+        self.ttl = ttl
+        self._state = state or InMemoryStateBackend(max_keys=max_entries)
+        # A request in flight is claimed for pending_ttl, so a worker dying mid-request frees its key
+        self._pending_ttl = pending_ttl
+        self._poll_interval = poll_interval
+        self._in_flight: Dict[str, Tuple[str, "asyncio.Future[Any]"]] = {}
+        self._stats = {"hits": 0, "waited": 0, "misses": 0, "mismatches": 0}
+    
+    async def run(
+        self,
+        key: str,
+        fingerprint: str,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """Return (response, replayed), running compute only for the first request with the key"""
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            return await self._wait(in_flight, fingerprint), True
+        
+        state_key = f"idempotency:{key}"
+        record = await self._state.set(
+            state_key, json.dumps({"fingerprint": fingerprint}), ttl=self._pending_ttl, only_if_absent=True
+        )
+        if record is not None:
+            replayed = await self._replay(key, state_key, fingerprint, record)
+            if replayed is not None:
+                return replayed, True
+            # The first request failed or its worker went away: this one runs instead
+            return await self.run(key, fingerprint, compute)
+        
+        self._stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = (fingerprint, future)
+        try:
+            response = await compute()
+        except asyncio.CancelledError:
+            await self._forget(key, state_key)
+            future.cancel()
+            raise
+        except Exception as e:
+            await self._forget(key, state_key)
+            future.set_exception(e)
+            # Mark retrieved, so an error nobody waited for is not logged as unhandled
+            future.exception()
+            raise
+        
+        try:
+            await self._state.set(
+                state_key, json.dumps({"fingerprint": fingerprint, "response": response}, default=str), ttl=self.ttl
+            )
+        except Exception as e:
+            logger.error("Error storing idempotent response for %s: %s", key, e)
+        del self._in_flight[key]
+        future.set_result(response)
+        return response, False
+    
+    async def _wait(self, in_flight: Tuple[str, "asyncio.Future[Any]"], fingerprint: str) -> Any:
+        """Wait for a request in flight on this worker"""
+        self._check(in_flight[0], fingerprint)
+        self._stats["waited"] += 1
+        # Shielded, so a waiter giving up does not cancel the original request
+        return await asyncio.shield(in_flight[1])
+    
+    async def _replay(self, key: str, state_key: str, fingerprint: str, record: str) -> Optional[Any]:
+        """Response stored for the key, waiting while it is in flight; None once the claim is gone"""
+        waited = False
+        while record is not None:
+            data = json.loads(record)
+            self._check(data["fingerprint"], fingerprint)
+            if "response" in data:
+                self._stats["waited" if waited else "hits"] += 1
+                return data["response"]
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                return await self._wait(in_flight, fingerprint)
+            waited = True
+            await asyncio.sleep(self._poll_interval)
+            record = await self._state.get(state_key)
+        return None
+    
+    def _check(self, expected: str, fingerprint: str) -> None:
+        if expected != fingerprint:
+            self._stats["mismatches"] += 1
+            raise IdempotencyKeyMismatchException("Idempotency key was already used for a different request")
+    
+    async def _forget(self, key: str, state_key: str) -> None:
+        del self._in_flight[key]
+        try:
+            await self._state.pop(state_key)
+        except Exception as e:
+            logger.error("Error releasing idempotency key %s: %s", key, e)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._stats, "ttl_seconds": self.ttl}
@@ -0,0 +1,98 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+from application.interfaces.state_backend import StateBackendInterface, PaceLimit
+
+def slot_wait(tat: float, now: float, rate: float, burst: float) -> float:
+    """Seconds until a GCRA limit whose next slot is due at tat lets a send through"""
+    return max(0.0, tat - (burst - 1) / rate - now)
+
+def blocked_tat(tat: float, now: float, rate: float, burst: float, seconds: float) -> float:
+    """Arrival time that holds the next slot of a GCRA limit until now + seconds"""
+    return max(tat, now + seconds + (burst - 1) / rate)
+
+class InMemoryStateBackend(StateBackendInterface):
+    """State kept by this worker alone, the default when nothing is shared.
+    
+    Keys live in an LRU bounded by max_keys; expired keys are dropped when
+    they are read, and otherwise age out of the cold end.
+    """
+    
+    def __init__(self, max_keys: int = 10000):
+        self._max_keys = max_keys
+        # key -> [value, expires_at or None], on the monotonic clock
+        self._entries: "OrderedDict[str, List[Any]]" = OrderedDict()
+    
+    def _get(self, key: str, now: float) -> Optional[List[Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+    
+    def _put(self, key: str, value: Any, expires_at: Optional[float]) -> None:
+        self._entries[key] = [value, expires_at]
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_keys:
+            self._entries.popitem(last=False)
+    
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._get(key, time.monotonic())
+        return None if entry is None else str(entry[0])
+    
+    async def set(
+        self,
+        key: str,
+        value: str,
+        ttl: Optional[float] = None,
+        only_if_absent: bool = False
+    ) -> Optional[str]:
+        now = time.monotonic()
+        if only_if_absent:
+            entry = self._get(key, now)
+            if entry is not None:
+                return str(entry[0])
+        self._put(key, value, now + ttl if ttl else None)
+        return None
+    
+    async def pop(self, key: str) -> Optional[str]:
+        entry = self._get(key, time.monotonic())
+        if entry is None:
+            return None
+        del self._entries[key]
+        return str(entry[0])
+    
+    async def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        now = time.monotonic()
+        entry = self._get(key, now) or [0, now + ttl if ttl else None]
+        value = int(entry[0]) + amount
+        self._put(key, value, entry[1])
+        return value
+    
+    def _tat(self, key: str, now: float) -> float:
+        entry = self._get(key, now)
+        return now if entry is None else max(entry[0], now)
+    
+    async def pace(self, limits: Sequence[PaceLimit], max_wait: float) -> float:
+        now = time.monotonic()
+        tats = [self._tat(key, now) for key, _, _ in limits]
+        wait = max((slot_wait(tat, now, rate, burst) for tat, (_, rate, burst) in zip(tats, limits)), default=0.0)
+        if wait <= max_wait:
+            for tat, (key, rate, _) in zip(tats, limits):
+                # A limit whose arrival time has passed is the same as a fresh one
+                tat += 1 / rate
+                self._put(key, tat, tat)
+        return wait
+    
+    async def block(self, limit: PaceLimit, seconds: float) -> None:
+        key, rate, burst = limit
+        now = time.monotonic()
+        tat = blocked_tat(self._tat(key, now), now, rate, burst, seconds)
+        self._put(key, tat, tat)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "keys": len(self._entries)}
@@ -0,0 +1,155 @@
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from application.interfaces.metrics import MetricsInterface, NullMetrics
+from application.services.priority_scheduler import LEVEL_NAMES, PriorityScheduler
+from domain.exceptions.domain_exceptions import LoadShedException
+from domain.value_objects.log_level import LogLevel
+
+# Reasons a notification is shed, as reported in stats and metrics
+SHED_IN_FLIGHT = "in_flight"
+SHED_QUEUE_DEPTH = "queue_depth"
+SHED_QUOTA = "quota"
+
+class TokenBucket:
+    """Per-key quota: rate tokens per second, up to burst"""
+    
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._tokens = self.burst
+        self._updated = now
+    
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + max(0.0, now - self._updated) * self.rate)
+        self._updated = max(self._updated, now)
+    
+    def delay(self, now: float) -> float:
+        """Seconds until a token is available"""
+        self._refill(now)
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+    
+    def reserve(self, now: float) -> None:
+        """Take a token; callers check delay() first, so the balance never goes negative"""
+        self._refill(now)
+        self._tokens -= 1
+
+class LoadShedder:
+    """Admission control for new deliveries.
+    
+    The broker is overloaded when max_in_flight admitted deliveries have not
+    finished yet or the delivery queue holds max_queue_depth jobs. While
+    overloaded, notifications below protected_priority are shed (a
+    sample_rate fraction of them is still let through); protected ones are
+    always admitted. Each API key also has a quota of key_rate notifications
+    per second with a key_burst allowance: low-severity notifications over it
+    are shed, protected ones only use it when there is room.
+    
+    Called from request threads, so all state is guarded by a lock. Limits
+    of 0 disable the corresponding check.
+    """
+    
+    def __init__(
+        self,
+        max_in_flight: int = 0,
+        max_queue_depth: int = 0,
+        protected_priority: int = LogLevel.ERROR.priority,
+        key_rate: float = 0.0,
+        key_burst: int = 100,
+        sample_rate: float = 0.0,
+        retry_after: float = 1.0,
+        metrics: Optional[MetricsInterface] = None
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_queue_depth = max_queue_depth
+        self.protected_priority = protected_priority
+        self._key_rate = key_rate
+        self._key_burst = key_burst
+        self._sample_rate = sample_rate
+        self._retry_after = retry_after
+        self._metrics = metrics or NullMetrics()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._queue_depth = 0
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats = {"admitted": 0, "sampled": 0, "shed": {SHED_IN_FLIGHT: 0, SHED_QUEUE_DEPTH: 0, SHED_QUOTA: 0}}
+    
+    def admit(self, api_key: str, priority: int) -> None:
+        """Admit one notification or raise LoadShedException with a retry delay.
+        
+        Every admitted notification must be released once its delivery or
+        enqueue has finished.
+        """
+        protected = priority >= self.protected_priority
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(api_key, now) if self._key_rate > 0 else None
+            delay = bucket.delay(now) if bucket is not None else 0.0
+            if delay > 0 and not protected:
+                self._shed(SHED_QUOTA, priority)
+                raise LoadShedException(
+                    f"API key quota of {self._key_rate:g} notifications per second exceeded",
+                    retry_after=delay,
+                    reason=SHED_QUOTA
+                )
+            
+            overload = self._overload()
+            if overload is not None and not protected:
+                if random.random() >= self._sample_rate:
+                    self._shed(overload, priority)
+                    raise LoadShedException(
+                        f"Server overloaded ({overload.replace('_', ' ')}), "
+                        f"only {LEVEL_NAMES[self.protected_priority]} and above are accepted",
+                        retry_after=self._retry_after,
+                        reason=overload
+                    )
+                self._stats["sampled"] += 1
+            
+            # Protected notifications only take from the quota while it has room
+            if bucket is not None and delay == 0:
+                bucket.reserve(now)
+            self._in_flight += 1
+            self._stats["admitted"] += 1
+    
+    def release(self, count: int = 1) -> None:
+        """Mark admitted notifications as finished"""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - count)
+    
+    def set_queue_depth(self, depth: int) -> None:
+        """Report the delivery queue depth, sampled in the background"""
+        self._queue_depth = depth
+    
+    def _overload(self) -> Optional[str]:
+        if self.max_in_flight and self._in_flight >= self.max_in_flight:
+            return SHED_IN_FLIGHT
+        if self.max_queue_depth and self._queue_depth >= self.max_queue_depth:
+            return SHED_QUEUE_DEPTH
+        return None
+    
+    def _shed(self, reason: str, priority: int) -> None:
+        self._stats["shed"][reason] += 1
+        self._metrics.record_shed(reason, LEVEL_NAMES[PriorityScheduler.clamp(priority)])
+    
+    def _bucket(self, api_key: str, now: float) -> TokenBucket:
+        # Only authenticated keys get here, so there is one bucket per configured key
+        bucket = self._buckets.get(api_key)
+        if bucket is None:
+            bucket = TokenBucket(self._key_rate, self._key_burst, now)
+            self._buckets[api_key] = bucket
+        return bucket
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "shed": dict(self._stats["shed"]),
+                "in_flight": self._in_flight,
+                "queue_depth": self._queue_depth,
+                "max_in_flight": self.max_in_flight,
+                "max_queue_depth": self.max_queue_depth,
+                "protected_level": LEVEL_NAMES[self.protected_priority],
+                "keys": len(self._buckets)
+            }
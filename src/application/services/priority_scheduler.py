@@ -0,0 +1,41 @@
+from typing import Any, Dict, List
+
+from domain.value_objects.log_level import LogLevel
+
+# Priorities from most to least urgent, and the level each one stands for
+PRIORITIES: List[int] = sorted((level.priority for level in LogLevel), reverse=True)
+LEVEL_NAMES: Dict[int, str] = {level.priority: level.value for level in LogLevel}
+
+class PriorityScheduler:
+    """Decides what each delivery queue claim takes.
+    
+    A claim normally takes the most urgent ready job, oldest first within a
+    level. Every fairness_interval-th claim takes the oldest ready job of any
+    level instead, so a flood of urgent jobs slows lower levels down but
+    never starves them. An interval of 1 makes the queue plain FIFO.
+    """
+    
+    def __init__(self, fairness_interval: int = 10):
+        self.fairness_interval = max(1, fairness_interval)
+        self._claims = 0
+        self._oldest_claims = 0
+    
+    def take_oldest(self) -> bool:
+        """Count a claim and tell whether it is a fairness turn"""
+        self._claims += 1
+        if self._claims % self.fairness_interval:
+            return False
+        self._oldest_claims += 1
+        return True
+    
+    @staticmethod
+    def clamp(priority: int) -> int:
+        """Map any priority onto a known level"""
+        return min(max(priority, PRIORITIES[-1]), PRIORITIES[0])
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "fairness_interval": self.fairness_interval,
+            "claims": self._claims,
+            "oldest_claims": self._oldest_claims
+        }
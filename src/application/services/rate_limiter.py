@@ -0,0 +1,67 @@
+import asyncio
+import hashlib
+from typing import Dict, Any, Optional, Tuple
+
+from application.interfaces.state_backend import StateBackendInterface, PaceLimit
+from application.services.in_memory_state_backend import InMemoryStateBackend
+from domain.exceptions.domain_exceptions import RateLimitedException
+
+class RateLimiterRegistry:
+    """Send pacing keyed by channel scope and destination, kept in a state backend.
+    
+    Limits are configured per "<channel>.<scope>" (e.g. "telegram.chat"); a
+    scope without a configured limit is not paced, but still honors
+    server-imposed Retry-After waits. Each scope behaves as a token bucket of
+    its rate and burst; with a shared backend all workers draw from the same
+    bucket. Without one, buckets are kept per worker, bounded by LRU eviction.
+    """
+    
+    def __init__(
+        self,
+        limits: Dict[str, Tuple[float, float]] = None,
+        max_wait: float = 5.0,
+        max_buckets: int = 10000,
+        state: Optional[StateBackendInterface] = None
+    ):
+        self._limits = limits or {}
+        self._max_wait = max_wait
+        self._state = state or InMemoryStateBackend(max_keys=max_buckets)
+        self._stats = {"queued": 0, "throttled": 0, "retry_after": 0}
+    
+    def _limit(self, channel_name: str, scope: str, key: str) -> PaceLimit:
+        # Unlimited scopes get a limit that never runs dry unless blocked
+        rate, burst = self._limits.get(f"{channel_name}.{scope}", (1e9, 1e9))
+        # Keys are bot tokens and webhook URLs; keep them out of shared state
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return f"ratelimit:{channel_name}:{scope}:{digest}", rate, max(1.0, burst)
+    
+    async def acquire(self, channel_name: str, scopes: Dict[str, str]) -> float:
+        """Wait for a send slot on every scope of a destination.
+        
+        Returns the seconds spent queued. Raises RateLimitedException without
+        waiting if the slot is further away than max_wait.
+        """
+        limits = [self._limit(channel_name, scope, key) for scope, key in scopes.items()]
+        delay = await self._state.pace(limits, self._max_wait)
+        if delay > self._max_wait:
+            self._stats["throttled"] += 1
+            raise RateLimitedException(
+                f"Rate limited on {channel_name}, next slot in {delay:.1f}s",
+                retry_after=delay
+            )
+        
+        if delay > 0:
+            self._stats["queued"] += 1
+            await asyncio.sleep(delay)
+        return delay
+    
+    async def penalize(self, channel_name: str, scopes: Dict[str, str], retry_after: float) -> None:
+        """Apply a server-imposed Retry-After to the most specific scope"""
+        if not scopes:
+            return
+        scope, key = list(scopes.items())[-1]
+        await self._state.block(self._limit(channel_name, scope, key), retry_after)
+        self._stats["retry_after"] += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self._stats)
@@ -0,0 +1,69 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+# Timing of the request being handled; copied into the coroutines it runs on the event loop
+_current: ContextVar[Optional["RequestTiming"]] = ContextVar("request_timing", default=None)
+
+class RequestTiming:
+    """Time spent in each stage of handling one request.
+    
+    Time is summed per stage, so stages running concurrently (a fan-out to
+    several destinations) can add up to more than the request took.
+    """
+    
+    __slots__ = ("started", "stages")
+    
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+    
+    def add(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+    
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+    
+    def server_timing(self, total: float) -> str:
+        """Stages as a Server-Timing header value, in milliseconds"""
+        metrics = [f"{stage};dur={seconds * 1000:.2f}" for stage, seconds in self.stages.items()]
+        metrics.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(metrics)
+    
+    def summary(self) -> str:
+        """Stages for a log line"""
+        return " ".join(f"{stage}={seconds * 1000:.2f}ms" for stage, seconds in self.stages.items())
+
+def begin_request_timing() -> RequestTiming:
+    """Start timing the request handled by the current thread"""
+    timing = RequestTiming()
+    _current.set(timing)
+    return timing
+
+def end_request_timing() -> None:
+    _current.set(None)
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Add time to a stage of the current request; a no-op outside a timed request"""
+    timing = _current.get()
+    if timing is not None:
+        timing.add(stage, seconds)
+
+class stage_timer:
+    """Context manager timing its block as a stage of the current request"""
+    
+    __slots__ = ("stage", "timing", "started")
+    
+    def __init__(self, stage: str):
+        self.stage = stage
+    
+    def __enter__(self) -> "stage_timer":
+        self.timing = _current.get()
+        if self.timing is not None:
+            self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.timing is not None:
+            self.timing.add(self.stage, time.perf_counter() - self.started)
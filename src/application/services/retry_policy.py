@@ -0,0 +1,37 @@
+import asyncio
+import random
+from typing import Optional
+
+from domain.exceptions.domain_exceptions import ChannelDeliveryException
+
+class RetryPolicy:
+    """Exponential backoff with full jitter"""
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 5.0
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+    
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """Transient failures (5xx, 429, network, timeouts) are retryable"""
+        if isinstance(error, ChannelDeliveryException):
+            return error.retryable
+        return isinstance(error, (asyncio.TimeoutError, ConnectionError))
+    
+    def next_delay(self, attempt: int, error: Optional[Exception] = None) -> Optional[float]:
+        """Delay before the next attempt, or None if we should give up"""
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            # Server-imposed waits longer than our budget are not worth blocking on
+            return retry_after if retry_after <= self.max_delay else None
+        
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
@@ -0,0 +1,47 @@
+from typing import Dict, Any, Optional
+from uuid import UUID
+
+from application.interfaces.notification_query_service import NotificationQueryServiceInterface
+from domain.value_objects.log_level import LogLevel
+from domain.repositories.notification_repository import NotificationRepositoryInterface
+from domain.exceptions.domain_exceptions import InvalidNotificationDataException
+
+class QueryNotificationsUseCase(NotificationQueryServiceInterface):
+    
+    def __init__(self, notification_repository: NotificationRepositoryInterface):
+        self._notification_repository = notification_repository
+    
+    async def get_notification(self, notification_id: str) -> Optional[Dict[str, Any]]:
+        """Find a stored notification by ID"""
+        notification = await self._notification_repository.find_by_id(UUID(notification_id))
+        return notification.to_dict() if notification else None
+    
+    async def list_notifications(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        level: Optional[str] = None,
+        source: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """List stored notifications newest first, one page at a time"""
+        log_level = None
+        if level:
+            try:
+                log_level = LogLevel(level.upper())
+            except ValueError:
+                raise InvalidNotificationDataException(f"Invalid log level: {level}")
+        
+        try:
+            page = await self._notification_repository.find_page(
+                limit=limit,
+                cursor=cursor,
+                level=log_level,
+                source=source
+            )
+        except ValueError as e:
+            raise InvalidNotificationDataException(str(e))
+        
+        return {
+            "items": [notification.to_dict() for notification in page.items],
+            "next_cursor": page.next_cursor
+        }
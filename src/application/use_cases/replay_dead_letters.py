@@ -0,0 +1,251 @@
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Set, Union
+
+from application.dtos.dead_letter_dto import DeadLetterDTO
+from application.interfaces.dead_letter_service import DeadLetterServiceInterface
+from application.interfaces.dead_letter_store import DeadLetterStoreInterface, DeadLetterFilter
+from application.interfaces.metrics import MetricsInterface, NullMetrics
+from application.interfaces.notification_service import NotificationServiceInterface
+from domain.exceptions.domain_exceptions import InvalidNotificationDataException
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class _Replay:
+    replay_id: str
+    letter_filter: DeadLetterFilter
+    limit: Optional[int]
+    status: str = "running"
+    selected: int = 0
+    delivered: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    task: Optional[asyncio.Task] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "replay_id": self.replay_id,
+            "status": self.status,
+            "filter": {
+                "channel": self.letter_filter.channel,
+                "destination": self.letter_filter.destination,
+                "since": self.letter_filter.since,
+                "until": self.letter_filter.until
+            },
+            "limit": self.limit,
+            "selected": self.selected,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+class ReplayDeadLettersUseCase(DeadLetterServiceInterface):
+    """Lists dead letters and redelivers them in bulk.
+    
+    A replay walks the matching letters oldest first and starts at most
+    rate redeliveries per second, concurrency at a time, on top of the usual
+    per-destination rate limits and circuit breakers. Delivered letters are
+    removed; failed ones stay stored with their new error and attempt count.
+    Only letters that failed before the replay started are selected, so
+    deliveries failing meanwhile are not picked up by it.
+    """
+    
+    def __init__(
+        self,
+        dead_letters: DeadLetterStoreInterface,
+        notification_service: NotificationServiceInterface,
+        rate: float = 5.0,
+        concurrency: int = 5,
+        page_size: int = 100,
+        max_history: int = 50,
+        metrics: Optional[MetricsInterface] = None
+    ):
+        self._dead_letters = dead_letters
+        self._notification_service = notification_service
+        self._rate = rate
+        self._concurrency = max(1, concurrency)
+        self._page_size = page_size
+        self._max_history = max_history
+        self._metrics = metrics or NullMetrics()
+        self._replays: Dict[str, _Replay] = {}
+        self._stats = {"replays": 0, "delivered": 0, "failed": 0}
+    
+    async def list_dead_letters(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        channel: Optional[str] = None,
+        destination: Optional[str] = None,
+        since: Optional[Union[str, float]] = None,
+        until: Optional[Union[str, float]] = None
+    ) -> Dict[str, Any]:
+        """List dead letters newest first, one page at a time"""
+        letter_filter = self._filter(channel, destination, since, until)
+        try:
+            page = await self._dead_letters.find_page(letter_filter, limit=limit, cursor=cursor)
+        except ValueError as e:
+            raise InvalidNotificationDataException(str(e))
+        
+        return {
+            "items": [letter.to_public_dict() for letter in page.items],
+            "next_cursor": page.next_cursor
+        }
+    
+    async def start_replay(
+        self,
+        channel: Optional[str] = None,
+        destination: Optional[str] = None,
+        since: Optional[Union[str, float]] = None,
+        until: Optional[Union[str, float]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Start redelivering matching dead letters in the background"""
+        letter_filter = self._filter(channel, destination, since, until)
+        now = time.time()
+        letter_filter.until = min(letter_filter.until, now) if letter_filter.until is not None else now
+        if limit is not None and limit < 1:
+            raise InvalidNotificationDataException("limit must be positive")
+        
+        replay = _Replay(replay_id=str(uuid.uuid4()), letter_filter=letter_filter, limit=limit)
+        replay.task = asyncio.create_task(self._run(replay), name=f"dead-letter-replay-{replay.replay_id}")
+        self._replays[replay.replay_id] = replay
+        self._stats["replays"] += 1
+        self._trim_history()
+        logger.info("Started dead letter replay %s: %s", replay.replay_id, replay.to_dict()['filter'])
+        return replay.to_dict()
+    
+    def get_replay(self, replay_id: str) -> Optional[Dict[str, Any]]:
+        """Progress of a replay started by this worker"""
+        replay = self._replays.get(replay_id)
+        return replay.to_dict() if replay else None
+    
+    def cancel_replay(self, replay_id: str) -> Optional[Dict[str, Any]]:
+        """Stop a running replay; letters not yet sent stay stored"""
+        replay = self._replays.get(replay_id)
+        if replay is None:
+            return None
+        if replay.status == "running":
+            replay.task.cancel()
+        return replay.to_dict()
+    
+    async def _run(self, replay: _Replay) -> None:
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / self._rate if self._rate > 0 else 0.0
+        next_start = loop.time()
+        semaphore = asyncio.Semaphore(self._concurrency)
+        pending: Set[asyncio.Task] = set()
+        cursor = None
+        try:
+            while replay.limit is None or replay.selected < replay.limit:
+                page = await self._dead_letters.find_page(
+                    replay.letter_filter, limit=self._page_size, cursor=cursor, oldest_first=True
+                )
+                for letter in page.items:
+                    if replay.limit is not None and replay.selected >= replay.limit:
+                        break
+                    # Paced starts: at most rate redeliveries begin each second
+                    delay = next_start - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    next_start = max(next_start, loop.time()) + interval
+                    
+                    await semaphore.acquire()
+                    replay.selected += 1
+                    task = asyncio.create_task(self._replay_one(replay, letter))
+                    pending.add(task)
+                    task.add_done_callback(lambda done: (pending.discard(done), semaphore.release()))
+                if page.next_cursor is None:
+                    break
+                cursor = page.next_cursor
+            if pending:
+                await asyncio.gather(*pending)
+            replay.status = "finished"
+        except asyncio.CancelledError:
+            for task in list(pending):
+                task.cancel()
+            replay.status = "cancelled"
+        except Exception as e:
+            logger.error("Dead letter replay %s failed: %s", replay.replay_id, e)
+            replay.status = "failed"
+        finally:
+            replay.finished_at = time.time()
+            logger.info(
+                "Dead letter replay %s %s: %s delivered, %s failed",
+                replay.replay_id, replay.status, replay.delivered, replay.failed
+            )
+    
+    async def _replay_one(self, replay: _Replay, letter: DeadLetterDTO) -> None:
+        try:
+            result = await self._notification_service.redeliver(letter)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        
+        try:
+            if result["success"]:
+                await self._dead_letters.remove([letter.letter_id])
+                replay.delivered += 1
+                self._stats["delivered"] += 1
+            else:
+                letter.error = result.get("error", "")
+                letter.attempts += result.get("attempts", 0)
+                letter.replays += 1
+                await self._dead_letters.update(letter)
+                replay.failed += 1
+                self._stats["failed"] += 1
+        except Exception as e:
+            logger.error("Could not record replay of dead letter %s: %s", letter.letter_id, e)
+        self._metrics.record_replay(letter.channel, "delivered" if result["success"] else "failed")
+    
+    def _trim_history(self) -> None:
+        finished = [replay_id for replay_id, replay in self._replays.items() if replay.status != "running"]
+        for replay_id in finished[:max(0, len(self._replays) - self._max_history)]:
+            del self._replays[replay_id]
+    
+    @classmethod
+    def _filter(
+        cls,
+        channel: Optional[str],
+        destination: Optional[str],
+        since: Optional[Union[str, float]],
+        until: Optional[Union[str, float]]
+    ) -> DeadLetterFilter:
+        return DeadLetterFilter(
+            channel=channel or None,
+            destination=destination or None,
+            since=cls._parse_time("since", since),
+            until=cls._parse_time("until", until)
+        )
+    
+    @staticmethod
+    def _parse_time(name: str, value: Optional[Union[str, float]]) -> Optional[float]:
+        """Epoch seconds, or an ISO 8601 timestamp (UTC unless it has an offset)"""
+        if value is None or value == "":
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            pass
+        try:
+            timestamp = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            raise InvalidNotificationDataException(f"{name} must be epoch seconds or an ISO 8601 timestamp")
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.timestamp()
+    
+    async def get_stats(self) -> Dict[str, Any]:
+        """Dead letter and replay counters"""
+        return {
+            "stored": await self._dead_letters.count(),
+            **self._stats,
+            "running": sum(1 for replay in self._replays.values() if replay.status == "running"),
+            "rate": self._rate,
+            "concurrency": self._concurrency
+        }
@@ -1,131 +1,627 @@
-from typing import Dict, Any, List
-import asyncio
-import logging
-
-from application.dtos.notification_dto import SendNotificationDTO
-from application.interfaces.notification_service import NotificationServiceInterface
-from domain.entities.notification import Notification
-from domain.value_objects.log_level import LogLevel
-from domain.value_objects.channel_config import SlackConfig, TelegramConfig
-from domain.repositories.notification_repository import NotificationRepositoryInterface
-from domain.services.notification_channel import NotificationChannelInterface
-from domain.exceptions.domain_exceptions import InvalidNotificationDataException, UnsupportedChannelException
-
-logger = logging.getLogger(__name__)
-
-class SendNotificationUseCase(NotificationServiceInterface):
-    
-    def __init__(
-        self,
-        notification_repository: NotificationRepositoryInterface,
-        slack_channel: NotificationChannelInterface,
-        telegram_channel: NotificationChannelInterface
-    ):
-        self._notification_repository = notification_repository
-        self._channels = {
-            "slack": slack_channel,
-            "telegram": telegram_channel
-        }
-    
-    async def send_notification(self, dto: SendNotificationDTO) -> Dict[str, Any]:
-        """Send notification to specified channels"""
-        try:
-            # Validate log level
-            try:
-                log_level = LogLevel(dto.level.upper())
-            except ValueError:
-                raise InvalidNotificationDataException(f"Invalid log level: {dto.level}")
-            
-            # Create notification entity
-            notification = Notification.create(
-                title=dto.title,
-                message=dto.message,
-                level=log_level,
-                metadata=dto.metadata,
-                source=dto.source
-            )
-            
-            # Save notification
-            await self._notification_repository.save(notification)
-            
-            # Send to channels asynchronously
-            send_tasks = []
-            channel_names = []
-            
-            for channel_name, channel_config in dto.channels.items():
-                if channel_name not in self._channels:
-                    logger.warning(f"Unsupported channel: {channel_name}")
-                    continue
-                
-                task = self._send_to_channel(notification, channel_name, channel_config)
-                send_tasks.append(task)
-                channel_names.append(channel_name)
-            
-            if not send_tasks:
-                raise UnsupportedChannelException("No supported channels specified")
-            
-            # Wait for all sends to complete
-            results = await asyncio.gather(*send_tasks, return_exceptions=True)
-            
-            # Process results
-            channel_results = {}
-            for i, channel_name in enumerate(channel_names):
-                result = results[i]
-                if isinstance(result, Exception):
-                    logger.error(f"Error sending to {channel_name}: {str(result)}")
-                    channel_results[channel_name] = {
-                        "success": False,
-                        "error": str(result)
-                    }
-                else:
-                    channel_results[channel_name] = {
-                        "success": True,
-                        "response": result
-                    }
-            
-            return {
-                "notification_id": str(notification.id),
-                "timestamp": notification.timestamp.isoformat(),
-                "channels": channel_results
-            }
-            
-        except Exception as e:
-            logger.error(f"Error sending notification: {str(e)}")
-            raise
-    
-    async def _send_to_channel(
-        self,
-        notification: Notification,
-        channel_name: str,
-        channel_config: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Send notification to specific channel"""
-        try:
-            channel = self._channels[channel_name]
-            
-            # Convert config dict to appropriate config object
-            if channel_name == "slack":
-                config = SlackConfig(**channel_config)
-            elif channel_name == "telegram":
-                config = TelegramConfig(**channel_config)
-            else:
-                raise UnsupportedChannelException(f"Unsupported channel: {channel_name}")
-            
-            # Validate and send
-            if not channel.validate_config(config):
-                raise InvalidNotificationDataException(f"Invalid {channel_name} configuration")
-            
-            return await channel.send(notification, config)
-            
-        except (TypeError, ValueError) as e:
-            error_msg = f"Invalid {channel_name} configuration parameters: {str(e)}"
-            logger.error(error_msg)
-            raise Exception(error_msg)
-        except Exception as e:
-            # Re-raise with more context if needed
-            if isinstance(e, (UnsupportedChannelException, InvalidNotificationDataException)):
-                raise
-            else:
-                error_msg = f"Error sending to {channel_name}: {str(e)}"
-                logger.error(error_msg)
-                raise Exception(error_msg)
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple, Union
+import asyncio
+import logging
+import re
+import time
+import uuid
+
+from application.dtos.notification_dto import SendNotificationDTO
+from application.dtos.delivery_job_dto import DeliveryJobDTO
+from application.dtos.dead_letter_dto import DeadLetterDTO
+from application.interfaces.notification_service import NotificationServiceInterface
+from application.interfaces.delivery_queue import DeliveryQueueInterface
+from application.interfaces.dead_letter_store import DeadLetterStoreInterface
+from application.interfaces.metrics import MetricsInterface, NullMetrics
+from application.services.retry_policy import RetryPolicy
+from application.services.circuit_breaker import CircuitBreakerRegistry
+from application.services.rate_limiter import RateLimiterRegistry
+from application.services.channel_registry import ChannelRegistry
+from application.services.deduplicator import Deduplicator, Duplicate
+from application.services.destination_registry import NAMED_DESTINATIONS, DestinationRegistry, NamedDestination
+from application.services.request_timing import record_stage, stage_timer
+from domain.entities.notification import Notification
+from domain.value_objects.log_level import LogLevel
+from domain.value_objects.delivery_status import DeliveryStatus
+from domain.repositories.notification_repository import NotificationRepositoryInterface
+from domain.exceptions.domain_exceptions import (
+    InvalidNotificationDataException,
+    UnsupportedChannelException,
+    ChannelDeliveryException,
+    CircuitOpenException,
+    RateLimitedException
+)
+
+logger = logging.getLogger(__name__)
+
+_DESTINATION_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+class SendNotificationUseCase(NotificationServiceInterface):
+    
+    def __init__(
+        self,
+        notification_repository: NotificationRepositoryInterface,
+        channels: ChannelRegistry,
+        batch_concurrency: int = 20,
+        fanout_concurrency: int = 10,
+        delivery_queue: Optional[DeliveryQueueInterface] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
+        deduplicator: Optional[Deduplicator] = None,
+        destinations: Optional[DestinationRegistry] = None,
+        dead_letters: Optional[DeadLetterStoreInterface] = None,
+        metrics: Optional[MetricsInterface] = None
+    ):
+        self._notification_repository = notification_repository
+        self._channels = channels
+        self._batch_concurrency = batch_concurrency
+        self._fanout_concurrency = fanout_concurrency
+        self._delivery_queue = delivery_queue
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._circuit_breakers = circuit_breakers or CircuitBreakerRegistry()
+        self._rate_limiter = rate_limiter or RateLimiterRegistry()
+        self._deduplicator = deduplicator
+        self._destinations = destinations or DestinationRegistry()
+        self._dead_letters = dead_letters
+        self._metrics = metrics or NullMetrics()
+        self._retries: Dict[str, int] = {}
+    
+    async def send_notification(self, dto: SendNotificationDTO) -> Dict[str, Any]:
+        """Send notification to specified channels"""
+        try:
+            self._check_destinations(dto.channels)
+            notification = await self._create_notification(dto)
+            if isinstance(notification, Duplicate):
+                return self._suppressed_result(notification, dto.channels)
+            
+            channel_results = await self._deliver(notification, dto.channels)
+            await self._dead_letter(notification, dto.channels, channel_results)
+            
+            return {
+                "notification_id": str(notification.id),
+                "timestamp": notification.timestamp.isoformat(),
+                "channels": channel_results
+            }
+        
+        except Exception as e:
+            logger.error("Error sending notification: %s", e)
+            raise
+    
+    async def enqueue_notification(self, dto: SendNotificationDTO) -> Dict[str, Any]:
+        """Save notification and queue it for background delivery"""
+        if self._delivery_queue is None:
+            raise RuntimeError("Asynchronous delivery is not configured")
+        
+        self._check_destinations(dto.channels)
+        
+        notification = await self._create_notification(dto)
+        if isinstance(notification, Duplicate):
+            return self._suppressed_result(notification)
+        
+        job = DeliveryJobDTO(
+            job_id=str(notification.id),
+            notification=notification.to_dict(),
+            channels=dto.channels,
+            priority=notification.level.priority
+        )
+        with stage_timer("enqueue"):
+            await self._delivery_queue.enqueue(job)
+        
+        return {
+            "notification_id": job.job_id,
+            "timestamp": notification.timestamp.isoformat(),
+            "status": job.status
+        }
+    
+    async def deliver_job(self, job: DeliveryJobDTO, last_attempt: bool = True) -> Dict[str, Any]:
+        """Deliver a queued notification.
+        
+        Destinations deferred by an open circuit or throttling are only
+        dead-lettered on the job's last attempt; until then they are retried.
+        """
+        if job.attempts <= 1:
+            waited = max(0.0, time.time() - job.created_at)
+            self._metrics.observe_stage("queue_wait", waited)
+            self._metrics.observe_queue_wait(job.notification["level"], waited)
+        notification = Notification.from_dict(job.notification)
+        channel_results = await self._deliver(notification, job.channels)
+        await self._dead_letter(notification, job.channels, channel_results, include_deferred=last_attempt)
+        status = DeliveryStatus.from_channel_results(channel_results)
+        return {"status": status.value, "channels": channel_results}
+    
+    async def get_delivery_status(self, notification_id: str) -> Optional[Dict[str, Any]]:
+        """Look up the delivery state of a queued notification"""
+        if self._delivery_queue is None:
+            return None
+        job = await self._delivery_queue.get_job(notification_id)
+        return job.to_status_dict() if job else None
+    
+    async def _create_notification(self, dto: SendNotificationDTO) -> Union[Notification, Duplicate]:
+        """Validate, create and save notification entity.
+        
+        Duplicates of a recently sent notification are only counted: the
+        duplicate is returned instead and nothing is saved.
+        """
+        # Validate log level
+        try:
+            log_level = LogLevel(dto.level.upper())
+        except ValueError:
+            raise InvalidNotificationDataException(f"Invalid log level: {dto.level}")
+        
+        # Create notification entity
+        notification = Notification.create(
+            title=dto.title,
+            message=dto.message,
+            level=log_level,
+            metadata=dto.metadata,
+            source=dto.source
+        )
+        if self._deduplicator is not None:
+            fingerprint = self._deduplicator.fingerprint(
+                dto.title, log_level, dto.source, dto.metadata, dto.channels
+            )
+            with stage_timer("dedupe"):
+                duplicate = await self._deduplicator.claim(fingerprint, notification, dto.channels)
+            if duplicate is not None:
+                return duplicate
+        
+        # Save notification
+        started = time.perf_counter()
+        await self._notification_repository.save(notification)
+        elapsed = time.perf_counter() - started
+        self._metrics.observe_stage("save", elapsed)
+        record_stage("save", elapsed)
+        return notification
+    
+    def _suppressed_result(
+        self,
+        duplicate: Duplicate,
+        channels: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Result for a duplicate that was counted instead of sent"""
+        result = {
+            "notification_id": duplicate.notification_id,
+            "timestamp": duplicate.timestamp,
+            "suppressed": True,
+            "repeat_count": duplicate.repeat_count
+        }
+        if channels is not None:
+            names = [name for name in channels if name in self._channels] + list(channels.get(NAMED_DESTINATIONS) or [])
+            result["channels"] = {name: {"success": True, "suppressed": True} for name in names}
+        else:
+            result["status"] = DeliveryStatus.SUPPRESSED.value
+        return result
+    
+    async def flush_suppressed(self) -> int:
+        """Send a "repeated N times" summary for every closed suppression window"""
+        if self._deduplicator is None:
+            return 0
+        
+        windows = await self._deduplicator.closed_windows()
+        for window in windows:
+            original = window.notification
+            summary = Notification.create(
+                title=f"{original.title} (repeated {window.count} times)",
+                message=original.message,
+                level=original.level,
+                metadata={
+                    **original.metadata,
+                    "repeated": window.count,
+                    "last_seen": datetime.utcfromtimestamp(window.last_seen).strftime("%Y-%m-%d %H:%M:%S UTC")
+                },
+                source=original.source
+            )
+            await self._deduplicator.rearm(window, summary)
+            await self._notification_repository.save(summary)
+            try:
+                channel_results = await self._deliver(summary, window.channels)
+                await self._dead_letter(summary, window.channels, channel_results)
+            except Exception as e:
+                logger.error("Error sending repeat summary for %s: %s", original.id, e)
+        return len(windows)
+    
+    async def _deliver(
+        self,
+        notification: Notification,
+        channels: Dict[str, Union[Dict[str, Any], List[Dict[str, Any]]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Send notification to every destination of every channel, with bounded concurrency.
+        
+        A channel configured with a list of destinations gets an aggregate
+        result with one entry per destination, in request order; a single
+        config keeps the plain per-channel result. Named destinations get a
+        result each, under their name.
+        """
+        targets: List[Tuple[str, Union[Dict[str, Any], NamedDestination]]] = []
+        for channel_name, channel_config in channels.items():
+            if channel_name == NAMED_DESTINATIONS:
+                continue
+            if channel_name not in self._channels:
+                logger.warning("Unsupported channel: %s", channel_name)
+                continue
+            configs = channel_config if isinstance(channel_config, list) else [channel_config]
+            targets.extend((channel_name, config) for config in configs)
+        
+        # Resolved now rather than when queued, so jobs pick up reloaded definitions
+        names = channels.get(NAMED_DESTINATIONS) or []
+        named = {name: self._destinations.get(name) for name in names}
+        targets.extend((destination.channel, destination) for destination in named.values() if destination is not None)
+        
+        if not targets and not names:
+            raise UnsupportedChannelException("No supported channels specified")
+        # A channel's first send imports it off the loop, so sends in flight are not held up meanwhile
+        await self._channels.load(dict.fromkeys(channel_name for channel_name, _ in targets))
+        
+        semaphore = asyncio.Semaphore(self._fanout_concurrency)
+        
+        async def send(
+            channel_name: str,
+            config: Union[Dict[str, Any], NamedDestination]
+        ) -> Tuple[Dict[str, Any], int, float]:
+            async with semaphore:
+                return await self._observed_send(notification, channel_name, config)
+        
+        # Wait for all sends to complete
+        results = iter(await asyncio.gather(
+            *(send(channel_name, config) for channel_name, config in targets),
+            return_exceptions=True
+        ))
+        
+        # Process results
+        channel_results = {}
+        for channel_name, channel_config in channels.items():
+            if channel_name not in self._channels:
+                continue
+            if not isinstance(channel_config, list):
+                channel_results[channel_name] = self._channel_result(channel_name, next(results))
+                continue
+            destinations = [
+                {"destination": self._destination_label(channel_name, config), **self._channel_result(channel_name, next(results))}
+                for config in channel_config
+            ]
+            delivered = sum(1 for destination in destinations if destination["success"])
+            channel_results[channel_name] = {
+                "success": delivered == len(destinations),
+                "delivered": delivered,
+                "failed": len(destinations) - delivered,
+                "destinations": destinations
+            }
+        for name, destination in named.items():
+            if destination is None:
+                channel_results[name] = {"success": False, "error": f"Unknown destination: {name}"}
+            else:
+                channel_results[name] = {
+                    "channel": destination.channel,
+                    "destination": destination.label,
+                    **self._channel_result(destination.channel, next(results))
+                }
+        
+        return channel_results
+    
+    async def _dead_letter(
+        self,
+        notification: Notification,
+        channels: Dict[str, Union[Dict[str, Any], List[Dict[str, Any]]]],
+        channel_results: Dict[str, Dict[str, Any]],
+        include_deferred: bool = True
+    ) -> None:
+        """Keep every destination that failed for good, so it can be replayed later.
+        
+        Only failed deliveries are kept: invalid configurations and unknown
+        destinations never reached a send and would fail again on replay.
+        """
+        if self._dead_letters is None:
+            return
+        
+        letters = []
+        for name, channel_result in channel_results.items():
+            if "destinations" in channel_result:
+                entries = [(destination, config, None) for destination, config in zip(channel_result["destinations"], channels[name])]
+            elif name in self._channels:
+                entries = [(channel_result, channels[name], None)]
+            else:
+                entries = [(channel_result, None, name)]
+            for result, config, destination_name in entries:
+                deferred = result.get("circuit_open") or result.get("throttled")
+                if result["success"] or "attempts" not in result or (deferred and not include_deferred):
+                    continue
+                if destination_name is not None:
+                    channel_name, destination = result["channel"], result["destination"]
+                else:
+                    channel_name, destination = name, result.get("destination") or self._destination_label(name, config)
+                if destination is None:
+                    continue
+                letters.append(DeadLetterDTO(
+                    letter_id=str(uuid.uuid4()),
+                    notification=notification.to_dict(),
+                    channel=channel_name,
+                    destination=destination,
+                    config=config,
+                    destination_name=destination_name,
+                    error=result.get("error", ""),
+                    attempts=result["attempts"]
+                ))
+        
+        if not letters:
+            return
+        try:
+            await self._dead_letters.add(letters)
+        except Exception as e:
+            logger.error("Could not dead-letter %s deliveries of %s: %s", len(letters), notification.id, e)
+            return
+        for letter in letters:
+            self._metrics.record_dead_letter(letter.channel)
+    
+    async def redeliver(self, letter: DeadLetterDTO) -> Dict[str, Any]:
+        """Send a dead letter to its destination again, without dead-lettering it anew"""
+        notification = Notification.from_dict(letter.notification)
+        if letter.destination_name is not None:
+            channels = {NAMED_DESTINATIONS: [letter.destination_name]}
+        else:
+            channels = {letter.channel: letter.config}
+        channel_results = await self._deliver(notification, channels)
+        return next(iter(channel_results.values()))
+    
+    def _channel_result(
+        self,
+        channel_name: str,
+        result: Union[Tuple[Dict[str, Any], int, float], BaseException]
+    ) -> Dict[str, Any]:
+        """Describe the outcome of one send"""
+        if isinstance(result, BaseException):
+            logger.error("Error sending to %s: %s", channel_name, result)
+            channel_result = {
+                "success": False,
+                "error": str(result)
+            }
+            if isinstance(result, ChannelDeliveryException):
+                channel_result["attempts"] = result.attempts
+                channel_result["retryable"] = result.retryable
+                if isinstance(result, CircuitOpenException):
+                    channel_result["circuit_open"] = True
+                    channel_result["retry_after"] = round(result.retry_after, 3)
+                elif isinstance(result, RateLimitedException):
+                    channel_result["throttled"] = True
+                    channel_result["retry_after"] = round(result.retry_after, 3)
+        else:
+            response, attempts, queued = result
+            channel_result = {
+                "success": True,
+                "response": response,
+                "attempts": attempts
+            }
+            if queued > 0:
+                channel_result["queued_seconds"] = round(queued, 3)
+        return channel_result
+    
+    def _destination_label(self, channel_name: str, channel_config: Dict[str, Any]) -> Optional[str]:
+        """Stable, secret-free name of a destination, as used by breakers and limits"""
+        try:
+            config = self._build_config(channel_name, channel_config)
+        except ChannelDeliveryException:
+            return None
+        return self._circuit_breakers.destination_label(
+            channel_name, self._channels.get(channel_name).destination_key(config)
+        )
+    
+    async def send_batch(
+        self,
+        dtos: List[SendNotificationDTO],
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Send many notifications with bounded concurrency.
+        
+        Failures are reported per item and never abort the rest of the batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self._batch_concurrency)
+        
+        async def send_one(dto: SendNotificationDTO) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return {"success": True, "data": await self.send_notification(dto)}
+                except Exception as e:
+                    return {"success": False, "error": str(e)}
+        
+        return list(await asyncio.gather(*(send_one(dto) for dto in dtos)))
+    
+    async def _observed_send(
+        self,
+        notification: Notification,
+        channel_name: str,
+        channel_config: Union[Dict[str, Any], NamedDestination]
+    ) -> Tuple[Dict[str, Any], int, float]:
+        """Send to a channel and record how long the delivery took and how it ended"""
+        started = time.perf_counter()
+        outcome = "failure"
+        try:
+            result = await self._send_to_channel(notification, channel_name, channel_config)
+            outcome = "success"
+            return result
+        except CircuitOpenException:
+            outcome = "circuit_open"
+            raise
+        except RateLimitedException:
+            outcome = "throttled"
+            raise
+        finally:
+            self._metrics.observe_delivery(channel_name, outcome, time.perf_counter() - started)
+    
+    async def _send_to_channel(
+        self,
+        notification: Notification,
+        channel_name: str,
+        channel_config: Union[Dict[str, Any], NamedDestination]
+    ) -> Tuple[Dict[str, Any], int, float]:
+        """Send notification to specific channel, paced and retrying transient failures.
+        
+        Returns the channel response, the number of attempts made and the
+        seconds spent waiting on the destination's rate limit.
+        """
+        channel = self._channels.get(channel_name)
+        if isinstance(channel_config, NamedDestination):
+            # Built and validated when the destinations were loaded
+            config = channel_config.config
+            breaker = self._circuit_breakers.get(channel_name, channel_config.destination_key)
+            scopes = channel_config.rate_limit_scopes
+        else:
+            config = self._build_config(channel_name, channel_config)
+            
+            # Validate and send
+            if not channel.validate_config(config):
+                raise InvalidNotificationDataException(f"Invalid {channel_name} configuration")
+            
+            breaker = self._circuit_breakers.get(channel_name, channel.destination_key(config))
+            scopes = channel.rate_limit_scopes(config)
+        attempt = 0
+        queued = 0.0
+        while True:
+            attempt += 1
+            try:
+                breaker.before_call()
+            except CircuitOpenException as e:
+                e.attempts = attempt - 1
+                raise
+            # Set once the attempt's outcome is recorded; otherwise (throttled,
+            # cancelled while waiting or sending) the probe slot is given back
+            settled = False
+            try:
+                try:
+                    waited = await self._rate_limiter.acquire(channel_name, scopes)
+                    self._metrics.observe_stage("rate_limit_wait", waited)
+                    record_stage("rate_limit_wait", waited)
+                    queued += waited
+                except RateLimitedException as e:
+                    e.attempts = attempt - 1
+                    raise
+                started = time.perf_counter()
+                try:
+                    response = await channel.send(notification, config)
+                except Exception as e:
+                    elapsed = time.perf_counter() - started
+                    self._metrics.observe_upstream(channel_name, elapsed)
+                    record_stage("upstream", elapsed)
+                    error = e if isinstance(e, ChannelDeliveryException) else ChannelDeliveryException(
+                        f"Error sending to {channel_name}: {str(e)}",
+                        retryable=self._retry_policy.is_retryable(e)
+                    )
+                    error.attempts = attempt
+                    
+                    if error.status_code == 429:
+                        # Throttling means the destination is up; pace instead of tripping the breaker
+                        breaker.release()
+                        settled = True
+                        await self._rate_limiter.penalize(channel_name, scopes, error.retry_after or 1.0)
+                        if attempt >= self._retry_policy.max_attempts:
+                            throttled = RateLimitedException(str(error), retry_after=error.retry_after or 1.0)
+                            throttled.attempts = attempt
+                            raise throttled from error
+                        # The limiter holds the next attempt until the destination allows it
+                        delay = 0.0
+                    else:
+                        breaker.record_failure()
+                        settled = True
+                        delay = self._retry_policy.next_delay(attempt, error)
+                        if delay is None:
+                            raise error
+                    
+                    self._retries[channel_name] = self._retries.get(channel_name, 0) + 1
+                    self._metrics.record_retry(channel_name)
+                    logger.warning(
+                        "Retrying %s for %s in %.2fs (attempt %s/%s): %s",
+                        channel_name, notification.id, delay, attempt, self._retry_policy.max_attempts, error
+                    )
+                    record_stage("retry_backoff", delay)
+                    await asyncio.sleep(delay)
+                    continue
+                
+                elapsed = time.perf_counter() - started
+                self._metrics.observe_upstream(channel_name, elapsed)
+                record_stage("upstream", elapsed)
+                breaker.record_success()
+                settled = True
+                return response, attempt, queued
+            finally:
+                if not settled:
+                    breaker.release()
+    
+    def _build_config(self, channel_name: str, channel_config: Dict[str, Any]) -> Any:
+        """Convert config dict to the channel's config object"""
+        channel = self._channels.get(channel_name)
+        try:
+            return channel.build_config(channel_config)
+        except (TypeError, ValueError) as e:
+            raise ChannelDeliveryException(f"Invalid {channel_name} configuration parameters: {str(e)}")
+    
+    def load_destinations(self, definitions: Dict[str, Dict[str, Any]]) -> int:
+        """Build and validate named destinations, then swap them in all at once.
+        
+        Each definition is a channel config plus "channel": the channel's name.
+        Any invalid definition rejects the whole set and keeps the current one.
+        """
+        destinations = []
+        errors = []
+        for name, definition in definitions.items():
+            try:
+                destinations.append(self._build_destination(name, definition))
+            except (InvalidNotificationDataException, ChannelDeliveryException, UnsupportedChannelException) as e:
+                errors.append(f"{name}: {str(e)}")
+        if errors:
+            raise InvalidNotificationDataException(f"Invalid destinations: {'; '.join(errors)}")
+        self._destinations.replace(destinations)
+        return len(destinations)
+    
+    def _build_destination(self, name: str, definition: Dict[str, Any]) -> NamedDestination:
+        if not _DESTINATION_NAME.match(name) or name in self._channels or name == NAMED_DESTINATIONS:
+            raise InvalidNotificationDataException("invalid destination name")
+        if not isinstance(definition, dict):
+            raise InvalidNotificationDataException("definition must be an object")
+        channel_config = dict(definition)
+        channel_name = channel_config.pop("channel", None)
+        if channel_name not in self._channels:
+            raise UnsupportedChannelException(f"unsupported channel {channel_name}")
+        
+        channel = self._channels.get(channel_name)
+        config = self._build_config(channel_name, channel_config)
+        if not channel.validate_config(config):
+            raise InvalidNotificationDataException(f"invalid {channel_name} configuration")
+        destination_key = channel.destination_key(config)
+        return NamedDestination(
+            name=name,
+            channel=channel_name,
+            config=config,
+            destination_key=destination_key,
+            rate_limit_scopes=channel.rate_limit_scopes(config),
+            label=self._circuit_breakers.destination_label(channel_name, destination_key)
+        )
+    
+    def _check_destinations(self, channels: Dict[str, Any]) -> None:
+        """Reject unknown destination names, and requests with nothing to deliver to, before anything is saved.
+        
+        Unknown channel names are skipped with a warning when delivering.
+        """
+        names = channels.get(NAMED_DESTINATIONS) or []
+        if not names and not any(name in self._channels for name in channels if name != NAMED_DESTINATIONS):
+            raise InvalidNotificationDataException("No supported channels specified")
+        unknown = self._destinations.unknown(names)
+        if unknown:
+            raise InvalidNotificationDataException(f"Unknown destinations: {', '.join(unknown)}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Return per-channel delivery statistics"""
+        return {
+            "channels": self._channels.get_stats(),
+            "retries": dict(self._retries),
+            "circuit_breakers": self._circuit_breakers.get_stats(),
+            "rate_limits": self._rate_limiter.get_stats(),
+            "deduplication": self._deduplicator.get_stats() if self._deduplicator else None,
+            "destinations": self._destinations.get_stats()
+        }
+    
+    async def close(self) -> None:
+        """Close all channels"""
+        for channel_name, channel in self._channels.loaded().items():
+            try:
+                await channel.close()
+            except Exception as e:
+                logger.error("Error closing %s channel: %s", channel_name, e)
@@ -0,0 +1,93 @@
+# src/asgi.py
+import asyncio
+import logging
+
+from a2wsgi import WSGIMiddleware
+
+from app_factory import create_app
+from infrastructure.config.settings import Settings
+from infrastructure.runtime.event_loop import BackgroundEventLoop
+
+logger = logging.getLogger(__name__)
+
+class _StreamingInput:
+    """wsgi.input for streamed (chunked) bodies.
+
+    a2wsgi's readline(limit) returns whatever is buffered, or b"" when
+    nothing has arrived yet; this waits for a full line, the limit or the
+    end of the body, like a file would.
+    """
+
+    def __init__(self, body):
+        self._body = body
+
+    def read(self, size: int = -1) -> bytes:
+        return self._body.read(size)
+
+    def readline(self, limit: int = -1) -> bytes:
+        line = b""
+        while limit < 0 or len(line) < limit:
+            part = self._body.readline(limit - len(line) if limit >= 0 else -1)
+            if not part:
+                if not self._body.has_more:
+                    break
+                # Blocks until the next body message arrives
+                part = self._body.read(1)
+            line += part
+            if line.endswith(b"\n"):
+                break
+        return line
+
+    def __iter__(self):
+        while True:
+            line = self.readline()
+            if not line:
+                return
+            yield line
+
+def _streaming_input(wsgi_app):
+    """a2wsgi ends wsgi.input where the ASGI body ends, so chunked bodies are safe to stream"""
+    def app(environ, start_response):
+        environ["wsgi.input"] = _StreamingInput(environ["wsgi.input"])
+        environ["wsgi.input_terminated"] = True
+        return wsgi_app(environ, start_response)
+    return app
+
+class NotificationBrokerASGI:
+    """ASGI entrypoint that runs the use case on the server's event loop.
+
+    Flask routes, auth and error handlers run unchanged in a thread pool;
+    every coroutine they dispatch executes on the single loop owned by the
+    ASGI server, so pooled sessions live for the whole worker lifetime.
+    """
+
+    def __init__(self, settings: Settings):
+        self._event_loop = BackgroundEventLoop()
+        self.flask_app = create_app(settings, event_loop=self._event_loop)
+        self._wsgi = WSGIMiddleware(_streaming_input(self.flask_app), workers=settings.ASGI_THREADS)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        else:
+            await self._wsgi(scope, receive, send)
+
+    async def _lifespan(self, receive, send) -> None:
+        broker = self.flask_app.extensions["notification_broker"]
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._event_loop.attach(asyncio.get_running_loop())
+                await broker["astart"]()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                try:
+                    await broker["aclose"]()
+                except Exception as e:
+                    logger.error("Error during shutdown: %s", e)
+                self._event_loop.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+settings = Settings.from_env()
+app = NotificationBrokerASGI(settings)
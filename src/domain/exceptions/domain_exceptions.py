@@ -1,11 +1,55 @@
-class DomainException(Exception):
-    """Base domain exception"""
-    pass
-
-class InvalidNotificationDataException(DomainException):
-    """Raised when notification data is invalid"""
-    pass
-
-class UnsupportedChannelException(DomainException):
-    """Raised when trying to use unsupported notification channel"""
-    pass
\ No newline at end of file
+class DomainException(Exception):
+    """Base domain exception"""
+    pass
+
+class InvalidNotificationDataException(DomainException):
+    """Raised when notification data is invalid"""
+    pass
+
+class UnsupportedChannelException(DomainException):
+    """Raised when trying to use unsupported notification channel"""
+    pass
+
+class DeliveryQueueFullException(DomainException):
+    """Raised when the delivery queue cannot accept more jobs"""
+    pass
+
+class ChannelDeliveryException(DomainException):
+    """Raised when a channel fails to deliver a notification"""
+    def __init__(
+        self,
+        message: str,
+        retryable: bool = False,
+        status_code: int = None,
+        retry_after: float = None
+    ):
+        self.message = message
+        self.retryable = retryable
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.attempts = 1
+        super().__init__(message)
+
+class CircuitOpenException(ChannelDeliveryException):
+    """Raised when a destination's circuit breaker rejects the call"""
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message, retryable=False, retry_after=retry_after)
+        self.attempts = 0
+
+class RateLimitedException(ChannelDeliveryException):
+    """Raised when a destination's send rate does not allow the call in time"""
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message, retryable=False, status_code=429, retry_after=retry_after)
+        self.attempts = 0
+
+class LoadShedException(DomainException):
+    """Raised when a notification is not admitted because of load or quota"""
+    def __init__(self, message: str, retry_after: float, reason: str):
+        self.message = message
+        self.retry_after = retry_after
+        self.reason = reason
+        super().__init__(message)
+
+class IdempotencyKeyMismatchException(DomainException):
+    """Raised when an idempotency key is reused for a different request"""
+    pass
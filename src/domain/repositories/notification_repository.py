@@ -1,22 +1,53 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional
-from uuid import UUID
-
-from ..entities.notification import Notification
-
-class NotificationRepositoryInterface(ABC):
-    
-    @abstractmethod
-    async def save(self, notification: Notification) -> None:
-        """Save notification to storage"""
-        pass
-    
-    @abstractmethod
-    async def find_by_id(self, notification_id: UUID) -> Optional[Notification]:
-        """Find notification by ID"""
-        pass
-    
-    @abstractmethod
-    async def find_all(self, limit: int = 100, offset: int = 0) -> List[Notification]:
-        """Find all notifications with pagination"""
-        pass
\ No newline at end of file
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional
+from uuid import UUID
+
+from ..entities.notification import Notification
+from ..value_objects.log_level import LogLevel
+
+@dataclass
+class NotificationPage:
+    items: List[Notification]
+    next_cursor: Optional[str] = None
+
+class NotificationRepositoryInterface(ABC):
+    
+    async def start(self) -> None:
+        """Prepare storage and background tasks (optional)"""
+        pass
+    
+    async def close(self) -> None:
+        """Flush pending writes and release resources (optional)"""
+        pass
+    
+    @abstractmethod
+    async def save(self, notification: Notification) -> None:
+        """Save notification to storage"""
+        pass
+    
+    @abstractmethod
+    async def find_by_id(self, notification_id: UUID) -> Optional[Notification]:
+        """Find notification by ID"""
+        pass
+    
+    @abstractmethod
+    async def find_all(self, limit: int = 100, offset: int = 0) -> List[Notification]:
+        """Find all notifications with pagination"""
+        pass
+    
+    @abstractmethod
+    async def find_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        level: Optional[LogLevel] = None,
+        source: Optional[str] = None
+    ) -> NotificationPage:
+        """Find notifications newest first, filtered, continuing after an opaque cursor"""
+        pass
+    
+    @abstractmethod
+    async def count(self) -> int:
+        """Number of stored notifications"""
+        pass
@@ -1,16 +1,63 @@
-from abc import ABC, abstractmethod
-from typing import Any, Dict
-
-from ..entities.notification import Notification
-
-class NotificationChannelInterface(ABC):
-    
-    @abstractmethod
-    async def send(self, notification: Notification, config: Any) -> Dict[str, Any]:
-        """Send notification through channel"""
-        pass
-    
-    @abstractmethod
-    def validate_config(self, config: Any) -> bool:
-        """Validate channel configuration"""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Type
+
+from ..entities.notification import Notification
+
+class NotificationChannelInterface(ABC):
+    """A delivery channel adapter.
+    
+    Each adapter declares the name requests use for it and the config type
+    its destinations are built into, and renders its own payload.
+    """
+    
+    name: str = ""
+    config_type: Type[Any] = dict
+    
+    @abstractmethod
+    async def send(self, notification: Notification, config: Any) -> Dict[str, Any]:
+        """Send notification through channel"""
+        pass
+    
+    @abstractmethod
+    def render(self, notification: Notification, config: Any) -> Any:
+        """Build the upstream payload for a notification"""
+        pass
+    
+    @abstractmethod
+    def validate_config(self, config: Any) -> bool:
+        """Validate channel configuration"""
+        pass
+    
+    def build_config(self, fields: Dict[str, Any]) -> Any:
+        """Build a destination config from its request fields; raises TypeError or ValueError if invalid"""
+        return self.config_type(**fields)
+    
+    def destination_key(self, config: Any) -> str:
+        """Identify the destination a config points to (for breakers and limits)"""
+        return repr(config)
+    
+    def rate_limit_scopes(self, config: Any) -> Dict[str, str]:
+        """Keys to pace sends by, from broadest to most specific scope"""
+        return {"destination": self.destination_key(config)}
+    
+    @staticmethod
+    def parse_retry_after(value: Any) -> Optional[float]:
+        """Parse a Retry-After value in seconds, ignoring anything else"""
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            return None
+        return seconds if seconds >= 0 else None
+    
+    @staticmethod
+    def is_retryable_status(status_code: int) -> bool:
+        """Timeouts, throttling and server errors are transient"""
+        return status_code in (408, 429) or status_code >= 500
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Return channel statistics"""
+        return {}
+    
+    async def close(self) -> None:
+        """Release channel resources"""
         pass
\ No newline at end of file
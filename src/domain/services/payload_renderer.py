@@ -0,0 +1,196 @@
+from string import Formatter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..entities.notification import Notification
+from ..value_objects.log_level import LogLevel
+from ..value_objects.channel_config import SlackConfig
+
+# Fields a template may reference. The per-notification ones are also the
+# positional parameters of every compiled template function, in this order.
+RENDER_ARGS = ("id", "title", "message", "timestamp", "source", "source_section", "metadata_section")
+LEVEL_FIELDS = ("level", "emoji", "color")
+TEMPLATE_FIELDS = frozenset(RENDER_ARGS + LEVEL_FIELDS)
+
+DEFAULT_TEMPLATES = {
+    "slack_title": "{emoji} {title}",
+    "slack_text": "{message}",
+    "telegram": (
+        "{emoji} *{title}*\n"
+        "\n"
+        "📝 {message}\n"
+        "\n"
+        "🏷️ *Level:* `{level}`\n"
+        "🕐 *Time:* `{timestamp}`{source_section}{metadata_section}\n"
+        "\n"
+        "🆔 `{id}`"
+    )
+}
+
+class CompiledTemplate:
+    """A str.format-style template compiled once into a function per log level.
+    
+    Level fields are baked into the literal text at compile time and the rest
+    becomes a generated ``"".join((...))`` over the notification's fields, so
+    nothing is parsed per send. Only whitelisted field names reach the
+    generated code and literal text goes in through repr(), so user templates
+    cannot inject code.
+    """
+    
+    def __init__(self, name: str, template: str):
+        self.name = name
+        parsed = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if field_name is not None:
+                if field_name not in TEMPLATE_FIELDS:
+                    raise ValueError(f"Unknown field '{field_name}' in template '{name}'")
+                if format_spec or conversion:
+                    raise ValueError(f"Format specs are not supported in template '{name}'")
+            parsed.append((literal, field_name))
+        
+        self.by_level: Dict[LogLevel, Callable[..., str]] = {
+            level: self._compile(parsed, level) for level in LogLevel
+        }
+    
+    def _compile(self, parsed: List[Tuple[str, Optional[str]]], level: LogLevel) -> Callable[..., str]:
+        level_values = {"level": level.value, "emoji": level.emoji, "color": level.slack_color}
+        
+        # Merge literals and level values into as few constant pieces as possible
+        pieces: List[Tuple[bool, str]] = []
+        for literal, field_name in parsed:
+            for is_field, text in ((False, literal), (field_name is not None, field_name)):
+                if is_field and text in level_values:
+                    is_field, text = False, level_values[text]
+                if not is_field and not text:
+                    continue
+                if not is_field and pieces and not pieces[-1][0]:
+                    pieces[-1] = (False, pieces[-1][1] + text)
+                else:
+                    pieces.append((is_field, text))
+        
+        expressions = [text if is_field else repr(text) for is_field, text in pieces] or ["''"]
+        source = (
+            f"def render({', '.join(RENDER_ARGS)}):\n"
+            f"    return ''.join(({', '.join(expressions)},))\n"
+        )
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, f"<template {self.name}:{level.value}>", "exec"), namespace)
+        return namespace["render"]
+    
+    def render(self, level: LogLevel, *args: str) -> str:
+        return self.by_level[level](*args)
+
+class _LevelFragments:
+    """Everything about a payload that only depends on the log level"""
+    
+    __slots__ = ("slack_title", "slack_text", "telegram", "color", "level_field")
+    
+    def __init__(self, level: LogLevel, slack_title: str, slack_text: str, telegram: str):
+        self.slack_title = slack_title
+        self.slack_text = slack_text
+        self.telegram = telegram
+        self.color = level.slack_color
+        self.level_field = {"title": "Level", "value": level.value, "short": True}
+
+class PayloadRenderer:
+    """Renders notifications into Slack and Telegram payloads.
+    
+    Templates are compiled once at construction and per-level fragments are
+    precomputed. Rendered parts are kept on the notification, so sending it
+    to several destinations or retrying does not render it again.
+    """
+    
+    def __init__(self, templates: Optional[Dict[str, str]] = None):
+        unknown = set(templates or {}) - set(DEFAULT_TEMPLATES)
+        if unknown:
+            raise ValueError(f"Unknown templates: {', '.join(sorted(unknown))}")
+        merged = {**DEFAULT_TEMPLATES, **(templates or {})}
+        compiled = {name: CompiledTemplate(name, template) for name, template in merged.items()}
+        
+        self._levels = {
+            level: _LevelFragments(
+                level,
+                compiled["slack_title"].by_level[level],
+                compiled["slack_text"].by_level[level],
+                compiled["telegram"].by_level[level]
+            )
+            for level in LogLevel
+        }
+        # Cache keys are per renderer, since templates differ between renderers
+        self._slack_key = f"slack:{id(self)}"
+        self._telegram_key = f"telegram:{id(self)}"
+    
+    @staticmethod
+    def _timestamp(notification: Notification) -> str:
+        """Formatted timestamp, shared by every format"""
+        timestamp = notification.rendered.get("timestamp")
+        if timestamp is None:
+            timestamp = notification.rendered["timestamp"] = notification.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
+        return timestamp
+    
+    def render_slack_attachment(self, notification: Notification) -> Dict[str, Any]:
+        """Config-independent Slack attachment, rendered once per notification"""
+        attachment = notification.rendered.get(self._slack_key)
+        if attachment is not None:
+            return attachment
+        
+        fragments = self._levels[notification.level]
+        notification_id = str(notification.id)
+        timestamp = self._timestamp(notification)
+        source = notification.source or ""
+        
+        fields = [
+            fragments.level_field,
+            {"title": "Timestamp", "value": timestamp, "short": True}
+        ]
+        if notification.source:
+            fields.append({"title": "Source", "value": notification.source, "short": True})
+        if notification.metadata:
+            fields.append({
+                "title": "Metadata",
+                "value": "\n".join([f"• *{k}*: {v}" for k, v in notification.metadata.items()]),
+                "short": False
+            })
+        
+        args = (notification_id, notification.title, notification.message, timestamp, source, "", "")
+        attachment = notification.rendered[self._slack_key] = {
+            "color": fragments.color,
+            "title": fragments.slack_title(*args),
+            "text": fragments.slack_text(*args),
+            "fields": fields,
+            "footer": f"Notification ID: {notification_id}",
+            "ts": int(notification.timestamp.timestamp())
+        }
+        return attachment
+    
+    def render_slack(self, notification: Notification, config: SlackConfig) -> Dict[str, Any]:
+        """Generate Slack-formatted payload"""
+        return {
+            "attachments": [self.render_slack_attachment(notification)],
+            **config.to_dict()
+        }
+    
+    def render_telegram(self, notification: Notification) -> str:
+        """Generate Telegram-formatted message"""
+        text = notification.rendered.get(self._telegram_key)
+        if text is not None:
+            return text
+        
+        source = notification.source
+        if notification.metadata:
+            lines = "\n".join([f"• *{k}:* `{v}`" for k, v in notification.metadata.items()])
+            metadata_section = f"\n\n📊 *Metadata:*\n{lines}"
+        else:
+            metadata_section = ""
+        
+        text = notification.rendered[self._telegram_key] = self._levels[notification.level].telegram(
+            str(notification.id),
+            notification.title,
+            notification.message,
+            self._timestamp(notification),
+            source or "",
+            f"\n🔍 *Source:* `{source}`" if source else "",
+            metadata_section
+        )
+        return text
+
+default_renderer = PayloadRenderer()
@@ -0,0 +1,34 @@
+from enum import Enum
+from typing import Any, Dict
+
+class DeliveryStatus(Enum):
+    QUEUED = "QUEUED"
+    PROCESSING = "PROCESSING"
+    DELIVERED = "DELIVERED"
+    PARTIALLY_DELIVERED = "PARTIALLY_DELIVERED"
+    FAILED = "FAILED"
+    SUPPRESSED = "SUPPRESSED"
+    
+    @property
+    def is_final(self) -> bool:
+        return self in (
+            DeliveryStatus.DELIVERED,
+            DeliveryStatus.PARTIALLY_DELIVERED,
+            DeliveryStatus.FAILED,
+            DeliveryStatus.SUPPRESSED
+        )
+    
+    @classmethod
+    def from_channel_results(cls, channel_results: Dict[str, Dict[str, Any]]) -> "DeliveryStatus":
+        # Channels fanned out to several destinations count each destination
+        outcomes = [
+            destination["success"]
+            for result in channel_results.values()
+            for destination in result.get("destinations", [result])
+        ]
+        delivered = sum(1 for success in outcomes if success)
+        if delivered == len(outcomes):
+            return cls.DELIVERED
+        if delivered:
+            return cls.PARTIALLY_DELIVERED
+        return cls.FAILED
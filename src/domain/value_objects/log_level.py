@@ -1,42 +1,46 @@
-from enum import Enum
-from typing import Dict, Tuple
-
-class LogLevel(Enum):
-    INFO = "INFO"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
-    CRITICAL = "CRITICAL"
-    DISASTER = "DISASTER"
-    
-    @property
-    def emoji(self) -> str:
-        emojis = {
-            LogLevel.INFO: "ℹ️",
-            LogLevel.WARNING: "⚠️",
-            LogLevel.ERROR: "❌",
-            LogLevel.CRITICAL: "🚨",
-            LogLevel.DISASTER: "💀"
-        }
-        return emojis[self]
-    
-    @property
-    def slack_color(self) -> str:
-        colors = {
-            LogLevel.INFO: "#36a64f",      # green
-            LogLevel.WARNING: "#ff9500",   # orange
-            LogLevel.ERROR: "#ff0000",     # red
-            LogLevel.CRITICAL: "#8b0000",  # dark red
-            LogLevel.DISASTER: "#4b0082"   # indigo
-        }
-        return colors[self]
-    
-    @property
-    def priority(self) -> int:
-        priorities = {
-            LogLevel.INFO: 1,
-            LogLevel.WARNING: 2,
-            LogLevel.ERROR: 3,
-            LogLevel.CRITICAL: 4,
-            LogLevel.DISASTER: 5
-        }
-        return priorities[self]
+from enum import Enum
+from typing import Dict, Tuple
+
+class LogLevel(Enum):
+    INFO = "INFO"
+    WARNING = "WARNING"
+    ERROR = "ERROR"
+    CRITICAL = "CRITICAL"
+    DISASTER = "DISASTER"
+    
+    @property
+    def emoji(self) -> str:
+        return _EMOJIS[self]
+    
+    @property
+    def slack_color(self) -> str:
+        return _SLACK_COLORS[self]
+    
+    @property
+    def priority(self) -> int:
+        return _PRIORITIES[self]
+
+# Per-level lookup tables, built once instead of on every property access
+_EMOJIS = {
+    LogLevel.INFO: "ℹ️",
+    LogLevel.WARNING: "⚠️",
+    LogLevel.ERROR: "❌",
+    LogLevel.CRITICAL: "🚨",
+    LogLevel.DISASTER: "💀"
+}
+
+_SLACK_COLORS = {
+    LogLevel.INFO: "#36a64f",      # green
+    LogLevel.WARNING: "#ff9500",   # orange
+    LogLevel.ERROR: "#ff0000",     # red
+    LogLevel.CRITICAL: "#8b0000",  # dark red
+    LogLevel.DISASTER: "#4b0082"   # indigo
+}
+
+_PRIORITIES = {
+    LogLevel.INFO: 1,
+    LogLevel.WARNING: 2,
+    LogLevel.ERROR: 3,
+    LogLevel.CRITICAL: 4,
+    LogLevel.DISASTER: 5
+}
@@ -0,0 +1,51 @@
+import importlib
+from dataclasses import dataclass
+from functools import partial, reduce
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, Optional
+
+from application.services.channel_registry import ChannelLoader
+from domain.services.notification_channel import NotificationChannelInterface
+from domain.services.payload_renderer import PayloadRenderer
+from infrastructure.config.settings import Settings
+
+# Installed packages add channels (or replace built-in ones) by declaring
+# "<channel name> = <module>:<factory>" in this entry point group
+ENTRY_POINT_GROUP = "notification_broker.channels"
+
+BUILTIN_CHANNELS = {
+    "slack": "infrastructure.external_services.slack_service:create_channel",
+    "telegram": "infrastructure.external_services.telegram_service:create_channel"
+}
+
+@dataclass
+class ChannelContext:
+    """What a channel factory builds its adapter from.
+    
+    http_session(name) returns a new pooled HTTP session configured from the
+    HTTP_* settings.
+    """
+    
+    settings: Settings
+    renderer: PayloadRenderer
+    http_session: Callable[[str], Any]
+
+def discover_channels(group: Optional[str] = ENTRY_POINT_GROUP) -> Dict[str, str]:
+    """Channel name -> "module:factory" for the built-in and installed channels.
+    
+    Only entry point metadata is read; nothing is imported.
+    """
+    channels = dict(BUILTIN_CHANNELS)
+    if group:
+        for entry_point in entry_points(group=group):
+            channels[entry_point.name] = entry_point.value
+    return channels
+
+def channel_loaders(specs: Dict[str, str], context: ChannelContext) -> Dict[str, ChannelLoader]:
+    return {name: partial(load_channel, spec, context) for name, spec in specs.items()}
+
+def load_channel(spec: str, context: ChannelContext) -> NotificationChannelInterface:
+    """Import a channel's module and build the channel with its factory"""
+    module_name, _, attribute = spec.partition(":")
+    factory = reduce(getattr, attribute.split("."), importlib.import_module(module_name))
+    return factory(context)
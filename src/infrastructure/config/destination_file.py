@@ -0,0 +1,31 @@
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+class DestinationFile:
+    """JSON file of named destinations, re-read only when it changes on disk.
+    
+    The file maps names to channel configs plus the channel they belong to:
+        {"ops-slack": {"channel": "slack", "webhook_url": "https://hooks.slack.com/..."}}
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._signature: Optional[Tuple[int, int]] = None
+    
+    def read(self) -> Dict[str, Dict[str, Any]]:
+        """Load the file, remembering its modification time and size"""
+        stat = os.stat(self.path)
+        with open(self.path, encoding="utf-8") as f:
+            definitions = json.load(f)
+        if not isinstance(definitions, dict):
+            raise ValueError(f"{self.path} must contain a JSON object of named destinations")
+        self._signature = (stat.st_mtime_ns, stat.st_size)
+        return definitions
+    
+    def read_if_changed(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load the file if it changed since the last read, else return None"""
+        stat = os.stat(self.path)
+        if (stat.st_mtime_ns, stat.st_size) == self._signature:
+            return None
+        return self.read()
@@ -1,24 +1,239 @@
-import os
-from typing import Optional
-from dataclasses import dataclass
-
-@dataclass
-class Settings:
-    # API Configuration
-    API_KEY: str
-    DEBUG: bool = False
-    HOST: str = "0.0.0.0"
-    PORT: int = 8000
-    
-    # Logging
-    LOG_LEVEL: str = "INFO"
-    
-    @classmethod
-    def from_env(cls) -> "Settings":
-        return cls(
-            API_KEY=os.getenv("API_KEY", "your-secret-api-key"),
-            DEBUG=os.getenv("DEBUG", "False").lower() == "true",
-            HOST=os.getenv("HOST", "0.0.0.0"),
-            PORT=int(os.getenv("PORT", "8000")),
-            LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO")
-        )
\ No newline at end of file
+import os
+from typing import Optional
+from dataclasses import dataclass
+
+@dataclass
+class Settings:
+    # API Configuration
+    API_KEY: str
+    API_KEYS: str = ""  # further accepted keys, comma-separated; each gets its own quota
+    DEBUG: bool = False
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    
+    # Logging: "json" or "text" lines on stderr, written by a background thread
+    # from a queue of LOG_QUEUE_SIZE records (0 writes synchronously)
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"
+    LOG_QUEUE_SIZE: int = 10000
+    
+    # Outbound HTTP connection pool (per channel)
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_POOL_LIMIT_PER_HOST: int = 20
+    HTTP_DNS_CACHE_TTL: int = 300
+    HTTP_KEEPALIVE_TIMEOUT: float = 30.0
+    HTTP_TIMEOUT: float = 30.0
+    
+    # Upstream endpoints (override to point at local stand-ins, e.g. for load tests)
+    SLACK_WEBHOOK_PREFIXES: str = "https://hooks.slack.com/"
+    TELEGRAM_API_BASE_URL: str = "https://api.telegram.org"
+    
+    # Channels loaded at startup, off the event loop (comma-separated; others load on their first send)
+    CHANNELS_PRELOAD: str = ""
+    
+    # ASGI mode: threads running Flask handlers
+    ASGI_THREADS: int = 32
+    
+    # Batch sends
+    BATCH_MAX_SIZE: int = 500
+    BATCH_CONCURRENCY: int = 20
+    
+    # Fan-out: destinations per request and concurrent sends per notification
+    FANOUT_MAX_DESTINATIONS: int = 50
+    FANOUT_CONCURRENCY: int = 10
+    
+    # NDJSON streaming sends: deliveries pending per stream and longest accepted line
+    STREAM_MAX_IN_FLIGHT: int = 20
+    STREAM_MAX_LINE_BYTES: int = 65536
+    
+    # Asynchronous delivery queue: memory, sqlite or redis
+    DELIVERY_QUEUE_BACKEND: str = "memory"
+    DELIVERY_QUEUE_SQLITE_PATH: str = "data/delivery_queue.db"
+    DELIVERY_QUEUE_MAX_SIZE: int = 10000
+    DELIVERY_WORKERS: int = 4
+    DELIVERY_MAX_ATTEMPTS: int = 5
+    # Durable queues: jobs claimed longer ago than the visibility timeout (by a
+    # worker that crashed or was stopped mid-send) are requeued, checked every
+    # DELIVERY_RECOVERY_INTERVAL seconds
+    DELIVERY_VISIBILITY_TIMEOUT: float = 300.0
+    DELIVERY_RECOVERY_INTERVAL: float = 30.0
+    REDIS_URL: str = "redis://localhost:6379/0"
+    
+    # Delivery priorities: workers kept for urgent levels, and every Nth claim
+    # taking the oldest job of any level (1 = plain FIFO)
+    DELIVERY_RESERVED_WORKERS: int = 1
+    DELIVERY_RESERVED_MIN_LEVEL: str = "CRITICAL"
+    DELIVERY_FAIRNESS_INTERVAL: int = 10
+    
+    # Admission control: while in-flight deliveries or the queue depth are at
+    # their limit, levels below ADMISSION_PROTECTED_LEVEL get 429 (a sample
+    # may still pass); per-API-key quota in notifications per second (0 disables)
+    ADMISSION_MAX_IN_FLIGHT: int = 1000
+    ADMISSION_MAX_QUEUE_DEPTH: int = 8000
+    ADMISSION_PROTECTED_LEVEL: str = "ERROR"
+    ADMISSION_SAMPLE_RATE: float = 0.0
+    ADMISSION_RETRY_AFTER: float = 1.0
+    ADMISSION_KEY_RATE: float = 0.0
+    ADMISSION_KEY_BURST: int = 100
+    ADMISSION_SAMPLE_INTERVAL: float = 1.0
+    
+    # Retries and circuit breaker (per destination)
+    RETRY_MAX_ATTEMPTS: int = 3
+    RETRY_BASE_DELAY: float = 0.2
+    RETRY_MAX_DELAY: float = 5.0
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RESET_TIMEOUT: float = 30.0
+    
+    # Outbound rate limits (messages per second)
+    RATE_LIMIT_SLACK_PER_WEBHOOK: float = 1.0
+    RATE_LIMIT_TELEGRAM_PER_CHAT: float = 1.0
+    RATE_LIMIT_TELEGRAM_PER_BOT: float = 30.0
+    RATE_LIMIT_BURST: int = 3
+    RATE_LIMIT_MAX_WAIT: float = 5.0
+    
+    # Duplicate suppression, opt-in (0 disables): the message is not part of
+    # the fingerprint, so alerts differing only in their message are collapsed
+    DEDUP_WINDOW_SECONDS: float = 0.0
+    DEDUP_METADATA_KEYS: str = ""
+    DEDUP_MAX_ENTRIES: int = 10000
+    
+    # Idempotency-Key responses (0 disables); max entries bounds the per-worker store
+    IDEMPOTENCY_TTL_SECONDS: float = 86400.0
+    IDEMPOTENCY_MAX_ENTRIES: int = 10000
+    
+    # Where rate limits, duplicate windows and idempotency keys live: "memory"
+    # (per worker), "sqlite" (shared by the workers of one host) or "redis"
+    # (shared across hosts; STATE_REDIS_URL defaults to REDIS_URL)
+    STATE_BACKEND: str = "memory"
+    STATE_SQLITE_PATH: str = "data/state.db"
+    STATE_REDIS_URL: str = ""
+    
+    # Notification store: "memory" (per worker) or "sqlite" (shared, write-behind)
+    NOTIFICATION_STORE_BACKEND: str = "memory"
+    NOTIFICATION_STORE_SQLITE_PATH: str = "data/notifications.db"
+    NOTIFICATION_STORE_FLUSH_INTERVAL: float = 0.05
+    NOTIFICATION_STORE_BATCH_SIZE: int = 500
+    
+    # Notification retention (0 disables the age limit) and query pages
+    NOTIFICATION_STORE_MAX_ITEMS: int = 100000
+    NOTIFICATION_STORE_MAX_AGE: float = 86400.0
+    QUERY_MAX_LIMIT: int = 500
+    
+    # Dead letters: deliveries that failed for good, kept for replay ("memory"
+    # per worker or "sqlite" shared; 0 items disables), and the pace of replays
+    DEAD_LETTER_BACKEND: str = "memory"
+    DEAD_LETTER_SQLITE_PATH: str = "data/dead_letters.db"
+    DEAD_LETTER_MAX_ITEMS: int = 10000
+    DEAD_LETTER_MAX_AGE: float = 604800.0
+    DEAD_LETTER_REPLAY_RATE: float = 5.0
+    DEAD_LETTER_REPLAY_CONCURRENCY: int = 5
+    
+    # Prometheus /metrics; gauges are sampled every METRICS_SAMPLE_INTERVAL seconds
+    METRICS_ENABLED: bool = True
+    METRICS_SAMPLE_INTERVAL: float = 5.0
+    
+    # Per-stage request timings, returned in a Server-Timing header and logged
+    # for requests slower than SLOW_REQUEST_MS (0 disables the log)
+    SERVER_TIMING_ENABLED: bool = True
+    SLOW_REQUEST_MS: float = 1000.0
+    
+    # Sampling profiler: 1 in PROFILE_EVERY_N_REQUESTS requests (0 disables) has
+    # its stacks sampled and appended to PROFILE_DIR as collapsed stacks
+    PROFILE_EVERY_N_REQUESTS: int = 0
+    PROFILE_INTERVAL_MS: float = 2.0
+    PROFILE_DIR: str = "data/profiles"
+    
+    # Optional JSON file with message templates (slack_title, slack_text, telegram)
+    TEMPLATES_PATH: str = ""
+    
+    # Optional JSON file of named destinations, checked for changes every interval
+    DESTINATIONS_PATH: str = ""
+    DESTINATIONS_RELOAD_INTERVAL: float = 5.0
+    
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            API_KEY=os.getenv("API_KEY", "your-secret-api-key"),
+            API_KEYS=os.getenv("API_KEYS", ""),
+            DEBUG=os.getenv("DEBUG", "False").lower() == "true",
+            HOST=os.getenv("HOST", "0.0.0.0"),
+            PORT=int(os.getenv("PORT", "8000")),
+            LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO"),
+            LOG_FORMAT=os.getenv("LOG_FORMAT", "json").lower(),
+            LOG_QUEUE_SIZE=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+            HTTP_POOL_LIMIT=int(os.getenv("HTTP_POOL_LIMIT", "100")),
+            HTTP_POOL_LIMIT_PER_HOST=int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20")),
+            HTTP_DNS_CACHE_TTL=int(os.getenv("HTTP_DNS_CACHE_TTL", "300")),
+            HTTP_KEEPALIVE_TIMEOUT=float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30")),
+            HTTP_TIMEOUT=float(os.getenv("HTTP_TIMEOUT", "30")),
+            SLACK_WEBHOOK_PREFIXES=os.getenv("SLACK_WEBHOOK_PREFIXES", "https://hooks.slack.com/"),
+            TELEGRAM_API_BASE_URL=os.getenv("TELEGRAM_API_BASE_URL", "https://api.telegram.org"),
+            CHANNELS_PRELOAD=os.getenv("CHANNELS_PRELOAD", ""),
+            ASGI_THREADS=int(os.getenv("ASGI_THREADS", "32")),
+            BATCH_MAX_SIZE=int(os.getenv("BATCH_MAX_SIZE", "500")),
+            BATCH_CONCURRENCY=int(os.getenv("BATCH_CONCURRENCY", "20")),
+            FANOUT_MAX_DESTINATIONS=int(os.getenv("FANOUT_MAX_DESTINATIONS", "50")),
+            FANOUT_CONCURRENCY=int(os.getenv("FANOUT_CONCURRENCY", "10")),
+            STREAM_MAX_IN_FLIGHT=int(os.getenv("STREAM_MAX_IN_FLIGHT", "20")),
+            STREAM_MAX_LINE_BYTES=int(os.getenv("STREAM_MAX_LINE_BYTES", "65536")),
+            DELIVERY_QUEUE_BACKEND=os.getenv("DELIVERY_QUEUE_BACKEND", "memory").lower(),
+            DELIVERY_QUEUE_SQLITE_PATH=os.getenv("DELIVERY_QUEUE_SQLITE_PATH", "data/delivery_queue.db"),
+            DELIVERY_QUEUE_MAX_SIZE=int(os.getenv("DELIVERY_QUEUE_MAX_SIZE", "10000")),
+            DELIVERY_WORKERS=int(os.getenv("DELIVERY_WORKERS", "4")),
+            DELIVERY_MAX_ATTEMPTS=int(os.getenv("DELIVERY_MAX_ATTEMPTS", "5")),
+            DELIVERY_VISIBILITY_TIMEOUT=float(os.getenv("DELIVERY_VISIBILITY_TIMEOUT", "300")),
+            DELIVERY_RECOVERY_INTERVAL=float(os.getenv("DELIVERY_RECOVERY_INTERVAL", "30")),
+            REDIS_URL=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+            DELIVERY_RESERVED_WORKERS=int(os.getenv("DELIVERY_RESERVED_WORKERS", "1")),
+            DELIVERY_RESERVED_MIN_LEVEL=os.getenv("DELIVERY_RESERVED_MIN_LEVEL", "CRITICAL").upper(),
+            DELIVERY_FAIRNESS_INTERVAL=int(os.getenv("DELIVERY_FAIRNESS_INTERVAL", "10")),
+            ADMISSION_MAX_IN_FLIGHT=int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "1000")),
+            ADMISSION_MAX_QUEUE_DEPTH=int(os.getenv("ADMISSION_MAX_QUEUE_DEPTH", "8000")),
+            ADMISSION_PROTECTED_LEVEL=os.getenv("ADMISSION_PROTECTED_LEVEL", "ERROR").upper(),
+            ADMISSION_SAMPLE_RATE=float(os.getenv("ADMISSION_SAMPLE_RATE", "0")),
+            ADMISSION_RETRY_AFTER=float(os.getenv("ADMISSION_RETRY_AFTER", "1")),
+            ADMISSION_KEY_RATE=float(os.getenv("ADMISSION_KEY_RATE", "0")),
+            ADMISSION_KEY_BURST=int(os.getenv("ADMISSION_KEY_BURST", "100")),
+            ADMISSION_SAMPLE_INTERVAL=float(os.getenv("ADMISSION_SAMPLE_INTERVAL", "1")),
+            RETRY_MAX_ATTEMPTS=int(os.getenv("RETRY_MAX_ATTEMPTS", "3")),
+            RETRY_BASE_DELAY=float(os.getenv("RETRY_BASE_DELAY", "0.2")),
+            RETRY_MAX_DELAY=float(os.getenv("RETRY_MAX_DELAY", "5")),
+            CIRCUIT_FAILURE_THRESHOLD=int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")),
+            CIRCUIT_RESET_TIMEOUT=float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30")),
+            RATE_LIMIT_SLACK_PER_WEBHOOK=float(os.getenv("RATE_LIMIT_SLACK_PER_WEBHOOK", "1")),
+            RATE_LIMIT_TELEGRAM_PER_CHAT=float(os.getenv("RATE_LIMIT_TELEGRAM_PER_CHAT", "1")),
+            RATE_LIMIT_TELEGRAM_PER_BOT=float(os.getenv("RATE_LIMIT_TELEGRAM_PER_BOT", "30")),
+            RATE_LIMIT_BURST=int(os.getenv("RATE_LIMIT_BURST", "3")),
+            RATE_LIMIT_MAX_WAIT=float(os.getenv("RATE_LIMIT_MAX_WAIT", "5")),
+            DEDUP_WINDOW_SECONDS=float(os.getenv("DEDUP_WINDOW_SECONDS", "0")),
+            DEDUP_METADATA_KEYS=os.getenv("DEDUP_METADATA_KEYS", ""),
+            DEDUP_MAX_ENTRIES=int(os.getenv("DEDUP_MAX_ENTRIES", "10000")),
+            IDEMPOTENCY_TTL_SECONDS=float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400")),
+            IDEMPOTENCY_MAX_ENTRIES=int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", "10000")),
+            STATE_BACKEND=os.getenv("STATE_BACKEND", "memory").lower(),
+            STATE_SQLITE_PATH=os.getenv("STATE_SQLITE_PATH", "data/state.db"),
+            STATE_REDIS_URL=os.getenv("STATE_REDIS_URL", ""),
+            NOTIFICATION_STORE_BACKEND=os.getenv("NOTIFICATION_STORE_BACKEND", "memory").lower(),
+            NOTIFICATION_STORE_SQLITE_PATH=os.getenv("NOTIFICATION_STORE_SQLITE_PATH", "data/notifications.db"),
+            NOTIFICATION_STORE_FLUSH_INTERVAL=float(os.getenv("NOTIFICATION_STORE_FLUSH_INTERVAL", "0.05")),
+            NOTIFICATION_STORE_BATCH_SIZE=int(os.getenv("NOTIFICATION_STORE_BATCH_SIZE", "500")),
+            NOTIFICATION_STORE_MAX_ITEMS=int(os.getenv("NOTIFICATION_STORE_MAX_ITEMS", "100000")),
+            NOTIFICATION_STORE_MAX_AGE=float(os.getenv("NOTIFICATION_STORE_MAX_AGE", "86400")),
+            QUERY_MAX_LIMIT=int(os.getenv("QUERY_MAX_LIMIT", "500")),
+            DEAD_LETTER_BACKEND=os.getenv("DEAD_LETTER_BACKEND", "memory").lower(),
+            DEAD_LETTER_SQLITE_PATH=os.getenv("DEAD_LETTER_SQLITE_PATH", "data/dead_letters.db"),
+            DEAD_LETTER_MAX_ITEMS=int(os.getenv("DEAD_LETTER_MAX_ITEMS", "10000")),
+            DEAD_LETTER_MAX_AGE=float(os.getenv("DEAD_LETTER_MAX_AGE", "604800")),
+            DEAD_LETTER_REPLAY_RATE=float(os.getenv("DEAD_LETTER_REPLAY_RATE", "5")),
+            DEAD_LETTER_REPLAY_CONCURRENCY=int(os.getenv("DEAD_LETTER_REPLAY_CONCURRENCY", "5")),
+            METRICS_ENABLED=os.getenv("METRICS_ENABLED", "true").lower() == "true",
+            METRICS_SAMPLE_INTERVAL=float(os.getenv("METRICS_SAMPLE_INTERVAL", "5")),
+            SERVER_TIMING_ENABLED=os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true",
+            SLOW_REQUEST_MS=float(os.getenv("SLOW_REQUEST_MS", "1000")),
+            PROFILE_EVERY_N_REQUESTS=int(os.getenv("PROFILE_EVERY_N_REQUESTS", "0")),
+            PROFILE_INTERVAL_MS=float(os.getenv("PROFILE_INTERVAL_MS", "2")),
+            PROFILE_DIR=os.getenv("PROFILE_DIR", "data/profiles"),
+            TEMPLATES_PATH=os.getenv("TEMPLATES_PATH", ""),
+            DESTINATIONS_PATH=os.getenv("DESTINATIONS_PATH", ""),
+            DESTINATIONS_RELOAD_INTERVAL=float(os.getenv("DESTINATIONS_RELOAD_INTERVAL", "5"))
+        )
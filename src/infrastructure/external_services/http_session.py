@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+class PooledHttpSession:
+    """Long-lived aiohttp session with a keep-alive connection pool"""
+
+    def __init__(
+        self,
+        name: str,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        timeout: float = 30.0
+    ):
+        self.name = name
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._dns_cache_ttl = dns_cache_ttl
+        self._keepalive_timeout = keepalive_timeout
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._stats = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0
+        }
+
+    async def get(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use"""
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                self._session = self._create_session()
+                logger.debug("HTTP pool '%s' opened", self.name)
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            ttl_dns_cache=self._dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self._keepalive_timeout
+        )
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=self._timeout,
+            trace_configs=[trace_config]
+        )
+
+    async def _on_request_start(self, session, trace_config_ctx, params) -> None:
+        self._stats["requests"] += 1
+
+    async def _on_connection_create_end(self, session, trace_config_ctx, params) -> None:
+        self._stats["connections_created"] += 1
+
+    async def _on_connection_reuseconn(self, session, trace_config_ctx, params) -> None:
+        self._stats["connections_reused"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return connection pool statistics"""
+        created = self._stats["connections_created"]
+        reused = self._stats["connections_reused"]
+        total = created + reused
+        return {
+            **self._stats,
+            "reuse_ratio": round(reused / total, 4) if total else 0.0,
+            "open": self._session is not None and not self._session.closed
+        }
+
+    async def close(self) -> None:
+        """Close the session and release pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.debug("HTTP pool '%s' closed", self.name)
+        self._session = None
@@ -1,64 +1,109 @@
-import aiohttp
-import logging
-from typing import Dict, Any
-
-from domain.entities.notification import Notification
-from domain.value_objects.channel_config import SlackConfig
-from domain.services.notification_channel import NotificationChannelInterface
-
-logger = logging.getLogger(__name__)
-
-class SlackNotificationChannel(NotificationChannelInterface):
-    
-    async def send(self, notification: Notification, config: SlackConfig) -> Dict[str, Any]:
-        """Send notification to Slack"""
-        try:
-            # Validate configuration first
-            if not self.validate_config(config):
-                raise Exception(f"Invalid Slack configuration: webhook URL must start with https://hooks.slack.com/")
-            
-            payload = notification.to_slack_payload(config)
-            logger.debug(f"Sending Slack notification: {notification.id} to {config.webhook_url}")
-            
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    config.webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    response_text = await response.text()
-                    
-                    if response.status == 200:
-                        if response_text.strip() == "ok":
-                            logger.info(f"Slack notification sent successfully: {notification.id}")
-                            return {"status": "sent", "response": response_text}
-                        else:
-                            logger.warning(f"Slack response unexpected: {response_text}")
-                            return {"status": "sent", "response": response_text}
-                    else:
-                        error_msg = f"Slack webhook error (HTTP {response.status}): {response_text}"
-                        logger.error(error_msg)
-                        raise Exception(error_msg)
-                        
-        except aiohttp.ClientError as e:
-            error_msg = f"Network error sending to Slack: {str(e)}"
-            logger.error(error_msg)
-            raise Exception(error_msg)
-        except Exception as e:
-            if "Invalid Slack configuration" in str(e) or "Slack webhook error" in str(e) or "Network error" in str(e):
-                raise
-            else:
-                error_msg = f"Unexpected error sending Slack notification: {str(e)}"
-                logger.error(error_msg)
-                raise Exception(error_msg)
-    
-    def validate_config(self, config: SlackConfig) -> bool:
-        """Validate Slack configuration"""
-        return (
-            config and
-            hasattr(config, 'webhook_url') and
-            config.webhook_url and
-            isinstance(config.webhook_url, str) and
-            config.webhook_url.startswith("https://hooks.slack.com/")
-        )
\ No newline at end of file
+import asyncio
+import aiohttp
+import logging
+from typing import Dict, Any, Optional, Sequence
+
+from domain.entities.notification import Notification
+from domain.value_objects.channel_config import SlackConfig
+from domain.services.notification_channel import NotificationChannelInterface
+from domain.services.payload_renderer import PayloadRenderer, default_renderer
+from domain.exceptions.domain_exceptions import ChannelDeliveryException
+from application.services.request_timing import stage_timer
+from infrastructure.channels.channel_loader import ChannelContext
+from infrastructure.external_services.http_session import PooledHttpSession
+
+logger = logging.getLogger(__name__)
+
+class SlackNotificationChannel(NotificationChannelInterface):
+    
+    name = "slack"
+    config_type = SlackConfig
+    
+    def __init__(
+        self,
+        http_session: Optional[PooledHttpSession] = None,
+        renderer: Optional[PayloadRenderer] = None,
+        allowed_webhook_prefixes: Sequence[str] = ("https://hooks.slack.com/",)
+    ):
+        self._http = http_session or PooledHttpSession("slack")
+        self._renderer = renderer or default_renderer
+        self._allowed_webhook_prefixes = tuple(allowed_webhook_prefixes)
+    
+    async def send(self, notification: Notification, config: SlackConfig) -> Dict[str, Any]:
+        """Send notification to Slack"""
+        # Validate configuration first
+        if not self.validate_config(config):
+            raise ChannelDeliveryException(
+                f"Invalid Slack configuration: webhook URL must start with {' or '.join(self._allowed_webhook_prefixes)}"
+            )
+        
+        try:
+            with stage_timer("render"):
+                payload = self.render(notification, config)
+            logger.debug("Sending Slack notification: %s to %s", notification.id, config.webhook_url)
+            
+            session = await self._http.get()
+            async with session.post(
+                config.webhook_url,
+                json=payload,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                response_text = await response.text()
+                
+                if response.status == 200:
+                    if response_text.strip() == "ok":
+                        logger.info("Slack notification sent successfully: %s", notification.id)
+                        return {"status": "sent", "response": response_text}
+                    else:
+                        logger.warning("Slack response unexpected: %s", response_text)
+                        return {"status": "sent", "response": response_text}
+                else:
+                    error_msg = f"Slack webhook error (HTTP {response.status}): {response_text}"
+                    logger.error(error_msg)
+                    raise ChannelDeliveryException(
+                        error_msg,
+                        retryable=self.is_retryable_status(response.status),
+                        status_code=response.status,
+                        retry_after=self.parse_retry_after(response.headers.get("Retry-After"))
+                    )
+                        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error_msg = f"Network error sending to Slack: {str(e) or type(e).__name__}"
+            logger.error(error_msg)
+            raise ChannelDeliveryException(error_msg, retryable=True)
+    
+    def render(self, notification: Notification, config: SlackConfig) -> Dict[str, Any]:
+        """Slack webhook message, from the configured templates"""
+        return self._renderer.render_slack(notification, config)
+    
+    def validate_config(self, config: SlackConfig) -> bool:
+        """Validate Slack configuration"""
+        return (
+            config and
+            hasattr(config, 'webhook_url') and
+            config.webhook_url and
+            isinstance(config.webhook_url, str) and
+            config.webhook_url.startswith(self._allowed_webhook_prefixes)
+        )
+    
+    def destination_key(self, config: SlackConfig) -> str:
+        """Each webhook URL is a separate destination"""
+        return config.webhook_url
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Return connection pool statistics"""
+        return self._http.get_stats()
+    
+    async def close(self) -> None:
+        """Release pooled connections"""
+        await self._http.close()
+
+def create_channel(context: ChannelContext) -> SlackNotificationChannel:
+    """Channel plugin factory"""
+    return SlackNotificationChannel(
+        context.http_session("slack"),
+        context.renderer,
+        allowed_webhook_prefixes=[
+            prefix.strip() for prefix in context.settings.SLACK_WEBHOOK_PREFIXES.split(",") if prefix.strip()
+        ]
+    )
@@ -1,41 +1,102 @@
-import aiohttp
-import logging
-from typing import Dict, Any
-
-from domain.entities.notification import Notification
-from domain.value_objects.channel_config import TelegramConfig
-from domain.services.notification_channel import NotificationChannelInterface
-
-logger = logging.getLogger(__name__)
-
-class TelegramNotificationChannel(NotificationChannelInterface):
-    
-    async def send(self, notification: Notification, config: TelegramConfig) -> Dict[str, Any]:
-        """Send notification to Telegram"""
-        message_text = notification.to_telegram_payload()
-        
-        payload = {
-            "chat_id": config.chat_id,
-            "text": message_text,
-            "parse_mode": config.parse_mode
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                config.api_url,
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                response_data = await response.json()
-                
-                if response.status == 200 and response_data.get("ok"):
-                    logger.info(f"Telegram notification sent successfully: {notification.id}")
-                    return {"status": "sent", "response": response_data}
-                else:
-                    error_desc = response_data.get("description", "Unknown error")
-                    logger.error(f"Failed to send Telegram notification: {error_desc}")
-                    raise Exception(f"Telegram API error: {error_desc}")
-    
-    def validate_config(self, config: TelegramConfig) -> bool:
-        """Validate Telegram configuration"""
-        return bool(config.bot_token and config.chat_id)
\ No newline at end of file
+import asyncio
+import aiohttp
+import logging
+from typing import Dict, Any, Optional
+
+from domain.entities.notification import Notification
+from domain.value_objects.channel_config import TelegramConfig
+from domain.services.notification_channel import NotificationChannelInterface
+from domain.services.payload_renderer import PayloadRenderer, default_renderer
+from domain.exceptions.domain_exceptions import ChannelDeliveryException
+from application.services.request_timing import stage_timer
+from infrastructure.channels.channel_loader import ChannelContext
+from infrastructure.external_services.http_session import PooledHttpSession
+
+logger = logging.getLogger(__name__)
+
+class TelegramNotificationChannel(NotificationChannelInterface):
+    
+    name = "telegram"
+    config_type = TelegramConfig
+    
+    def __init__(
+        self,
+        http_session: Optional[PooledHttpSession] = None,
+        renderer: Optional[PayloadRenderer] = None,
+        api_base_url: str = "https://api.telegram.org"
+    ):
+        self._http = http_session or PooledHttpSession("telegram")
+        self._renderer = renderer or default_renderer
+        self._api_base_url = api_base_url.rstrip("/")
+    
+    async def send(self, notification: Notification, config: TelegramConfig) -> Dict[str, Any]:
+        """Send notification to Telegram"""
+        with stage_timer("render"):
+            payload = self.render(notification, config)
+        
+        try:
+            session = await self._http.get()
+            async with session.post(
+                f"{self._api_base_url}/bot{config.bot_token}/sendMessage",
+                json=payload,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                try:
+                    response_data = await response.json(content_type=None)
+                except ValueError:
+                    response_data = {"description": f"HTTP {response.status}"}
+                
+                if response.status == 200 and response_data.get("ok"):
+                    logger.info("Telegram notification sent successfully: %s", notification.id)
+                    return {"status": "sent", "response": response_data}
+                else:
+                    error_desc = response_data.get("description", "Unknown error")
+                    logger.error("Failed to send Telegram notification: %s", error_desc)
+                    parameters = response_data.get("parameters") or {}
+                    raise ChannelDeliveryException(
+                        f"Telegram API error: {error_desc}",
+                        retryable=self.is_retryable_status(response.status),
+                        status_code=response.status,
+                        retry_after=self.parse_retry_after(parameters.get("retry_after"))
+                    )
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error_msg = f"Network error sending to Telegram: {str(e) or type(e).__name__}"
+            logger.error(error_msg)
+            raise ChannelDeliveryException(error_msg, retryable=True)
+    
+    def render(self, notification: Notification, config: TelegramConfig) -> Dict[str, Any]:
+        """sendMessage request, with the text from the configured templates"""
+        return {
+            "chat_id": config.chat_id,
+            "text": self._renderer.render_telegram(notification),
+            "parse_mode": config.parse_mode
+        }
+    
+    def validate_config(self, config: TelegramConfig) -> bool:
+        """Validate Telegram configuration"""
+        return bool(config.bot_token and config.chat_id)
+    
+    def destination_key(self, config: TelegramConfig) -> str:
+        """Each bot and chat pair is a separate destination"""
+        return f"{config.bot_token}:{config.chat_id}"
+    
+    def rate_limit_scopes(self, config: TelegramConfig) -> Dict[str, str]:
+        """Telegram limits both the bot as a whole and each chat"""
+        return {"bot": config.bot_token, "chat": self.destination_key(config)}
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Return connection pool statistics"""
+        return self._http.get_stats()
+    
+    async def close(self) -> None:
+        """Release pooled connections"""
+        await self._http.close()
+
+def create_channel(context: ChannelContext) -> TelegramNotificationChannel:
+    """Channel plugin factory"""
+    return TelegramNotificationChannel(
+        context.http_session("telegram"),
+        context.renderer,
+        api_base_url=context.settings.TELEGRAM_API_BASE_URL
+    )
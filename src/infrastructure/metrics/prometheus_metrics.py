@@ -0,0 +1,171 @@
+import os
+from typing import Dict, Optional, Tuple
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from application.interfaces.metrics import MetricsInterface
+
+_REQUEST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_DELIVERY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+_STAGE_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 300.0)
+
+class PrometheusMetrics(MetricsInterface):
+    """Metrics exported in Prometheus format.
+    
+    When PROMETHEUS_MULTIPROC_DIR is set (it must be, before the process
+    starts, under gunicorn with several workers), prometheus_client keeps
+    every value in a memory-mapped file per process and /metrics aggregates
+    the files of all workers, so any worker can answer a scrape. Gauges
+    for state shared by all workers (SQLite/Redis queue, SQLite store) report
+    the max across live workers, per-worker state reports their sum.
+    """
+    
+    def __init__(self, shared_queue: bool = False, shared_store: bool = False):
+        self._multiprocess_dir: Optional[str] = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+        self._registry = CollectorRegistry()
+        # In multiprocess mode values live in files; registering would only duplicate them
+        registry = None if self._multiprocess_dir else self._registry
+        
+        self._requests = Histogram(
+            "notification_http_request_duration_seconds",
+            "HTTP request latency by endpoint",
+            ["endpoint", "method", "status"],
+            buckets=_REQUEST_BUCKETS,
+            registry=registry
+        )
+        self._deliveries = Histogram(
+            "notification_delivery_duration_seconds",
+            "Channel delivery latency, including retries and pacing, by outcome",
+            ["channel", "outcome"],
+            buckets=_DELIVERY_BUCKETS,
+            registry=registry
+        )
+        self._upstream = Histogram(
+            "notification_upstream_request_duration_seconds",
+            "Latency of single calls to channel upstream APIs",
+            ["channel"],
+            buckets=_DELIVERY_BUCKETS,
+            registry=registry
+        )
+        self._stages = Histogram(
+            "notification_stage_duration_seconds",
+            "Time spent in processing stages",
+            ["stage"],
+            buckets=_STAGE_BUCKETS,
+            registry=registry
+        )
+        self._queue_wait = Histogram(
+            "notification_delivery_queue_wait_seconds",
+            "Time jobs waited in the delivery queue before their first attempt, by log level",
+            ["level"],
+            buckets=_STAGE_BUCKETS,
+            registry=registry
+        )
+        self._retries = Counter(
+            "notification_retries",
+            "Retried channel attempts",
+            ["channel"],
+            registry=registry
+        )
+        self._shed = Counter(
+            "notification_shed",
+            "Notifications rejected by admission control",
+            ["reason", "level"],
+            registry=registry
+        )
+        self._dead_letters = Counter(
+            "notification_dead_letters",
+            "Deliveries that failed for good and were dead-lettered",
+            ["channel"],
+            registry=registry
+        )
+        self._replays = Counter(
+            "notification_dead_letter_replays",
+            "Dead letters replayed, by outcome",
+            ["channel", "outcome"],
+            registry=registry
+        )
+        self._circuit_transitions = Counter(
+            "notification_circuit_transitions",
+            "Circuit breaker state changes",
+            ["channel", "from_state", "to_state"],
+            registry=registry
+        )
+        self._circuit_breakers = Gauge(
+            "notification_circuit_breakers",
+            "Circuit breakers (one per destination) in each state",
+            ["state"],
+            registry=registry,
+            multiprocess_mode="livesum"
+        )
+        self._queue_depth = Gauge(
+            "notification_delivery_queue_depth",
+            "Jobs waiting in the delivery queue",
+            registry=registry,
+            multiprocess_mode="livemax" if shared_queue else "livesum"
+        )
+        self._queue_depth_by_level = Gauge(
+            "notification_delivery_queue_depth_by_level",
+            "Jobs waiting in the delivery queue, by log level",
+            ["level"],
+            registry=registry,
+            multiprocess_mode="livemax" if shared_queue else "livesum"
+        )
+        self._repository_size = Gauge(
+            "notification_repository_size",
+            "Stored notifications",
+            registry=registry,
+            multiprocess_mode="livemax" if shared_store else "livesum"
+        )
+    
+    def observe_request(self, endpoint: str, method: str, status: int, seconds: float) -> None:
+        self._requests.labels(endpoint, method, str(status)).observe(seconds)
+    
+    def observe_delivery(self, channel: str, outcome: str, seconds: float) -> None:
+        self._deliveries.labels(channel, outcome).observe(seconds)
+    
+    def observe_upstream(self, channel: str, seconds: float) -> None:
+        self._upstream.labels(channel).observe(seconds)
+    
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        self._stages.labels(stage).observe(seconds)
+    
+    def observe_queue_wait(self, level: str, seconds: float) -> None:
+        self._queue_wait.labels(level).observe(seconds)
+    
+    def record_retry(self, channel: str) -> None:
+        self._retries.labels(channel).inc()
+    
+    def record_shed(self, reason: str, level: str) -> None:
+        self._shed.labels(reason, level).inc()
+    
+    def record_dead_letter(self, channel: str) -> None:
+        self._dead_letters.labels(channel).inc()
+    
+    def record_replay(self, channel: str, outcome: str) -> None:
+        self._replays.labels(channel, outcome).inc()
+    
+    def record_circuit_transition(self, channel: str, from_state: str, to_state: str) -> None:
+        self._circuit_transitions.labels(channel, from_state, to_state).inc()
+    
+    def set_circuit_breakers(self, states: Dict[str, int]) -> None:
+        for state, count in states.items():
+            self._circuit_breakers.labels(state).set(count)
+    
+    def set_queue_depth(self, depth: int) -> None:
+        self._queue_depth.set(depth)
+    
+    def set_queue_depth_by_level(self, depths: Dict[str, int]) -> None:
+        for level, depth in depths.items():
+            self._queue_depth_by_level.labels(level).set(depth)
+    
+    def set_repository_size(self, size: int) -> None:
+        self._repository_size.set(size)
+    
+    def export(self) -> Tuple[bytes, str]:
+        registry = self._registry
+        if self._multiprocess_dir:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry, path=self._multiprocess_dir)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,45 @@
+import asyncio
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+class SqliteConnection:
+    """SQLite connection owned by a single background thread.
+
+    All statements run on that thread so the event loop never blocks on disk
+    I/O. WAL mode lets several worker processes share the same database file.
+    """
+    
+    def __init__(self, path: str, busy_timeout_ms: int = 5000):
+        self.path = path
+        self._busy_timeout_ms = busy_timeout_ms
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._conn: Optional[sqlite3.Connection] = None
+    
+    def _open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute(f"PRAGMA busy_timeout = {self._busy_timeout_ms}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+    
+    async def run(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run fn(connection) on the connection thread"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+            # Single thread, FIFO: the connection is open before any statement runs
+            self._executor.submit(self._open)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, lambda: fn(self._conn))
+    
+    async def close(self) -> None:
+        if self._executor is None:
+            return
+        if self._conn is not None:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._conn.close)
+            self._conn = None
+        self._executor.shutdown(wait=False)
+        self._executor = None
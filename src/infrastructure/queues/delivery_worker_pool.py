@@ -0,0 +1,151 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from application.dtos.delivery_job_dto import DeliveryJobDTO
+from application.interfaces.delivery_queue import DeliveryQueueInterface
+from application.interfaces.notification_service import NotificationServiceInterface
+from application.services.destination_registry import NAMED_DESTINATIONS
+from domain.value_objects.delivery_status import DeliveryStatus
+from domain.value_objects.log_level import LogLevel
+
+logger = logging.getLogger(__name__)
+
+class DeliveryWorkerPool:
+    """Background tasks that drain the delivery queue on the event loop.
+    
+    The first reserved_workers workers only take jobs of at least
+    reserved_min_priority, so urgent notifications always find a free worker
+    however many lower-priority jobs are waiting. At least one worker is
+    always left for every level.
+    """
+    
+    def __init__(
+        self,
+        queue: DeliveryQueueInterface,
+        notification_service: NotificationServiceInterface,
+        workers: int = 4,
+        max_attempts: int = 5,
+        reserved_workers: int = 0,
+        reserved_min_priority: int = LogLevel.CRITICAL.priority
+    ):
+        self._queue = queue
+        self._notification_service = notification_service
+        self._workers = workers
+        self._max_attempts = max_attempts
+        self._reserved_workers = max(0, min(reserved_workers, workers - 1))
+        self._reserved_min_priority = reserved_min_priority
+        self._tasks: List[asyncio.Task] = []
+    
+    async def start(self) -> None:
+        """Start worker tasks on the running loop"""
+        if self._tasks:
+            return
+        await self._queue.start()
+        self._tasks = [
+            asyncio.create_task(self._run(index), name=f"delivery-worker-{index}")
+            for index in range(self._workers)
+        ]
+        logger.info(
+            "Started %s delivery workers, %s reserved for priority %s and above",
+            self._workers, self._reserved_workers, self._reserved_min_priority
+        )
+    
+    async def stop(self) -> None:
+        """Cancel worker tasks; unfinished durable jobs are requeued once their visibility timeout passes"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+    
+    async def _run(self, index: int) -> None:
+        min_priority = self._reserved_min_priority if index < self._reserved_workers else 0
+        while True:
+            try:
+                job = await self._queue.dequeue(min_priority)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Delivery worker %s failed to dequeue: %s", index, e)
+                await asyncio.sleep(1)
+                continue
+            
+            try:
+                await self._process(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Delivery worker %s failed job %s: %s", index, job.job_id, e)
+                try:
+                    await self._queue.complete(job.job_id, DeliveryStatus.FAILED.value, error=str(e))
+                except Exception as complete_error:
+                    logger.error("Could not record failure for job %s: %s", job.job_id, complete_error)
+    
+    async def _process(self, job: DeliveryJobDTO) -> None:
+        result = await self._notification_service.deliver_job(job, last_attempt=job.attempts >= self._max_attempts)
+        
+        # Merge with results from earlier attempts of this job
+        previous = (job.result or {}).get("channels", {})
+        channel_results = {
+            **previous,
+            **{
+                name: self._merge_destinations(previous.get(name), channel_result)
+                for name, channel_result in result["channels"].items()
+            }
+        }
+        
+        # Destinations rejected by an open circuit or throttled are retried later instead of failing
+        deferred: Dict[str, Any] = {}
+        retry_after: List[float] = []
+        for name, channel_result in result["channels"].items():
+            if "destinations" in channel_result:
+                pending = [
+                    (config, destination)
+                    for config, destination in zip(job.channels[name], channel_result["destinations"])
+                    if self._is_deferred(destination)
+                ]
+                if pending:
+                    deferred[name] = [config for config, _ in pending]
+                    retry_after.extend(destination.get("retry_after") or 1.0 for _, destination in pending)
+            elif self._is_deferred(channel_result):
+                if name in job.channels:
+                    deferred[name] = job.channels[name]
+                else:
+                    # Named destinations are results of their own
+                    deferred.setdefault(NAMED_DESTINATIONS, []).append(name)
+                retry_after.append(channel_result.get("retry_after") or 1.0)
+        
+        if deferred and job.attempts < self._max_attempts:
+            delay = max(retry_after)
+            job.channels = deferred
+            job.result = {"status": DeliveryStatus.QUEUED.value, "channels": channel_results}
+            logger.info("Requeued job %s for %s in %.1fs", job.job_id, list(deferred), delay)
+            await self._queue.requeue(job, delay)
+            return
+        
+        status = DeliveryStatus.from_channel_results(channel_results).value
+        await self._queue.complete(job.job_id, status, result={"status": status, "channels": channel_results})
+    
+    @staticmethod
+    def _is_deferred(channel_result: Dict[str, Any]) -> bool:
+        return bool(channel_result.get("circuit_open") or channel_result.get("throttled"))
+    
+    @staticmethod
+    def _merge_destinations(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace the retried destinations of a fanned-out channel, keeping the others"""
+        if not previous or "destinations" not in previous or "destinations" not in current:
+            return current
+        merged = {
+            destination.get("destination") or f"#{index}": destination
+            for index, destination in enumerate(previous["destinations"])
+        }
+        for destination in current["destinations"]:
+            merged[destination["destination"]] = destination
+        destinations = list(merged.values())
+        delivered = sum(1 for destination in destinations if destination["success"])
+        return {
+            "success": delivered == len(destinations),
+            "delivered": delivered,
+            "failed": len(destinations) - delivered,
+            "destinations": destinations
+        }
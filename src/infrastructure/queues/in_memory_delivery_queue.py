@@ -0,0 +1,118 @@
+import asyncio
+import itertools
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Any, Optional, Tuple
+
+from application.dtos.delivery_job_dto import DeliveryJobDTO
+from application.interfaces.delivery_queue import DeliveryQueueInterface
+from application.services.priority_scheduler import LEVEL_NAMES, PRIORITIES, PriorityScheduler
+from domain.exceptions.domain_exceptions import DeliveryQueueFullException
+from domain.value_objects.delivery_status import DeliveryStatus
+
+class InMemoryDeliveryQueue(DeliveryQueueInterface):
+    """In-process priority queue; jobs are lost if the worker restarts"""
+    
+    def __init__(
+        self,
+        max_size: int = 10000,
+        max_finished: int = 10000,
+        scheduler: Optional[PriorityScheduler] = None
+    ):
+        self._max_size = max_size
+        self._max_finished = max_finished
+        self._scheduler = scheduler or PriorityScheduler()
+        # One FIFO of (sequence, job_id) per priority; the sequence orders jobs across levels
+        self._levels: Dict[int, Deque[Tuple[int, str]]] = {priority: deque() for priority in PRIORITIES}
+        self._sequence = itertools.count()
+        self._ready = 0
+        self._available: Optional[asyncio.Event] = None
+        self._jobs: Dict[str, DeliveryJobDTO] = {}
+        self._finished: "OrderedDict[str, DeliveryJobDTO]" = OrderedDict()
+    
+    async def start(self) -> None:
+        if self._available is None:
+            self._available = asyncio.Event()
+    
+    async def enqueue(self, job: DeliveryJobDTO) -> None:
+        """Add a job to the queue"""
+        await self.start()
+        if self._ready >= self._max_size:
+            raise DeliveryQueueFullException(f"Delivery queue is full ({self._max_size} jobs)")
+        self._jobs[job.job_id] = job
+        self._put(job)
+    
+    async def dequeue(self, min_priority: int = 0) -> DeliveryJobDTO:
+        """Wait for the next job of at least min_priority and mark it as processing"""
+        await self.start()
+        while True:
+            job_id = self._take(min_priority)
+            if job_id is not None:
+                break
+            # Every waiter wakes on a new job and those that find nothing for them wait again
+            self._available.clear()
+            await self._available.wait()
+        
+        job = self._jobs[job_id]
+        job.status = DeliveryStatus.PROCESSING.value
+        job.attempts += 1
+        job.updated_at = time.time()
+        return job
+    
+    def _take(self, min_priority: int) -> Optional[str]:
+        candidates = [self._levels[priority] for priority in PRIORITIES if priority >= min_priority and self._levels[priority]]
+        if not candidates:
+            return None
+        if self._scheduler.take_oldest():
+            level = min(candidates, key=lambda jobs: jobs[0][0])
+        else:
+            level = candidates[0]
+        self._ready -= 1
+        return level.popleft()[1]
+    
+    def _put(self, job: DeliveryJobDTO) -> None:
+        self._levels[PriorityScheduler.clamp(job.priority)].append((next(self._sequence), job.job_id))
+        self._ready += 1
+        self._available.set()
+    
+    async def requeue(self, job: DeliveryJobDTO, delay: float) -> None:
+        """Put a processing job back in the queue, available after delay seconds"""
+        job.status = DeliveryStatus.QUEUED.value
+        job.updated_at = time.time()
+        self._jobs[job.job_id] = job
+        # Already-accepted jobs are never dropped, so the size limit does not apply here
+        asyncio.get_running_loop().call_later(delay, self._put, job)
+    
+    async def complete(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """Record the final outcome of a job"""
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        
+        job.status = status
+        job.result = result
+        job.error = error
+        job.updated_at = time.time()
+        
+        # Keep a bounded history of finished jobs for status lookups
+        self._finished[job_id] = job
+        while len(self._finished) > self._max_finished:
+            self._finished.popitem(last=False)
+    
+    async def get_job(self, job_id: str) -> Optional[DeliveryJobDTO]:
+        """Find a job by ID"""
+        return self._jobs.get(job_id) or self._finished.get(job_id)
+    
+    async def depth(self) -> int:
+        """Number of jobs waiting to be processed"""
+        return self._ready
+    
+    async def depth_by_level(self) -> Dict[str, int]:
+        """Number of jobs waiting to be processed, per log level"""
+        return {LEVEL_NAMES[priority]: len(jobs) for priority, jobs in self._levels.items()}
@@ -0,0 +1,319 @@
+import json
+import logging
+import time
+from typing import Dict, Any, Optional
+
+import redis.asyncio as redis
+
+from application.dtos.delivery_job_dto import DeliveryJobDTO
+from application.interfaces.delivery_queue import DeliveryQueueInterface
+from application.services.priority_scheduler import LEVEL_NAMES, PRIORITIES, PriorityScheduler
+from domain.exceptions.domain_exceptions import DeliveryQueueFullException
+from domain.value_objects.delivery_status import DeliveryStatus
+
+logger = logging.getLogger(__name__)
+
+# Claims from the first non-empty list (the most urgent), or from the list whose
+# head job is oldest. KEYS are (queue, ready) pairs by priority, then the
+# processing list and the claim times; ARGV is the oldest-first flag, the job
+# key prefix and the current time. When the chosen list still has jobs its
+# ready list is refilled to wake another worker.
+_CLAIM_SCRIPT = """
+local processing = KEYS[#KEYS - 1]
+local claimed = KEYS[#KEYS]
+local chosen = nil
+local oldest = nil
+for i = 1, #KEYS - 2, 2 do
+    local head = redis.call('LINDEX', KEYS[i], 0)
+    if head then
+        if ARGV[1] ~= '1' then
+            chosen = i
+            break
+        end
+        local created = tonumber(redis.call('HGET', ARGV[2] .. head, 'created_at') or '0')
+        if oldest == nil or created < oldest then
+            oldest = created
+            chosen = i
+        end
+    end
+end
+if not chosen then
+    return false
+end
+local job_id = redis.call('LMOVE', KEYS[chosen], processing, 'LEFT', 'RIGHT')
+redis.call('ZADD', claimed, ARGV[3], job_id)
+if redis.call('LLEN', KEYS[chosen]) > 0 and redis.call('LLEN', KEYS[chosen + 1]) == 0 then
+    redis.call('RPUSH', KEYS[chosen + 1], '1')
+end
+return job_id
+"""
+
+# Moves jobs claimed before the cutoff from the processing list to the delayed
+# set, due now, from where they are pushed back on their priority's list.
+# KEYS are the processing list, the claim times and the delayed set; ARGV is
+# the current time, the cutoff, the job key prefix and the queued status. Processing entries with
+# no claim time (claimed before claim times were kept) are timed from now.
+_RECOVER_SCRIPT = """
+local processing, claimed, delayed = KEYS[1], KEYS[2], KEYS[3]
+for _, job_id in ipairs(redis.call('LRANGE', processing, 0, -1)) do
+    redis.call('ZADD', claimed, 'NX', ARGV[1], job_id)
+end
+local stale = redis.call('ZRANGEBYSCORE', claimed, '-inf', ARGV[2], 'LIMIT', 0, 100)
+for _, job_id in ipairs(stale) do
+    redis.call('ZREM', claimed, job_id)
+    redis.call('LREM', processing, 1, job_id)
+    if redis.call('EXISTS', ARGV[3] .. job_id) == 1 then
+        redis.call('HSET', ARGV[3] .. job_id, 'status', ARGV[4], 'updated_at', ARGV[1])
+        redis.call('ZADD', delayed, ARGV[1], job_id)
+    end
+end
+return #stale
+"""
+
+# Moves one due job from the delayed set onto its priority's list, in one step
+# so a job is never left in neither. KEYS are the delayed set, the job hash,
+# then (queue, ready) pairs by priority; ARGV is the job ID, then the
+# priorities in the same order, highest first. ZREM succeeds for exactly one
+# worker, so a job is never pushed twice.
+_PROMOTE_SCRIPT = """
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+local priority = tonumber(redis.call('HGET', KEYS[2], 'priority') or ARGV[#ARGV])
+local chosen = #ARGV
+for i = 2, #ARGV do
+    if priority >= tonumber(ARGV[i]) then
+        chosen = i
+        break
+    end
+end
+redis.call('RPUSH', KEYS[chosen * 2 - 1], ARGV[1])
+redis.call('RPUSH', KEYS[chosen * 2], '1')
+redis.call('LTRIM', KEYS[chosen * 2], -1, -1)
+return 1
+"""
+
+class RedisDeliveryQueue(DeliveryQueueInterface):
+    """Durable queue on any Redis-protocol server, shared across hosts.
+    
+    Pending job IDs live in one list per priority; each job is a hash. Claimed
+    jobs are moved atomically to a processing list, with their claim time in a
+    sorted set, so a crash never silently drops them: recover_stale() puts jobs
+    claimed more than visibility_timeout seconds ago back in the queue. Idle
+    workers block on small "ready" lists that get a token whenever their
+    priority's list receives jobs.
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "notification-broker:delivery",
+        max_size: int = 10000,
+        block_timeout: float = 1.0,
+        visibility_timeout: float = 300.0,
+        retention_seconds: int = 86400,
+        scheduler: Optional[PriorityScheduler] = None
+    ):
+        self._url = url
+        self._prefix = prefix
+        self._max_size = max_size
+        self._block_timeout = block_timeout
+        self._visibility_timeout = visibility_timeout
+        self._retention_seconds = retention_seconds
+        self._scheduler = scheduler or PriorityScheduler()
+        self._client: Optional[redis.Redis] = None
+        self._claim = None
+        self._recover = None
+        self._promote = None
+        self._queue_key = f"{prefix}:queue"
+        self._processing_key = f"{prefix}:processing"
+        self._claimed_key = f"{prefix}:claimed"
+        self._delayed_key = f"{prefix}:delayed"
+        # The lowest level keeps the original list, so jobs queued before priorities existed are still claimed
+        self._queue_keys = {
+            priority: self._queue_key if priority == PRIORITIES[-1] else f"{self._queue_key}:{LEVEL_NAMES[priority].lower()}"
+            for priority in PRIORITIES
+        }
+        self._ready_keys = {priority: f"{prefix}:ready:{LEVEL_NAMES[priority].lower()}" for priority in PRIORITIES}
+        self._list_keys = [key for priority in PRIORITIES for key in (self._queue_keys[priority], self._ready_keys[priority])]
+    
+    def _job_key(self, job_id: str) -> str:
+        return f"{self._prefix}:job:{job_id}"
+    
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = redis.from_url(self._url, decode_responses=True)
+            self._claim = self._client.register_script(_CLAIM_SCRIPT)
+            self._recover = self._client.register_script(_RECOVER_SCRIPT)
+            self._promote = self._client.register_script(_PROMOTE_SCRIPT)
+            await self.recover_stale()
+    
+    async def recover_stale(self) -> int:
+        """Requeue jobs claimed longer ago than the visibility timeout; returns how many.
+        
+        A worker that crashed, or was stopped mid-send, leaves its job in the
+        processing list; the job is delivered again, so delivery is at least once.
+        """
+        await self.start()
+        now = time.time()
+        recovered = 0
+        while True:
+            moved = await self._recover(
+                keys=[self._processing_key, self._claimed_key, self._delayed_key],
+                args=[now, now - self._visibility_timeout, self._job_key(""), DeliveryStatus.QUEUED.value]
+            )
+            recovered += moved
+            if moved < 100:
+                break
+        if recovered:
+            logger.warning("Requeued %s delivery jobs claimed more than %gs ago", recovered, self._visibility_timeout)
+        return recovered
+    
+    async def enqueue(self, job: DeliveryJobDTO) -> None:
+        """Add a job to the queue"""
+        await self.start()
+        if await self.depth() >= self._max_size:
+            raise DeliveryQueueFullException(f"Delivery queue is full ({self._max_size} jobs)")
+        
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._job_key(job.job_id), mapping=self._job_to_hash(job))
+            self._push(pipe, job.job_id, job.priority)
+            await pipe.execute()
+    
+    def _push(self, pipe: Any, job_id: str, priority: int) -> None:
+        """Queue a job ID on its priority's list and leave a single wake-up token"""
+        priority = PriorityScheduler.clamp(priority)
+        pipe.rpush(self._queue_keys[priority], job_id)
+        pipe.rpush(self._ready_keys[priority], "1")
+        pipe.ltrim(self._ready_keys[priority], -1, -1)
+    
+    async def dequeue(self, min_priority: int = 0) -> DeliveryJobDTO:
+        """Wait for the next job of at least min_priority and mark it as processing"""
+        await self.start()
+        priorities = [priority for priority in PRIORITIES if priority >= min_priority]
+        keys = [key for priority in priorities for key in (self._queue_keys[priority], self._ready_keys[priority])]
+        ready_keys = [self._ready_keys[priority] for priority in priorities]
+        while True:
+            await self._promote_delayed()
+            job_id = await self._claim(
+                keys=keys + [self._processing_key, self._claimed_key],
+                args=["1" if self._scheduler.take_oldest() else "0", self._job_key(""), time.time()]
+            )
+            if job_id is None:
+                await self._client.blpop(ready_keys, timeout=self._block_timeout)
+                continue
+            
+            key = self._job_key(job_id)
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={"status": DeliveryStatus.PROCESSING.value, "updated_at": time.time()})
+                pipe.hincrby(key, "attempts", 1)
+                pipe.hgetall(key)
+                _, _, data = await pipe.execute()
+            
+            if data.get("job_id"):
+                return self._hash_to_job(data)
+            # Job hash expired or was deleted; drop the dangling ID
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.lrem(self._processing_key, 1, job_id)
+                pipe.zrem(self._claimed_key, job_id)
+                await pipe.execute()
+    
+    async def requeue(self, job: DeliveryJobDTO, delay: float) -> None:
+        """Put a processing job back in the queue, available after delay seconds"""
+        await self.start()
+        mapping = {
+            "status": DeliveryStatus.QUEUED.value,
+            "channels": json.dumps(job.channels),
+            "result": json.dumps(job.result) if job.result is not None else "",
+            "updated_at": time.time()
+        }
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._job_key(job.job_id), mapping=mapping)
+            pipe.lrem(self._processing_key, 1, job.job_id)
+            pipe.zrem(self._claimed_key, job.job_id)
+            pipe.zadd(self._delayed_key, {job.job_id: time.time() + delay})
+            await pipe.execute()
+    
+    async def _promote_delayed(self) -> None:
+        """Move delayed jobs whose time has come onto the main queue"""
+        due = await self._client.zrangebyscore(self._delayed_key, 0, time.time(), start=0, num=100)
+        for job_id in due:
+            await self._promote(
+                keys=[self._delayed_key, self._job_key(job_id)] + self._list_keys,
+                args=[job_id] + PRIORITIES
+            )
+    
+    async def complete(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """Record the final outcome of a job"""
+        await self.start()
+        key = self._job_key(job_id)
+        mapping = {"status": status, "updated_at": time.time(), "error": error or ""}
+        if result is not None:
+            mapping["result"] = json.dumps(result)
+        
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, self._retention_seconds)
+            pipe.lrem(self._processing_key, 1, job_id)
+            pipe.zrem(self._claimed_key, job_id)
+            await pipe.execute()
+    
+    async def get_job(self, job_id: str) -> Optional[DeliveryJobDTO]:
+        """Find a job by ID"""
+        await self.start()
+        data = await self._client.hgetall(self._job_key(job_id))
+        return self._hash_to_job(data) if data.get("job_id") else None
+    
+    async def depth(self) -> int:
+        """Number of jobs waiting to be processed"""
+        return sum((await self.depth_by_level()).values())
+    
+    async def depth_by_level(self) -> Dict[str, int]:
+        """Number of jobs waiting to be processed, per log level"""
+        await self.start()
+        async with self._client.pipeline(transaction=False) as pipe:
+            for priority in PRIORITIES:
+                pipe.llen(self._queue_keys[priority])
+            lengths = await pipe.execute()
+        return {LEVEL_NAMES[priority]: length for priority, length in zip(PRIORITIES, lengths)}
+    
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    @staticmethod
+    def _job_to_hash(job: DeliveryJobDTO) -> Dict[str, Any]:
+        return {
+            "job_id": job.job_id,
+            "notification": json.dumps(job.notification),
+            "channels": json.dumps(job.channels),
+            "status": job.status,
+            "priority": job.priority,
+            "attempts": job.attempts,
+            "result": json.dumps(job.result) if job.result is not None else "",
+            "error": job.error or "",
+            "created_at": job.created_at,
+            "updated_at": job.updated_at
+        }
+    
+    @staticmethod
+    def _hash_to_job(data: Dict[str, str]) -> DeliveryJobDTO:
+        return DeliveryJobDTO(
+            job_id=data["job_id"],
+            notification=json.loads(data["notification"]),
+            channels=json.loads(data["channels"]),
+            status=data["status"],
+            priority=int(data.get("priority", PRIORITIES[-1])),
+            attempts=int(data.get("attempts", 0)),
+            result=json.loads(data["result"]) if data.get("result") else None,
+            error=data.get("error") or None,
+            created_at=float(data["created_at"]),
+            updated_at=float(data["updated_at"])
+        )
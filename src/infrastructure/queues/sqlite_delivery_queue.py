@@ -0,0 +1,272 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from typing import Callable, Dict, Any, Optional
+
+from application.dtos.delivery_job_dto import DeliveryJobDTO
+from application.interfaces.delivery_queue import DeliveryQueueInterface
+from application.services.priority_scheduler import LEVEL_NAMES, PriorityScheduler
+from domain.exceptions.domain_exceptions import DeliveryQueueFullException
+from domain.value_objects.delivery_status import DeliveryStatus
+from infrastructure.persistence.sqlite_connection import SqliteConnection
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS delivery_jobs (
+    job_id TEXT PRIMARY KEY,
+    notification TEXT NOT NULL,
+    channels TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    available_at REAL NOT NULL DEFAULT 0,
+    priority INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_delivery_jobs_status ON delivery_jobs (status, created_at);
+"""
+
+# Created after the priority column is added to older files
+_PRIORITY_INDEX = "CREATE INDEX IF NOT EXISTS idx_delivery_jobs_priority ON delivery_jobs (status, priority DESC, created_at)"
+
+class SqliteDeliveryQueue(DeliveryQueueInterface):
+    """Durable queue in a SQLite file shared by all workers on the host"""
+    
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 10000,
+        poll_interval: float = 0.5,
+        visibility_timeout: float = 300.0,
+        retention_seconds: float = 86400.0,
+        scheduler: Optional[PriorityScheduler] = None
+    ):
+        self._db = SqliteConnection(path)
+        self._scheduler = scheduler or PriorityScheduler()
+        self._max_size = max_size
+        self._poll_interval = poll_interval
+        self._visibility_timeout = visibility_timeout
+        self._retention_seconds = retention_seconds
+        self._wakeup: Optional[asyncio.Event] = None
+        self._started = False
+    
+    async def start(self) -> None:
+        """Create schema, prune old jobs and requeue stale ones"""
+        if self._started:
+            return
+        self._started = True
+        self._wakeup = asyncio.Event()
+        
+        now = time.time()
+        
+        def setup(conn: sqlite3.Connection) -> None:
+            conn.executescript(_SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(delivery_jobs)")}
+            if "available_at" not in columns:
+                conn.execute("ALTER TABLE delivery_jobs ADD COLUMN available_at REAL NOT NULL DEFAULT 0")
+            if "priority" not in columns:
+                conn.execute("ALTER TABLE delivery_jobs ADD COLUMN priority INTEGER NOT NULL DEFAULT 1")
+            conn.execute(_PRIORITY_INDEX)
+            conn.execute(
+                "DELETE FROM delivery_jobs WHERE status NOT IN (?, ?) AND updated_at < ?",
+                (DeliveryStatus.QUEUED.value, DeliveryStatus.PROCESSING.value, now - self._retention_seconds)
+            )
+        
+        await self._db.run(setup)
+        await self.recover_stale()
+    
+    async def recover_stale(self) -> int:
+        """Requeue jobs claimed longer ago than the visibility timeout; returns how many.
+        
+        A worker that crashed, or was stopped mid-send, leaves its job in
+        PROCESSING; the job is delivered again, so delivery is at least once.
+        """
+        await self.start()
+        now = time.time()
+        
+        def update(conn: sqlite3.Connection) -> int:
+            return conn.execute(
+                "UPDATE delivery_jobs SET status = ?, updated_at = ?, available_at = 0 WHERE status = ? AND updated_at < ?",
+                (DeliveryStatus.QUEUED.value, now, DeliveryStatus.PROCESSING.value, now - self._visibility_timeout)
+            ).rowcount
+        
+        recovered = await self._db.run(update)
+        if recovered:
+            logger.warning("Requeued %s delivery jobs claimed more than %gs ago", recovered, self._visibility_timeout)
+            self._wakeup.set()
+        return recovered
+    
+    async def enqueue(self, job: DeliveryJobDTO) -> None:
+        """Add a job to the queue"""
+        await self.start()
+        
+        def insert(conn: sqlite3.Connection) -> bool:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                (queued,) = conn.execute(
+                    "SELECT COUNT(*) FROM delivery_jobs WHERE status = ?",
+                    (DeliveryStatus.QUEUED.value,)
+                ).fetchone()
+                if queued >= self._max_size:
+                    conn.execute("ROLLBACK")
+                    return False
+                conn.execute(
+                    "INSERT INTO delivery_jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?)",
+                    (
+                        job.job_id,
+                        json.dumps(job.notification),
+                        json.dumps(job.channels),
+                        job.status,
+                        job.attempts,
+                        None,
+                        None,
+                        job.created_at,
+                        job.updated_at,
+                        PriorityScheduler.clamp(job.priority)
+                    )
+                )
+                conn.execute("COMMIT")
+                return True
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        
+        if not await self._db.run(insert):
+            raise DeliveryQueueFullException(f"Delivery queue is full ({self._max_size} jobs)")
+        self._wakeup.set()
+    
+    async def dequeue(self, min_priority: int = 0) -> DeliveryJobDTO:
+        """Wait for the next job of at least min_priority and mark it as processing"""
+        await self.start()
+        
+        # Without a minimum, oldest-first claims can use the plain status index
+        level_filter = "AND priority >= ?" if min_priority > 0 else ""
+        
+        def claim(order: str) -> Callable[[sqlite3.Connection], Optional[sqlite3.Row]]:
+            def run(conn: sqlite3.Connection) -> Optional[sqlite3.Row]:
+                now = time.time()
+                params = (DeliveryStatus.PROCESSING.value, now, DeliveryStatus.QUEUED.value, now)
+                # Single statement, so two workers can never claim the same job
+                return conn.execute(
+                    f"""
+                    UPDATE delivery_jobs
+                    SET status = ?, attempts = attempts + 1, updated_at = ?
+                    WHERE job_id = (
+                        SELECT job_id FROM delivery_jobs
+                        WHERE status = ? AND available_at <= ? {level_filter}
+                        ORDER BY {order}
+                        LIMIT 1
+                    )
+                    RETURNING *
+                    """,
+                    params + (min_priority,) if level_filter else params
+                ).fetchone()
+            return run
+        
+        while True:
+            self._wakeup.clear()
+            order = "created_at" if self._scheduler.take_oldest() else "priority DESC, created_at"
+            row = await self._db.run(claim(order))
+            if row is not None:
+                return self._row_to_job(row)
+            # Local enqueues wake us up immediately; other processes are picked up by polling
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def requeue(self, job: DeliveryJobDTO, delay: float) -> None:
+        """Put a processing job back in the queue, available after delay seconds"""
+        now = time.time()
+        
+        def update(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                """
+                UPDATE delivery_jobs
+                SET status = ?, channels = ?, result = ?, updated_at = ?, available_at = ?
+                WHERE job_id = ?
+                """,
+                (
+                    DeliveryStatus.QUEUED.value,
+                    json.dumps(job.channels),
+                    json.dumps(job.result) if job.result is not None else None,
+                    now,
+                    now + delay,
+                    job.job_id
+                )
+            )
+        
+        await self._db.run(update)
+    
+    async def complete(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """Record the final outcome of a job"""
+        def update(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "UPDATE delivery_jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE job_id = ?",
+                (status, json.dumps(result) if result is not None else None, error, time.time(), job_id)
+            )
+        
+        await self._db.run(update)
+    
+    async def get_job(self, job_id: str) -> Optional[DeliveryJobDTO]:
+        """Find a job by ID"""
+        await self.start()
+        row = await self._db.run(
+            lambda conn: conn.execute("SELECT * FROM delivery_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        )
+        return self._row_to_job(row) if row is not None else None
+    
+    async def depth(self) -> int:
+        """Number of jobs waiting to be processed"""
+        await self.start()
+        (count,) = await self._db.run(
+            lambda conn: conn.execute(
+                "SELECT COUNT(*) FROM delivery_jobs WHERE status = ?",
+                (DeliveryStatus.QUEUED.value,)
+            ).fetchone()
+        )
+        return count
+    
+    async def depth_by_level(self) -> Dict[str, int]:
+        """Number of jobs waiting to be processed, per log level"""
+        await self.start()
+        rows = await self._db.run(
+            lambda conn: conn.execute(
+                "SELECT priority, COUNT(*) FROM delivery_jobs WHERE status = ? GROUP BY priority",
+                (DeliveryStatus.QUEUED.value,)
+            ).fetchall()
+        )
+        depths = dict.fromkeys(LEVEL_NAMES.values(), 0)
+        for priority, count in rows:
+            depths[LEVEL_NAMES[PriorityScheduler.clamp(priority)]] += count
+        return depths
+    
+    async def close(self) -> None:
+        await self._db.close()
+        self._started = False
+    
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> DeliveryJobDTO:
+        return DeliveryJobDTO(
+            job_id=row["job_id"],
+            notification=json.loads(row["notification"]),
+            channels=json.loads(row["channels"]),
+            status=row["status"],
+            priority=row["priority"],
+            attempts=row["attempts"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
@@ -0,0 +1,95 @@
+import time
+from typing import Dict, List, Optional
+
+from application.dtos.dead_letter_dto import DeadLetterDTO
+from application.interfaces.dead_letter_store import DeadLetterStoreInterface, DeadLetterFilter, DeadLetterPage
+
+class InMemoryDeadLetterStore(DeadLetterStoreInterface):
+    """Bounded per-worker dead letters in arrival order.
+    
+    The oldest letters are evicted once there are more than max_items or
+    they are older than max_age seconds. Queries scan in order, which is
+    fine at the sizes a bounded store reaches.
+    """
+    
+    def __init__(self, max_items: int = 10000, max_age: float = 0):
+        self._max_items = max_items
+        self._max_age = max_age
+        self._seq = 0
+        self._letters: Dict[int, DeadLetterDTO] = {}
+        self._by_id: Dict[str, int] = {}
+    
+    async def add(self, letters: List[DeadLetterDTO]) -> None:
+        """Store dead letters, evicting the oldest over the limits"""
+        for letter in letters:
+            self._seq += 1
+            letter.seq = self._seq
+            self._letters[letter.seq] = letter
+            self._by_id[letter.letter_id] = letter.seq
+        while len(self._letters) > self._max_items:
+            self._evict_oldest()
+        self._evict_expired()
+    
+    def _evict_expired(self) -> None:
+        if self._max_age <= 0:
+            return
+        cutoff = time.time() - self._max_age
+        while self._letters and next(iter(self._letters.values())).failed_at < cutoff:
+            self._evict_oldest()
+    
+    def _evict_oldest(self) -> None:
+        seq = next(iter(self._letters))
+        del self._by_id[self._letters.pop(seq).letter_id]
+    
+    async def find_page(
+        self,
+        letter_filter: DeadLetterFilter,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        oldest_first: bool = False
+    ) -> DeadLetterPage:
+        """Find matching dead letters, newest first unless oldest_first, after an opaque cursor"""
+        self._evict_expired()
+        after = self._decode_cursor(cursor)
+        seqs = iter(self._letters) if oldest_first else reversed(self._letters)
+        
+        items: List[DeadLetterDTO] = []
+        next_cursor = None
+        for seq in seqs:
+            if after is not None and (seq <= after if oldest_first else seq >= after):
+                continue
+            letter = self._letters[seq]
+            if not letter_filter.matches(letter):
+                continue
+            if len(items) == limit:
+                next_cursor = format(items[-1].seq, "x")
+                break
+            items.append(letter)
+        # Copies, so callers changing a letter do not change the store behind update()
+        return DeadLetterPage([DeadLetterDTO.from_dict(letter.to_dict()) for letter in items], next_cursor)
+    
+    async def update(self, letter: DeadLetterDTO) -> None:
+        """Record the outcome of a failed replay (error, attempts, replays)"""
+        if letter.letter_id in self._by_id:
+            self._letters[letter.seq] = letter
+    
+    async def remove(self, letter_ids: List[str]) -> None:
+        """Drop dead letters, once replayed successfully"""
+        for letter_id in letter_ids:
+            seq = self._by_id.pop(letter_id, None)
+            if seq is not None:
+                del self._letters[seq]
+    
+    async def count(self) -> int:
+        """Number of stored dead letters"""
+        self._evict_expired()
+        return len(self._letters)
+    
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Optional[int]:
+        if not cursor:
+            return None
+        try:
+            return int(cursor, 16)
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}")
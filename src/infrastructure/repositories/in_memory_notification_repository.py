@@ -1,24 +1,223 @@
-from typing import Dict, List, Optional
-from uuid import UUID
-
-from domain.entities.notification import Notification
-from domain.repositories.notification_repository import NotificationRepositoryInterface
-
-class InMemoryNotificationRepository(NotificationRepositoryInterface):
-    
-    def __init__(self):
-        self._notifications: Dict[UUID, Notification] = {}
-    
-    async def save(self, notification: Notification) -> None:
-        """Save notification to in-memory storage"""
-        self._notifications[notification.id] = notification
-    
-    async def find_by_id(self, notification_id: UUID) -> Optional[Notification]:
-        """Find notification by ID"""
-        return self._notifications.get(notification_id)
-    
-    async def find_all(self, limit: int = 100, offset: int = 0) -> List[Notification]:
-        """Find all notifications with pagination"""
-        notifications = list(self._notifications.values())
-        notifications.sort(key=lambda n: n.timestamp, reverse=True)
-        return notifications[offset:offset + limit]
\ No newline at end of file
+import json
+import sys
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from domain.entities.notification import Notification
+from domain.repositories.notification_repository import NotificationRepositoryInterface, NotificationPage
+from domain.value_objects.log_level import LogLevel
+
+T = TypeVar("T")
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _to_epoch_us(timestamp: datetime) -> int:
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+class _StoredNotification:
+    """Compact form of a stored notification.
+    
+    No per-instance __dict__; the id is kept as its 128-bit int, the
+    timestamp as integer microseconds since the epoch, the message as UTF-8
+    bytes and metadata as compact JSON (None when empty). Level is the shared
+    LogLevel member and source an interned string. A full Notification is
+    only rebuilt for the items a query returns.
+    """
+    
+    __slots__ = ("seq", "id", "title", "body", "metadata", "level", "source", "epoch_us")
+    
+    def __init__(self, seq: int, notification: Notification):
+        self.seq = seq
+        self.id = notification.id.int
+        self.level = notification.level
+        self.source = sys.intern(notification.source) if notification.source else None
+        self.epoch_us = _to_epoch_us(notification.timestamp)
+        self.update(notification)
+    
+    def update(self, notification: Notification) -> None:
+        self.title = notification.title
+        self.body = notification.message.encode()
+        self.metadata = (
+            json.dumps(notification.metadata, separators=(",", ":"), default=str).encode()
+            if notification.metadata else None
+        )
+    
+    def to_notification(self) -> Notification:
+        metadata: Dict[str, Any] = json.loads(self.metadata) if self.metadata else {}
+        return Notification(
+            id=UUID(int=self.id),
+            title=self.title,
+            message=self.body.decode(),
+            level=self.level,
+            metadata=metadata,
+            timestamp=_EPOCH + timedelta(microseconds=self.epoch_us),
+            source=self.source
+        )
+
+class _SequenceLog(Generic[T]):
+    """Append-only ring of (sequence, item) pairs trimmed from the front.
+    
+    Sequences are increasing, so positions can be found by bisection.
+    """
+    
+    def __init__(self):
+        self._seqs: List[int] = []
+        self._items: List[T] = []
+        self._start = 0
+    
+    def __len__(self) -> int:
+        return len(self._seqs) - self._start
+    
+    def append(self, seq: int, item: T) -> None:
+        self._seqs.append(seq)
+        self._items.append(item)
+    
+    def first(self) -> Tuple[int, T]:
+        return self._seqs[self._start], self._items[self._start]
+    
+    def popleft(self) -> Tuple[int, T]:
+        entry = self.first()
+        self._items[self._start] = None
+        self._start += 1
+        # Reclaim the dead prefix once it dominates the lists
+        if self._start > 1024 and self._start * 2 > len(self._seqs):
+            del self._seqs[:self._start]
+            del self._items[:self._start]
+            self._start = 0
+        return entry
+    
+    def iter_before(self, seq: Optional[int] = None) -> Iterator[Tuple[int, T]]:
+        """Yield entries newest first, starting below seq"""
+        end = len(self._seqs) if seq is None else bisect_left(self._seqs, seq, self._start)
+        for index in range(end - 1, self._start - 1, -1):
+            yield self._seqs[index], self._items[index]
+
+class InMemoryNotificationRepository(NotificationRepositoryInterface):
+    """Bounded store kept in arrival order, with indexes on level and source.
+    
+    The oldest notifications are evicted once there are more than max_items
+    or they are older than max_age seconds. Queries walk the smallest
+    matching index from the newest entry, so they never sort or scan the
+    whole store. Notifications are kept as _StoredNotification records.
+    """
+    
+    def __init__(self, max_items: int = 100000, max_age: float = 0):
+        self._max_items = max_items
+        self._max_age_us = int(max_age * 1_000_000) if max_age > 0 else None
+        self._seq = 0
+        self._log: _SequenceLog[_StoredNotification] = _SequenceLog()
+        self._by_id: Dict[int, _StoredNotification] = {}
+        self._by_level: Dict[LogLevel, _SequenceLog[_StoredNotification]] = {}
+        self._by_source: Dict[str, _SequenceLog[_StoredNotification]] = {}
+    
+    async def save(self, notification: Notification) -> None:
+        """Save notification to in-memory storage"""
+        existing = self._by_id.get(notification.id.int)
+        if existing is not None:
+            # Same notification saved again: keep its position, refresh the content
+            existing.update(notification)
+            return
+        
+        self._seq += 1
+        record = _StoredNotification(self._seq, notification)
+        self._log.append(self._seq, record)
+        self._by_id[record.id] = record
+        self._by_level.setdefault(record.level, _SequenceLog()).append(self._seq, record)
+        if record.source:
+            self._by_source.setdefault(record.source, _SequenceLog()).append(self._seq, record)
+        
+        while len(self._log) > self._max_items:
+            self._evict_oldest()
+        self._evict_expired()
+    
+    def _evict_expired(self) -> None:
+        if self._max_age_us is None:
+            return
+        cutoff = _to_epoch_us(datetime.utcnow()) - self._max_age_us
+        while len(self._log) and self._log.first()[1].epoch_us < cutoff:
+            self._evict_oldest()
+    
+    def _evict_oldest(self) -> None:
+        _, record = self._log.popleft()
+        del self._by_id[record.id]
+        # Eviction is in arrival order, so the record heads its index logs too
+        self._popleft_index(self._by_level, record.level)
+        if record.source:
+            self._popleft_index(self._by_source, record.source)
+    
+    @staticmethod
+    def _popleft_index(index: Dict, key) -> None:
+        log = index[key]
+        log.popleft()
+        if not len(log):
+            del index[key]
+    
+    async def find_by_id(self, notification_id: UUID) -> Optional[Notification]:
+        """Find notification by ID"""
+        record = self._by_id.get(notification_id.int)
+        return record.to_notification() if record else None
+    
+    async def find_all(self, limit: int = 100, offset: int = 0) -> List[Notification]:
+        """Find all notifications with pagination"""
+        result = []
+        for index, (_, record) in enumerate(self._log.iter_before()):
+            if index >= offset + limit:
+                break
+            if index >= offset:
+                result.append(record.to_notification())
+        return result
+    
+    async def find_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        level: Optional[LogLevel] = None,
+        source: Optional[str] = None
+    ) -> NotificationPage:
+        """Find notifications newest first, filtered, continuing after an opaque cursor"""
+        self._evict_expired()
+        before = self._decode_cursor(cursor)
+        
+        # Walk the smallest log that satisfies one filter and check the other
+        candidates = [self._log]
+        if level is not None:
+            candidates.append(self._by_level.get(level, _SequenceLog()))
+        if source is not None:
+            candidates.append(self._by_source.get(source, _SequenceLog()))
+        log = min(candidates, key=len)
+        
+        records: List[_StoredNotification] = []
+        next_cursor = None
+        for _, record in log.iter_before(before):
+            if level is not None and record.level is not level:
+                continue
+            if source is not None and record.source != source:
+                continue
+            if len(records) == limit:
+                next_cursor = self._encode_cursor(records[-1].seq)
+                break
+            records.append(record)
+        return NotificationPage([record.to_notification() for record in records], next_cursor)
+    
+    async def count(self) -> int:
+        """Number of stored notifications"""
+        self._evict_expired()
+        return len(self._log)
+    
+    @staticmethod
+    def _encode_cursor(seq: int) -> str:
+        return format(seq, "x")
+    
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Optional[int]:
+        if not cursor:
+            return None
+        try:
+            return int(cursor, 16)
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}")
@@ -0,0 +1,198 @@
+import json
+import logging
+import sqlite3
+import time
+from typing import Any, List, Optional, Tuple
+
+from application.dtos.dead_letter_dto import DeadLetterDTO
+from application.interfaces.dead_letter_store import DeadLetterStoreInterface, DeadLetterFilter, DeadLetterPage
+from infrastructure.persistence.sqlite_connection import SqliteConnection
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dead_letters (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    notification TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    destination_name TEXT,
+    config TEXT,
+    error TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    replays INTEGER NOT NULL DEFAULT 0,
+    failed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_dead_letters_channel ON dead_letters (channel, seq);
+CREATE INDEX IF NOT EXISTS idx_dead_letters_destination ON dead_letters (destination, seq);
+CREATE INDEX IF NOT EXISTS idx_dead_letters_failed_at ON dead_letters (failed_at);
+"""
+
+_INSERT = """
+INSERT INTO dead_letters (id, notification, channel, destination, destination_name, config, error, attempts, replays, failed_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+class SqliteDeadLetterStore(DeadLetterStoreInterface):
+    """Dead letters in a SQLite file (WAL) shared by all workers on the host.
+    
+    Letters survive restarts, so a replay can be started from any worker
+    after an outage. Retention (max_items, max_age) is enforced on writes,
+    at most every prune_interval seconds.
+    """
+    
+    def __init__(self, path: str, max_items: int = 10000, max_age: float = 0, prune_interval: float = 60.0):
+        self._db = SqliteConnection(path)
+        self._max_items = max_items
+        self._max_age = max_age
+        self._prune_interval = prune_interval
+        self._next_prune = 0.0
+        self._ready = False
+    
+    async def start(self) -> None:
+        """Create schema"""
+        if self._ready:
+            return
+        await self._db.run(lambda conn: conn.executescript(_SCHEMA))
+        self._ready = True
+    
+    async def close(self) -> None:
+        await self._db.close()
+        self._ready = False
+    
+    async def add(self, letters: List[DeadLetterDTO]) -> None:
+        """Store dead letters in one transaction, pruning now and then"""
+        await self.start()
+        rows = [self._to_row(letter) for letter in letters]
+        prune = time.monotonic() >= self._next_prune
+        if prune:
+            self._next_prune = time.monotonic() + self._prune_interval
+        
+        def write(conn: sqlite3.Connection) -> List[int]:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                seqs = [conn.execute(_INSERT, row).lastrowid for row in rows]
+                if prune:
+                    self._prune(conn)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return seqs
+        
+        for letter, seq in zip(letters, await self._db.run(write)):
+            letter.seq = seq
+    
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        deleted = 0
+        if self._max_age > 0:
+            deleted += conn.execute(
+                "DELETE FROM dead_letters WHERE failed_at < ?", (time.time() - self._max_age,)
+            ).rowcount
+        if self._max_items > 0:
+            deleted += conn.execute(
+                """
+                DELETE FROM dead_letters WHERE seq <= (
+                    SELECT seq FROM dead_letters ORDER BY seq DESC LIMIT 1 OFFSET ?
+                )
+                """,
+                (self._max_items,)
+            ).rowcount
+        if deleted:
+            logger.debug("Pruned %s dead letters", deleted)
+    
+    async def find_page(
+        self,
+        letter_filter: DeadLetterFilter,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        oldest_first: bool = False
+    ) -> DeadLetterPage:
+        """Find matching dead letters, newest first unless oldest_first, after an opaque cursor"""
+        conditions = []
+        params: List[Any] = []
+        if cursor:
+            try:
+                params.append(int(cursor, 16))
+            except ValueError:
+                raise ValueError(f"Invalid cursor: {cursor}")
+            conditions.append("seq > ?" if oldest_first else "seq < ?")
+        if letter_filter.channel is not None:
+            conditions.append("channel = ?")
+            params.append(letter_filter.channel)
+        if letter_filter.destination is not None:
+            conditions.append("(destination = ? OR destination_name = ?)")
+            params.extend([letter_filter.destination, letter_filter.destination])
+        if letter_filter.since is not None:
+            conditions.append("failed_at >= ?")
+            params.append(letter_filter.since)
+        if letter_filter.until is not None:
+            conditions.append("failed_at < ?")
+            params.append(letter_filter.until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        order = "ASC" if oldest_first else "DESC"
+        # One extra row tells whether there is a next page
+        params.append(limit + 1)
+        
+        await self.start()
+        rows = await self._db.run(lambda conn: conn.execute(
+            f"SELECT * FROM dead_letters {where} ORDER BY seq {order} LIMIT ?", params
+        ).fetchall())
+        
+        next_cursor = format(rows[limit - 1]["seq"], "x") if len(rows) > limit else None
+        return DeadLetterPage([self._from_row(row) for row in rows[:limit]], next_cursor)
+    
+    async def update(self, letter: DeadLetterDTO) -> None:
+        """Record the outcome of a failed replay (error, attempts, replays)"""
+        await self.start()
+        await self._db.run(lambda conn: conn.execute(
+            "UPDATE dead_letters SET error = ?, attempts = ?, replays = ? WHERE id = ?",
+            (letter.error, letter.attempts, letter.replays, letter.letter_id)
+        ))
+    
+    async def remove(self, letter_ids: List[str]) -> None:
+        """Drop dead letters, once replayed successfully"""
+        await self.start()
+        await self._db.run(lambda conn: conn.executemany(
+            "DELETE FROM dead_letters WHERE id = ?", [(letter_id,) for letter_id in letter_ids]
+        ))
+    
+    async def count(self) -> int:
+        """Number of stored dead letters"""
+        await self.start()
+        (stored,) = await self._db.run(
+            lambda conn: conn.execute("SELECT COUNT(*) FROM dead_letters").fetchone()
+        )
+        return stored
+    
+    @staticmethod
+    def _to_row(letter: DeadLetterDTO) -> Tuple[Any, ...]:
+        return (
+            letter.letter_id,
+            json.dumps(letter.notification, default=str),
+            letter.channel,
+            letter.destination,
+            letter.destination_name,
+            json.dumps(letter.config) if letter.config is not None else None,
+            letter.error,
+            letter.attempts,
+            letter.replays,
+            letter.failed_at
+        )
+    
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> DeadLetterDTO:
+        return DeadLetterDTO(
+            letter_id=row["id"],
+            notification=json.loads(row["notification"]),
+            channel=row["channel"],
+            destination=row["destination"],
+            destination_name=row["destination_name"],
+            config=json.loads(row["config"]) if row["config"] is not None else None,
+            error=row["error"],
+            attempts=row["attempts"],
+            replays=row["replays"],
+            failed_at=row["failed_at"],
+            seq=row["seq"]
+        )
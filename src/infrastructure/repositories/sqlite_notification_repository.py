@@ -0,0 +1,255 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from typing import Dict, Any, List, Optional, Tuple
+from uuid import UUID
+
+from domain.entities.notification import Notification
+from domain.repositories.notification_repository import NotificationRepositoryInterface, NotificationPage
+from domain.value_objects.log_level import LogLevel
+from infrastructure.persistence.sqlite_connection import SqliteConnection
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    message TEXT NOT NULL,
+    level TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    source TEXT,
+    timestamp TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_notifications_level ON notifications (level, seq);
+CREATE INDEX IF NOT EXISTS idx_notifications_source ON notifications (source, seq);
+CREATE INDEX IF NOT EXISTS idx_notifications_created_at ON notifications (created_at);
+"""
+
+_UPSERT = """
+INSERT INTO notifications (id, title, message, level, metadata, source, timestamp, created_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    title = excluded.title,
+    message = excluded.message,
+    level = excluded.level,
+    metadata = excluded.metadata,
+    source = excluded.source,
+    timestamp = excluded.timestamp
+"""
+
+class SqliteNotificationRepository(NotificationRepositoryInterface):
+    """Notification history in a SQLite file (WAL) shared by all workers on the host.
+    
+    save() only buffers the notification; a background task writes buffered
+    notifications in batched transactions every flush_interval seconds, or
+    as soon as batch_size are pending. Reads flush this worker's buffer
+    first, so a worker always sees its own writes. Retention (max_items,
+    max_age) is enforced by the same task every prune_interval seconds.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        max_items: int = 100000,
+        max_age: float = 0,
+        flush_interval: float = 0.05,
+        batch_size: int = 500,
+        max_pending: int = 10000,
+        prune_interval: float = 60.0
+    ):
+        self._db = SqliteConnection(path)
+        self._max_items = max_items
+        self._max_age = max_age
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._max_pending = max_pending
+        self._prune_interval = prune_interval
+        self._pending: Dict[UUID, Notification] = {}
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self) -> None:
+        """Create schema and start the write-behind task"""
+        if self._task is not None:
+            return
+        self._flush_lock = asyncio.Lock()
+        self._batch_ready = asyncio.Event()
+        await self._db.run(lambda conn: conn.executescript(_SCHEMA))
+        self._task = asyncio.create_task(self._run(), name="notification-store-writer")
+    
+    async def close(self) -> None:
+        """Write everything still buffered and close the database"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            await self._flush()
+        await self._db.close()
+    
+    async def save(self, notification: Notification) -> None:
+        """Buffer notification for the next batched write"""
+        await self.start()
+        self._pending[notification.id] = notification
+        if len(self._pending) >= self._batch_size:
+            self._batch_ready.set()
+        if len(self._pending) >= self._max_pending:
+            # Writer is falling behind: apply backpressure instead of growing without bound
+            await self._flush()
+    
+    async def _run(self) -> None:
+        next_prune = time.monotonic()
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            try:
+                await self._flush()
+                if time.monotonic() >= next_prune:
+                    next_prune = time.monotonic() + self._prune_interval
+                    await self._prune()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Notification store write failed: %s", e)
+    
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+        async with self._flush_lock:
+            while self._pending:
+                batch = list(self._pending.values())[:self._batch_size]
+                rows = [self._to_row(notification) for notification in batch]
+                
+                def write(conn: sqlite3.Connection) -> None:
+                    conn.execute("BEGIN IMMEDIATE")
+                    try:
+                        conn.executemany(_UPSERT, rows)
+                        conn.execute("COMMIT")
+                    except Exception:
+                        conn.execute("ROLLBACK")
+                        raise
+                
+                await self._db.run(write)
+                for notification in batch:
+                    # Keep it buffered if it was saved again while being written
+                    if self._pending.get(notification.id) is notification:
+                        del self._pending[notification.id]
+    
+    async def _prune(self) -> None:
+        def prune(conn: sqlite3.Connection) -> int:
+            deleted = 0
+            if self._max_age > 0:
+                deleted += conn.execute(
+                    "DELETE FROM notifications WHERE created_at < ?",
+                    (time.time() - self._max_age,)
+                ).rowcount
+            if self._max_items > 0:
+                deleted += conn.execute(
+                    """
+                    DELETE FROM notifications WHERE seq <= (
+                        SELECT seq FROM notifications ORDER BY seq DESC LIMIT 1 OFFSET ?
+                    )
+                    """,
+                    (self._max_items,)
+                ).rowcount
+            return deleted
+        
+        deleted = await self._db.run(prune)
+        if deleted:
+            logger.debug("Pruned %s notifications", deleted)
+    
+    @staticmethod
+    def _to_row(notification: Notification) -> Tuple[Any, ...]:
+        return (
+            str(notification.id),
+            notification.title,
+            notification.message,
+            notification.level.value,
+            json.dumps(notification.metadata, default=str),
+            notification.source,
+            notification.timestamp.isoformat(),
+            time.time()
+        )
+    
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> Notification:
+        return Notification.from_dict({
+            "id": row["id"],
+            "title": row["title"],
+            "message": row["message"],
+            "level": row["level"],
+            "metadata": json.loads(row["metadata"]),
+            "source": row["source"],
+            "timestamp": row["timestamp"]
+        })
+    
+    async def find_by_id(self, notification_id: UUID) -> Optional[Notification]:
+        """Find notification by ID"""
+        pending = self._pending.get(notification_id)
+        if pending is not None:
+            return pending
+        await self.start()
+        row = await self._db.run(lambda conn: conn.execute(
+            "SELECT * FROM notifications WHERE id = ?", (str(notification_id),)
+        ).fetchone())
+        return self._from_row(row) if row else None
+    
+    async def find_all(self, limit: int = 100, offset: int = 0) -> List[Notification]:
+        """Find all notifications with pagination"""
+        await self.start()
+        await self._flush()
+        rows = await self._db.run(lambda conn: conn.execute(
+            "SELECT * FROM notifications ORDER BY seq DESC LIMIT ? OFFSET ?", (limit, offset)
+        ).fetchall())
+        return [self._from_row(row) for row in rows]
+    
+    async def find_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        level: Optional[LogLevel] = None,
+        source: Optional[str] = None
+    ) -> NotificationPage:
+        """Find notifications newest first, filtered, continuing after an opaque cursor"""
+        conditions = []
+        params: List[Any] = []
+        if cursor:
+            try:
+                params.append(int(cursor, 16))
+            except ValueError:
+                raise ValueError(f"Invalid cursor: {cursor}")
+            conditions.append("seq < ?")
+        if level is not None:
+            conditions.append("level = ?")
+            params.append(level.value)
+        if source is not None:
+            conditions.append("source = ?")
+            params.append(source)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        # One extra row tells whether there is a next page
+        params.append(limit + 1)
+        
+        await self.start()
+        await self._flush()
+        rows = await self._db.run(lambda conn: conn.execute(
+            f"SELECT * FROM notifications {where} ORDER BY seq DESC LIMIT ?", params
+        ).fetchall())
+        
+        next_cursor = format(rows[limit - 1]["seq"], "x") if len(rows) > limit else None
+        return NotificationPage([self._from_row(row) for row in rows[:limit]], next_cursor)
+    
+    async def count(self) -> int:
+        """Number of stored notifications, counting this worker's unwritten ones"""
+        await self.start()
+        (stored,) = await self._db.run(
+            lambda conn: conn.execute("SELECT COUNT(*) FROM notifications").fetchone()
+        )
+        return stored + len(self._pending)
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Optional
+
+logger = logging.getLogger(__name__)
+
+class BackgroundEventLoop:
+    """Persistent per-worker event loop running in a daemon thread.
+
+    Loop-bound resources (HTTP sessions, queues, limiters) live on this loop
+    for the lifetime of the worker instead of one loop per request. Under an
+    ASGI server the loop can instead be attached to the server's own loop.
+    """
+
+    def __init__(self, name: str = "notification-loop"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id: Optional[int] = None
+        self._started = threading.Event()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self.start()
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    @property
+    def thread_id(self) -> Optional[int]:
+        """Ident of the thread running the loop, once it runs"""
+        return self._thread_id
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Use an externally managed loop (e.g. the ASGI server loop).
+
+        Must be called from the thread running that loop.
+        """
+        if self._thread is not None:
+            raise RuntimeError("Cannot attach: background loop thread already running")
+        self._loop = loop
+        self._thread_id = threading.get_ident()
+        logger.debug("Event loop '%s' attached to external loop", self._name)
+
+    def start(self) -> None:
+        """Start the loop thread if it is not running yet"""
+        if self._thread is not None or self._loop is not None:
+            return
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_forever, name=self._name, daemon=True)
+        self._thread.start()
+        self._started.wait()
+        logger.debug("Event loop '%s' started", self._name)
+
+    def _run_forever(self) -> None:
+        self._thread_id = threading.get_ident()
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(self._started.set)
+        self._loop.run_forever()
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and block until it completes.
+
+        Must not be called from the loop's own thread.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return future.result(timeout)
+
+    def submit(self, coro: Awaitable[Any]) -> "asyncio.Future[Any]":
+        """Schedule a coroutine on the loop without waiting for it"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the loop and join its thread"""
+        if self._thread is None:
+            # Externally managed loops are owned by the server
+            self._loop = None
+            self._thread_id = None
+            return
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        if not self._loop.is_running():
+            self._loop.close()
+        self._loop = None
+        self._thread = None
+        self._thread_id = None
+        self._started.clear()
+        logger.debug("Event loop '%s' stopped", self._name)
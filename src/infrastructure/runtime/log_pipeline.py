@@ -0,0 +1,210 @@
+import json
+import logging
+import logging.handlers
+import queue
+import re
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Attributes every LogRecord has; anything else was passed in extra=
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+class SecretRedactor:
+    """Masks credentials in log text: webhook URLs and Telegram bot tokens.
+    
+    Everything after one of the webhook prefixes is a secret (a Slack webhook
+    URL is its own credential), as is anything shaped like a bot token.
+    """
+    
+    def __init__(self, webhook_prefixes: Sequence[str] = ("https://hooks.slack.com/",)):
+        patterns = [f"{re.escape(prefix)}[^\\s\"'<>]+" for prefix in webhook_prefixes if prefix]
+        # Bot tokens are "<bot id>:<secret>", and appear in API paths as /bot<token>/
+        patterns.append(r"/bot[^/\s\"'<>]+/")
+        patterns.append(r"\b\d{5,}:[A-Za-z0-9_-]{20,}")
+        self._pattern = re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+        self._prefixes = tuple(prefix for prefix in webhook_prefixes if prefix)
+    
+    def redact(self, text: str) -> str:
+        return self._pattern.sub(self._mask, text)
+    
+    def _mask(self, match: "re.Match[str]") -> str:
+        secret = match.group(0)
+        for prefix in self._prefixes:
+            if secret.startswith(prefix):
+                return f"{prefix}[REDACTED]"
+        if secret.startswith("/bot"):
+            return "/bot[REDACTED]/"
+        return "[REDACTED]"
+
+class RedactingFormatter(logging.Formatter):
+    """Plain text log lines with secrets masked"""
+    
+    def __init__(self, redactor: SecretRedactor, fmt: str = TEXT_FORMAT):
+        super().__init__(fmt)
+        self._redactor = redactor
+    
+    def format(self, record: logging.LogRecord) -> str:
+        return self._redactor.redact(super().format(record))
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per log line, with secrets masked.
+    
+    Fields passed with extra= are added to the object, so callers can log
+    structured context (e.g. extra={"notification_id": ...}).
+    """
+    
+    def __init__(self, redactor: SecretRedactor):
+        super().__init__()
+        self._redactor = redactor
+    
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": self._redactor.redact(record.getMessage())
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                data[key] = self._redactor.redact(value) if isinstance(value, str) else value
+        if record.exc_info:
+            data["exception"] = self._redactor.redact(self.formatException(record.exc_info))
+        if record.stack_info:
+            data["stack"] = self._redactor.redact(self.formatStack(record.stack_info))
+        if orjson is not None:
+            return orjson.dumps(data, default=str).decode()
+        return json.dumps(data, default=str)
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to a bounded queue, dropping (and counting) them when it is full.
+    
+    Records are queued as they are: the message is formatted on the listener
+    thread, so logging arguments must not be mutated after the call.
+    """
+    
+    def __init__(self, capacity: int):
+        super().__init__(queue.Queue(capacity))
+        self.dropped = 0
+        self._lock = threading.Lock()
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+class _ReportingListener(logging.handlers.QueueListener):
+    """Queue listener that logs how many records were dropped since it last looked"""
+    
+    def __init__(self, queue_handler: BoundedQueueHandler, handler: logging.Handler):
+        super().__init__(queue_handler.queue, handler, respect_handler_level=True)
+        self._queue_handler = queue_handler
+        self._reported = 0
+    
+    def handle(self, record: logging.LogRecord) -> None:
+        dropped = self._queue_handler.dropped
+        if dropped != self._reported:
+            super().handle(logging.LogRecord(
+                __name__, logging.WARNING, __file__, 0,
+                "Dropped %s log records: logging queue full", (dropped - self._reported,), None
+            ))
+            self._reported = dropped
+        super().handle(record)
+    
+    def enqueue_sentinel(self) -> None:
+        # Waits for room instead of failing on a full queue: the listener is draining it
+        self.queue.put(self._sentinel)
+
+class LogPipeline:
+    """Logging off the request path.
+    
+    The root logger only gets a queue handler, so a log call costs an enqueue;
+    a listener thread formats, redacts and writes the records. The queue holds
+    at most capacity records; beyond that records are dropped and counted
+    rather than blocking the caller.
+    """
+    
+    def __init__(self, handler: logging.Handler, capacity: int = 10000):
+        self.handler = handler
+        self.capacity = capacity
+        self.queue_handler = BoundedQueueHandler(capacity)
+        self._listener = _ReportingListener(self.queue_handler, handler)
+        self._running = False
+    
+    def start(self) -> None:
+        if not self._running:
+            self._listener.start()
+            self._running = True
+    
+    def stop(self) -> None:
+        """Write out queued records and join the listener thread"""
+        if self._running:
+            self._running = False
+            self._listener.stop()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queue_handler.queue.qsize(),
+            "capacity": self.capacity,
+            "dropped": self.queue_handler.dropped
+        }
+
+# Root handler installed by configure_logging, replaced when it runs again
+_installed: Dict[str, Any] = {"handler": None, "pipeline": None}
+
+def configure_logging(
+    level: str = "INFO",
+    log_format: str = "json",
+    queue_size: int = 10000,
+    webhook_prefixes: Sequence[str] = ("https://hooks.slack.com/",)
+) -> Optional[LogPipeline]:
+    """Log to stderr as JSON (or text), through a LogPipeline unless queue_size is 0.
+    
+    Like logging.basicConfig, leaves the root logger alone if something else
+    already configured it. Returns the pipeline, to be stopped at shutdown.
+    """
+    root = logging.getLogger()
+    if _installed["handler"] is not None:
+        root.removeHandler(_installed["handler"])
+        if _installed["pipeline"] is not None:
+            _installed["pipeline"].stop()
+        _installed["handler"] = _installed["pipeline"] = None
+    if root.handlers:
+        return None
+    
+    redactor = SecretRedactor(webhook_prefixes)
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(JsonFormatter(redactor) if log_format == "json" else RedactingFormatter(redactor))
+    root.setLevel(getattr(logging, level))
+    
+    pipeline = None
+    handler: logging.Handler = stream
+    if queue_size > 0:
+        pipeline = LogPipeline(stream, queue_size)
+        pipeline.start()
+        handler = pipeline.queue_handler
+    root.addHandler(handler)
+    _installed.update(handler=handler, pipeline=pipeline)
+    return pipeline
+
+def stop_logging(pipeline: LogPipeline) -> None:
+    """Stop a pipeline, writing to its handler directly from then on"""
+    root = logging.getLogger()
+    if _installed["pipeline"] is pipeline:
+        root.removeHandler(pipeline.queue_handler)
+        root.addHandler(pipeline.handler)
+        _installed.update(handler=pipeline.handler, pipeline=None)
+    pipeline.stop()
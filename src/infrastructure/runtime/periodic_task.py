@@ -0,0 +1,37 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+class PeriodicTask:
+    """Runs a coroutine function every `interval` seconds on the running loop"""
+    
+    def __init__(self, name: str, interval: float, fn: Callable[[], Awaitable[Any]]):
+        self._name = name
+        self._interval = interval
+        self._fn = fn
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self._name)
+    
+    async def stop(self, run_once: bool = False) -> None:
+        """Cancel the task, optionally running the function a last time"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if run_once:
+            await self._fn()
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self._fn()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Periodic task '%s' failed: %s", self._name, e)
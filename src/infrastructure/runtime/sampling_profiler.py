@@ -0,0 +1,111 @@
+import itertools
+import logging
+import os
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class SamplingProfiler:
+    """Samples the call stacks of 1 in every N requests into collapsed-stack files.
+    
+    While a sampled request runs, a daemon thread snapshots the stacks of the
+    request's thread and of the event loop thread every interval seconds.
+    When the request ends the stacks are appended to
+    <output_dir>/profile-<pid>.folded as "frame;frame;... count" lines rooted
+    at the route, ready for flamegraph.pl or speedscope. The event loop is
+    shared, so its samples include whatever else the worker was doing.
+    """
+    
+    def __init__(
+        self,
+        every: int,
+        interval: float = 0.002,
+        output_dir: str = "data/profiles",
+        loop_thread_id: Callable[[], Optional[int]] = lambda: None
+    ):
+        self.every = every
+        self.interval = interval
+        self.output_dir = output_dir
+        self._loop_thread_id = loop_thread_id
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+        self._stats = {"profiled": 0, "samples": 0}
+    
+    def start(self, name: str) -> Optional["ProfileSession"]:
+        """Start sampling the calling thread if this request is the Nth; None otherwise"""
+        if next(self._counter) % self.every:
+            return None
+        threads = [("request", threading.get_ident())]
+        loop_thread_id = self._loop_thread_id()
+        if loop_thread_id is not None and loop_thread_id != threads[0][1]:
+            threads.append(("event-loop", loop_thread_id))
+        session = ProfileSession(self, name, threads)
+        session.start()
+        return session
+    
+    def write(self, stacks: Counter) -> None:
+        """Append collapsed stacks to this worker's profile file"""
+        if not stacks:
+            return
+        # Resolved on each write: gunicorn may fork workers after the app is created
+        path = os.path.join(self.output_dir, f"profile-{os.getpid()}.folded")
+        lines = "".join(f"{stack} {count}\n" for stack, count in stacks.items())
+        with self._lock:
+            try:
+                os.makedirs(self.output_dir, exist_ok=True)
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+            except OSError as e:
+                logger.error("Error writing profile to %s: %s", path, e)
+                return
+            self._stats["profiled"] += 1
+            self._stats["samples"] += sum(stacks.values())
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._stats, "every": self.every, "output_dir": self.output_dir}
+
+class ProfileSession:
+    """Sampling of one request, from start() until stop()"""
+    
+    def __init__(self, profiler: SamplingProfiler, name: str, threads: List[Tuple[str, int]]):
+        self._profiler = profiler
+        # Frames are separated by semicolons in the collapsed format
+        self._root = name.replace(";", ":")
+        self._threads = threads
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+    
+    def start(self) -> None:
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop sampling; the stacks are written by the sampling thread, off the request path"""
+        self._stop.set()
+    
+    def _run(self) -> None:
+        stacks: Counter = Counter()
+        while True:
+            frames = sys._current_frames()
+            for role, thread_id in self._threads:
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    stacks[self._collapse(role, frame)] += 1
+            del frames
+            if self._stop.wait(self._profiler.interval):
+                break
+        self._profiler.write(stacks)
+    
+    def _collapse(self, role: str, frame: Optional[FrameType]) -> str:
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            name = getattr(code, "co_qualname", code.co_name)
+            labels.append(f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        labels.append(role)
+        labels.append(self._root)
+        return ";".join(reversed(labels))
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Set, Tuple
+
+class OpBatcher:
+    """Runs the operations submitted during one event loop iteration as one batch.
+    
+    Concurrent sends each need a state operation or two; batching them turns
+    N round trips (or N transactions) into one, so callers share the cost
+    instead of queueing behind each other. run_batch returns one result per
+    operation, where an exception instance fails only that operation.
+    """
+    
+    def __init__(self, run_batch: Callable[[List[Any]], Awaitable[List[Any]]], max_batch: int = 256):
+        self._run_batch = run_batch
+        self._max_batch = max_batch
+        self._pending: List[Tuple[Any, "asyncio.Future[Any]"]] = []
+        self._scheduled = False
+        self._tasks: Set["asyncio.Task[None]"] = set()
+    
+    async def submit(self, op: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((op, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif not self._scheduled:
+            # Runs after every callback already due in this iteration has had its turn to submit
+            self._scheduled = True
+            loop.call_soon(self._flush)
+        return await future
+    
+    def _flush(self) -> None:
+        self._scheduled = False
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: List[Tuple[Any, "asyncio.Future[Any]"]]) -> None:
+        try:
+            results = await self._run_batch([op for op, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    
+    async def drain(self) -> None:
+        """Wait for batches in flight"""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
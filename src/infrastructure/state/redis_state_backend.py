@@ -0,0 +1,180 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import redis.asyncio as redis
+
+from application.interfaces.state_backend import StateBackendInterface, PaceLimit
+from infrastructure.state.op_batcher import OpBatcher
+
+# ARGV is the value and the TTL in milliseconds (0 for none). Returns the
+# live value instead of overwriting it.
+_SET_IF_ABSENT_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+    return current
+end
+if tonumber(ARGV[2]) > 0 then
+    redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+return false
+"""
+
+# ARGV is the amount and the TTL in milliseconds set on a new counter (0 for none)
+_INCR_SCRIPT = """
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if tonumber(ARGV[2]) > 0 and redis.call('PTTL', KEYS[1]) == -1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return value
+"""
+
+# GCRA on the server clock, so every worker paces against the same time. KEYS
+# are the limits; ARGV is the max wait, then rate and burst per limit. A key
+# expires when its arrival time passes, which is the same as a fresh limit.
+_PACE_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local wait = 0
+local tats = {}
+for i = 1, #KEYS do
+    local rate = tonumber(ARGV[i * 2])
+    local burst = tonumber(ARGV[i * 2 + 1])
+    local tat = math.max(tonumber(redis.call('GET', KEYS[i]) or '0'), now)
+    tats[i] = tat
+    wait = math.max(wait, tat - (burst - 1) / rate - now)
+end
+if wait <= tonumber(ARGV[1]) then
+    for i = 1, #KEYS do
+        local tat = tats[i] + 1 / tonumber(ARGV[i * 2])
+        redis.call('SET', KEYS[i], string.format('%.6f', tat), 'PX', math.ceil((tat - now) * 1000) + 1)
+    end
+end
+return string.format('%.6f', wait)
+"""
+
+# ARGV is rate, burst and the seconds to hold the next slot for
+_BLOCK_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local tolerance = (tonumber(ARGV[2]) - 1) / tonumber(ARGV[1])
+local tat = math.max(tonumber(redis.call('GET', KEYS[1]) or '0'), now + tonumber(ARGV[3]) + tolerance)
+redis.call('SET', KEYS[1], string.format('%.6f', tat), 'PX', math.ceil((tat - now) * 1000) + 1)
+return 1
+"""
+
+# An operation queues exactly one command on the pipeline and parses its reply
+_Op = Tuple[Callable[[Any], Awaitable[Any]], Callable[[Any], Any]]
+
+def _ms(ttl: Optional[float]) -> int:
+    return max(1, int(ttl * 1000)) if ttl else 0
+
+def _identity(reply: Any) -> Any:
+    return reply
+
+class RedisStateBackend(StateBackendInterface):
+    """State on any Redis-protocol server, shared across hosts.
+    
+    Operations submitted in the same event loop iteration go out as one
+    pipeline, so concurrent sends share a round trip. Compound operations
+    (set-if-absent, counters with a TTL, pacing) are Lua scripts, atomic on
+    the server.
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "notification-broker:state",
+        max_batch: int = 256,
+        client: Optional[redis.Redis] = None
+    ):
+        self._url = url
+        self._prefix = prefix
+        # An existing client (such as a fakeredis stand-in) is used instead of connecting to url
+        self._client: Optional[redis.Redis] = client
+        self._scripts: Dict[str, Any] = {}
+        self._batcher = OpBatcher(self._run_batch, max_batch=max_batch)
+        self._stats = {"batches": 0, "ops": 0}
+    
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = redis.from_url(self._url, decode_responses=True)
+        if not self._scripts:
+            for name, script in (
+                ("set_if_absent", _SET_IF_ABSENT_SCRIPT),
+                ("incr", _INCR_SCRIPT),
+                ("pace", _PACE_SCRIPT),
+                ("block", _BLOCK_SCRIPT)
+            ):
+                self._scripts[name] = self._client.register_script(script)
+    
+    async def close(self) -> None:
+        await self._batcher.drain()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._scripts = {}
+    
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+    
+    async def _run_batch(self, ops: List[_Op]) -> List[Any]:
+        await self.start()
+        self._stats["batches"] += 1
+        self._stats["ops"] += len(ops)
+        async with self._client.pipeline(transaction=False) as pipe:
+            for queue, _ in ops:
+                await queue(pipe)
+            replies = await pipe.execute(raise_on_error=False)
+        return [reply if isinstance(reply, Exception) else parse(reply) for (_, parse), reply in zip(ops, replies)]
+    
+    def _script(self, name: str, keys: List[str], args: List[Any]) -> Callable[[Any], Awaitable[Any]]:
+        async def queue(pipe: Any) -> Any:
+            return await self._scripts[name](keys=keys, args=args, client=pipe)
+        return queue
+    
+    async def get(self, key: str) -> Optional[str]:
+        async def queue(pipe: Any) -> Any:
+            return pipe.get(self._key(key))
+        return await self._batcher.submit((queue, _identity))
+    
+    async def set(
+        self,
+        key: str,
+        value: str,
+        ttl: Optional[float] = None,
+        only_if_absent: bool = False
+    ) -> Optional[str]:
+        if only_if_absent:
+            queue = self._script("set_if_absent", [self._key(key)], [value, _ms(ttl)])
+            return await self._batcher.submit((queue, _identity))
+        
+        async def queue(pipe: Any) -> Any:
+            return pipe.set(self._key(key), value, px=_ms(ttl) or None)
+        return await self._batcher.submit((queue, lambda reply: None))
+    
+    async def pop(self, key: str) -> Optional[str]:
+        async def queue(pipe: Any) -> Any:
+            return pipe.getdel(self._key(key))
+        return await self._batcher.submit((queue, _identity))
+    
+    async def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        queue = self._script("incr", [self._key(key)], [amount, _ms(ttl)])
+        return await self._batcher.submit((queue, int))
+    
+    async def pace(self, limits: Sequence[PaceLimit], max_wait: float) -> float:
+        if not limits:
+            return 0.0
+        args: List[Any] = [max_wait]
+        for _, rate, burst in limits:
+            args.extend([rate, burst])
+        queue = self._script("pace", [self._key(key) for key, _, _ in limits], args)
+        return await self._batcher.submit((queue, float))
+    
+    async def block(self, limit: PaceLimit, seconds: float) -> None:
+        key, rate, burst = limit
+        queue = self._script("block", [self._key(key)], [rate, burst, seconds])
+        await self._batcher.submit((queue, lambda reply: None))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": "redis", **self._stats}
@@ -0,0 +1,159 @@
+import sqlite3
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from application.interfaces.state_backend import StateBackendInterface, PaceLimit
+from application.services.in_memory_state_backend import slot_wait, blocked_tat
+from infrastructure.persistence.sqlite_connection import SqliteConnection
+from infrastructure.state.op_batcher import OpBatcher
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_state_expires_at ON state (expires_at);
+"""
+
+# An operation runs inside the batch transaction with the batch's clock
+_Op = Callable[[sqlite3.Connection, float], Any]
+
+def _read(conn: sqlite3.Connection, key: str, now: float) -> Optional[Tuple[str, Optional[float]]]:
+    row = conn.execute("SELECT value, expires_at FROM state WHERE key = ?", (key,)).fetchone()
+    if row is None or (row[1] is not None and row[1] <= now):
+        return None
+    return row[0], row[1]
+
+def _write(conn: sqlite3.Connection, key: str, value: Any, expires_at: Optional[float]) -> None:
+    conn.execute("INSERT OR REPLACE INTO state (key, value, expires_at) VALUES (?, ?, ?)", (key, str(value), expires_at))
+
+def _tat(conn: sqlite3.Connection, key: str, now: float) -> float:
+    row = _read(conn, key, now)
+    return now if row is None else max(float(row[0]), now)
+
+class SqliteStateBackend(StateBackendInterface):
+    """State in a SQLite file (WAL) shared by all workers on the host.
+    
+    Operations submitted in the same event loop iteration run in one
+    transaction on the connection thread, so a burst of concurrent sends
+    costs one thread hop and one commit. Point the path at a tmpfs such as
+    /dev/shm to keep it in memory. Expired keys are purged at most every
+    purge_interval seconds.
+    """
+    
+    def __init__(self, path: str, purge_interval: float = 60.0, max_batch: int = 256):
+        self._db = SqliteConnection(path)
+        self._batcher = OpBatcher(self._run_batch, max_batch=max_batch)
+        self._purge_interval = purge_interval
+        self._next_purge = 0.0
+        self._ready = False
+        self._stats = {"batches": 0, "ops": 0}
+    
+    async def start(self) -> None:
+        """Create schema"""
+        if self._ready:
+            return
+        await self._db.run(lambda conn: conn.executescript(_SCHEMA))
+        self._ready = True
+    
+    async def close(self) -> None:
+        await self._batcher.drain()
+        await self._db.close()
+        self._ready = False
+    
+    async def _run_batch(self, ops: List[_Op]) -> List[Any]:
+        await self.start()
+        purge = time.monotonic() >= self._next_purge
+        if purge:
+            self._next_purge = time.monotonic() + self._purge_interval
+        self._stats["batches"] += 1
+        self._stats["ops"] += len(ops)
+        
+        def run(conn: sqlite3.Connection) -> List[Any]:
+            now = time.time()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                results = []
+                for op in ops:
+                    try:
+                        results.append(op(conn, now))
+                    except sqlite3.Error:
+                        raise
+                    except Exception as e:
+                        # e.g. incr on a value that is not a number
+                        results.append(e)
+                if purge:
+                    conn.execute("DELETE FROM state WHERE expires_at <= ?", (now,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return results
+        
+        return await self._db.run(run)
+    
+    async def get(self, key: str) -> Optional[str]:
+        def op(conn: sqlite3.Connection, now: float) -> Optional[str]:
+            row = _read(conn, key, now)
+            return None if row is None else row[0]
+        
+        return await self._batcher.submit(op)
+    
+    async def set(
+        self,
+        key: str,
+        value: str,
+        ttl: Optional[float] = None,
+        only_if_absent: bool = False
+    ) -> Optional[str]:
+        def op(conn: sqlite3.Connection, now: float) -> Optional[str]:
+            if only_if_absent:
+                row = _read(conn, key, now)
+                if row is not None:
+                    return row[0]
+            _write(conn, key, value, now + ttl if ttl else None)
+            return None
+        
+        return await self._batcher.submit(op)
+    
+    async def pop(self, key: str) -> Optional[str]:
+        def op(conn: sqlite3.Connection, now: float) -> Optional[str]:
+            row = _read(conn, key, now)
+            conn.execute("DELETE FROM state WHERE key = ?", (key,))
+            return None if row is None else row[0]
+        
+        return await self._batcher.submit(op)
+    
+    async def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        def op(conn: sqlite3.Connection, now: float) -> int:
+            row = _read(conn, key, now) or ("0", now + ttl if ttl else None)
+            value = int(row[0]) + amount
+            _write(conn, key, value, row[1])
+            return value
+        
+        return await self._batcher.submit(op)
+    
+    async def pace(self, limits: Sequence[PaceLimit], max_wait: float) -> float:
+        def op(conn: sqlite3.Connection, now: float) -> float:
+            tats = [_tat(conn, key, now) for key, _, _ in limits]
+            wait = max((slot_wait(tat, now, rate, burst) for tat, (_, rate, burst) in zip(tats, limits)), default=0.0)
+            if wait <= max_wait:
+                for tat, (key, rate, _) in zip(tats, limits):
+                    tat += 1 / rate
+                    _write(conn, key, tat, tat)
+            return wait
+        
+        return await self._batcher.submit(op)
+    
+    async def block(self, limit: PaceLimit, seconds: float) -> None:
+        key, rate, burst = limit
+        
+        def op(conn: sqlite3.Connection, now: float) -> None:
+            tat = blocked_tat(_tat(conn, key, now), now, rate, burst, seconds)
+            _write(conn, key, tat, tat)
+        
+        await self._batcher.submit(op)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": "sqlite", **self._stats}
@@ -0,0 +1,131 @@
+import logging
+from flask import Blueprint, request, jsonify
+from typing import Dict, Any
+
+from interface.middlewares.auth_middleware import require_api_key
+from interface.exceptions.api_exceptions import APIException, ValidationException, NotFoundException
+from application.interfaces.dead_letter_service import DeadLetterServiceInterface
+from domain.exceptions.domain_exceptions import InvalidNotificationDataException
+from infrastructure.config.settings import Settings
+from infrastructure.runtime.event_loop import BackgroundEventLoop
+
+logger = logging.getLogger(__name__)
+
+class DeadLetterController:
+    """Lists deliveries that failed for good and replays them in bulk"""
+    
+    def __init__(
+        self,
+        dead_letter_service: DeadLetterServiceInterface,
+        settings: Settings,
+        event_loop: BackgroundEventLoop
+    ):
+        self.dead_letter_service = dead_letter_service
+        self.settings = settings
+        self.event_loop = event_loop
+        self.blueprint = self._create_blueprint()
+    
+    def _create_blueprint(self) -> Blueprint:
+        """Create Flask blueprint with routes"""
+        bp = Blueprint("dead_letters", __name__, url_prefix="/api/v1/notifications/dead-letters")
+        
+        @bp.route("", methods=["GET"])
+        @require_api_key(self.settings)
+        def list_dead_letters():
+            return self._list_dead_letters()
+        
+        @bp.route("/stats", methods=["GET"])
+        @require_api_key(self.settings)
+        def stats():
+            return jsonify({"success": True, "data": self.event_loop.run(self.dead_letter_service.get_stats())})
+        
+        @bp.route("/replay", methods=["POST"])
+        @require_api_key(self.settings)
+        def replay():
+            return self._start_replay()
+        
+        @bp.route("/replays/<uuid:replay_id>", methods=["GET"])
+        @require_api_key(self.settings)
+        def get_replay(replay_id):
+            replay = self.dead_letter_service.get_replay(str(replay_id))
+            if replay is None:
+                raise NotFoundException(f"Replay {replay_id} not found")
+            return jsonify({"success": True, "data": replay})
+        
+        @bp.route("/replays/<uuid:replay_id>", methods=["DELETE"])
+        @require_api_key(self.settings)
+        def cancel_replay(replay_id):
+            replay = self.event_loop.run(self._cancel(str(replay_id)))
+            if replay is None:
+                raise NotFoundException(f"Replay {replay_id} not found")
+            return jsonify({"success": True, "data": replay})
+        
+        @bp.errorhandler(APIException)
+        def handle_api_exception(e: APIException):
+            return jsonify(e.to_dict()), e.status_code, e.headers
+        
+        @bp.errorhandler(Exception)
+        def handle_general_exception(e: Exception):
+            logger.error("Unhandled exception: %s", e)
+            return jsonify({"error": "Internal server error"}), 500
+        
+        return bp
+    
+    def _list_dead_letters(self) -> Dict[str, Any]:
+        """Handle dead letter listing with filters and cursor pagination"""
+        try:
+            limit = int(request.args.get("limit", 50))
+        except ValueError:
+            raise ValidationException("limit must be an integer")
+        if not 1 <= limit <= self.settings.QUERY_MAX_LIMIT:
+            raise ValidationException(f"limit must be between 1 and {self.settings.QUERY_MAX_LIMIT}")
+        
+        try:
+            page = self.event_loop.run(self.dead_letter_service.list_dead_letters(
+                limit=limit,
+                cursor=request.args.get("cursor"),
+                channel=request.args.get("channel"),
+                destination=request.args.get("destination"),
+                since=request.args.get("since"),
+                until=request.args.get("until")
+            ))
+        except InvalidNotificationDataException as e:
+            raise ValidationException(str(e))
+        
+        return jsonify({"success": True, "data": page})
+    
+    def _start_replay(self) -> Any:
+        """Start a throttled background replay of the dead letters matching the body's filter"""
+        data = request.get_json(silent=True)
+        if data is None:
+            data = {}
+        if not isinstance(data, dict):
+            raise ValidationException("Request body must be a JSON object")
+        
+        fields = {"channel", "destination", "since", "until", "limit"}
+        unknown = sorted(set(data) - fields)
+        if unknown:
+            raise ValidationException(f"Unknown fields: {', '.join(unknown)}")
+        limit = data.get("limit")
+        if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int)):
+            raise ValidationException("limit must be an integer")
+        for name in ("channel", "destination"):
+            if data.get(name) is not None and not isinstance(data[name], str):
+                raise ValidationException(f"{name} must be a string")
+        
+        try:
+            replay = self.event_loop.run(self.dead_letter_service.start_replay(
+                channel=data.get("channel"),
+                destination=data.get("destination"),
+                since=data.get("since"),
+                until=data.get("until"),
+                limit=limit
+            ))
+        except InvalidNotificationDataException as e:
+            raise ValidationException(str(e))
+        
+        return jsonify({"success": True, "data": replay}), 202
+    
+    async def _cancel(self, replay_id: str) -> Any:
+        # Cancelled on the loop running the replay
+        return self.dead_letter_service.cancel_replay(replay_id)
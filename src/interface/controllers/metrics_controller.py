@@ -0,0 +1,20 @@
+from flask import Blueprint, Response
+
+from application.interfaces.metrics import MetricsInterface
+
+class MetricsController:
+    """Prometheus scrape endpoint"""
+    
+    def __init__(self, metrics: MetricsInterface):
+        self.metrics = metrics
+        self.blueprint = self._create_blueprint()
+    
+    def _create_blueprint(self) -> Blueprint:
+        bp = Blueprint("metrics", __name__)
+        
+        @bp.route("/metrics", methods=["GET"])
+        def metrics():
+            body, content_type = self.metrics.export()
+            return Response(body, content_type=content_type)
+        
+        return bp
@@ -1,81 +1,418 @@
-import asyncio
-import logging
-from flask import Blueprint, request, jsonify
-from typing import Dict, Any
-
-from interface.middlewares.auth_middleware import require_api_key
-from interface.serializers.notification_serializers import NotificationSerializer
-from interface.exceptions.api_exceptions import APIException, ValidationException
-from application.interfaces.notification_service import NotificationServiceInterface
-from infrastructure.config.settings import Settings
-
-logger = logging.getLogger(__name__)
-
-class NotificationController:
-    
-    def __init__(
-        self,
-        notification_service: NotificationServiceInterface,
-        settings: Settings
-    ):
-        self.notification_service = notification_service
-        self.settings = settings
-        self.blueprint = self._create_blueprint()
-    
-    def _create_blueprint(self) -> Blueprint:
-        """Create Flask blueprint with routes"""
-        bp = Blueprint("notifications", __name__, url_prefix="/api/v1/notifications")
-        
-        @bp.route("/send", methods=["POST"])
-        @require_api_key(self.settings)
-        def send_notification():
-            return asyncio.run(self._send_notification())
-        
-        @bp.route("/health", methods=["GET"])
-        def health_check():
-            return jsonify({"status": "healthy", "service": "notification-broker"})
-        
-        @bp.errorhandler(APIException)
-        def handle_api_exception(e: APIException):
-            return jsonify({"error": e.message}), e.status_code
-        
-        @bp.errorhandler(Exception)
-        def handle_general_exception(e: Exception):
-            logger.error(f"Unhandled exception: {str(e)}")
-            return jsonify({"error": "Internal server error"}), 500
-        
-        return bp
-    
-    async def _send_notification(self) -> Dict[str, Any]:
-        """Handle send notification request"""
-        try:
-            # Parse request data
-            data = request.get_json()
-            if not data:
-                raise ValidationException("Request body is required")
-            
-            # Extract channel configs from headers
-            headers = request.headers
-            if headers.get("Slack-Webhook-Url"):
-                data["slack_webhook_url"] = headers.get("Slack-Webhook-Url")
-            if headers.get("Telegram-Bot-Token"):
-                data["telegram_bot_token"] = headers.get("Telegram-Bot-Token")
-            if headers.get("Telegram-Chat-Id"):
-                data["telegram_chat_id"] = headers.get("Telegram-Chat-Id")
-            
-            # Deserialize and validate
-            dto = NotificationSerializer.deserialize_send_request(data)
-            
-            # Send notification
-            result = await self.notification_service.send_notification(dto)
-            
-            return jsonify({
-                "success": True,
-                "data": result
-            }), 201
-            
-        except APIException:
-            raise
-        except Exception as e:
-            logger.error(f"Error processing notification request: {str(e)}")
-            raise APIException(f"Failed to process notification: {str(e)}")
\ No newline at end of file
+import hashlib
+import json
+import logging
+from collections import deque
+from flask import Blueprint, Response, g, request, jsonify, stream_with_context
+from typing import Dict, Any, Awaitable, BinaryIO, Callable, Deque, Iterator, Optional, Tuple
+
+from interface.middlewares.auth_middleware import require_api_key
+from interface.serializers import json_codec
+from interface.serializers.notification_serializers import NotificationSerializer
+from interface.exceptions.api_exceptions import (
+    APIException,
+    ValidationException,
+    NotFoundException,
+    ServiceUnavailableException,
+    TooManyRequestsException,
+    UnprocessableEntityException
+)
+from application.interfaces.notification_service import NotificationServiceInterface
+from application.interfaces.notification_query_service import NotificationQueryServiceInterface
+from application.dtos.notification_dto import SendNotificationDTO
+from application.services.idempotency_cache import IdempotencyCache
+from application.services.load_shedder import LoadShedder
+from application.services.request_timing import stage_timer
+from domain.exceptions.domain_exceptions import (
+    DeliveryQueueFullException,
+    IdempotencyKeyMismatchException,
+    InvalidNotificationDataException,
+    LoadShedException
+)
+from domain.value_objects.log_level import LogLevel
+from infrastructure.config.settings import Settings
+from infrastructure.runtime.event_loop import BackgroundEventLoop
+from infrastructure.runtime.log_pipeline import LogPipeline
+
+logger = logging.getLogger(__name__)
+
+class NotificationController:
+    
+    def __init__(
+        self,
+        notification_service: NotificationServiceInterface,
+        settings: Settings,
+        event_loop: BackgroundEventLoop,
+        query_service: Optional[NotificationQueryServiceInterface] = None,
+        idempotency_cache: Optional[IdempotencyCache] = None,
+        load_shedder: Optional[LoadShedder] = None,
+        log_pipeline: Optional[LogPipeline] = None
+    ):
+        self.notification_service = notification_service
+        self.query_service = query_service
+        self.idempotency_cache = idempotency_cache
+        self.load_shedder = load_shedder
+        self.log_pipeline = log_pipeline
+        self.settings = settings
+        self.event_loop = event_loop
+        self.blueprint = self._create_blueprint()
+    
+    def _create_blueprint(self) -> Blueprint:
+        """Create Flask blueprint with routes"""
+        bp = Blueprint("notifications", __name__, url_prefix="/api/v1/notifications")
+        
+        @bp.route("/send", methods=["POST"])
+        @require_api_key(self.settings)
+        def send_notification():
+            return self._send_notification()
+        
+        @bp.route("/send/batch", methods=["POST"])
+        @require_api_key(self.settings)
+        def send_batch():
+            return self._send_batch()
+        
+        @bp.route("/send/stream", methods=["POST"])
+        @require_api_key(self.settings)
+        def send_stream():
+            return self._send_stream()
+        
+        @bp.route("", methods=["GET"])
+        @require_api_key(self.settings)
+        def list_notifications():
+            return self._list_notifications()
+        
+        @bp.route("/<uuid:notification_id>", methods=["GET"])
+        @require_api_key(self.settings)
+        def get_notification(notification_id):
+            notification = None
+            if self.query_service is not None:
+                notification = self.event_loop.run(self.query_service.get_notification(str(notification_id)))
+            if notification is None:
+                raise NotFoundException(f"Notification {notification_id} not found")
+            return jsonify({"success": True, "data": notification})
+        
+        @bp.route("/<uuid:notification_id>/status", methods=["GET"])
+        @require_api_key(self.settings)
+        def delivery_status(notification_id):
+            status = self.event_loop.run(self.notification_service.get_delivery_status(str(notification_id)))
+            if status is None:
+                raise NotFoundException(f"No delivery found for notification {notification_id}")
+            return jsonify({"success": True, "data": status})
+        
+        @bp.route("/stats", methods=["GET"])
+        @require_api_key(self.settings)
+        def stats():
+            data = self.notification_service.get_stats()
+            if self.idempotency_cache is not None:
+                data["idempotency"] = self.idempotency_cache.get_stats()
+            if self.load_shedder is not None:
+                data["admission"] = self.load_shedder.get_stats()
+            if self.log_pipeline is not None:
+                data["logging"] = self.log_pipeline.get_stats()
+            return jsonify({"success": True, "data": data})
+        
+        @bp.route("/health", methods=["GET"])
+        def health_check():
+            return jsonify({"status": "healthy", "service": "notification-broker"})
+        
+        @bp.errorhandler(APIException)
+        def handle_api_exception(e: APIException):
+            return jsonify(e.to_dict()), e.status_code, e.headers
+        
+        @bp.errorhandler(Exception)
+        def handle_general_exception(e: Exception):
+            logger.error("Unhandled exception: %s", e)
+            return jsonify({"error": "Internal server error"}), 500
+        
+        return bp
+    
+    def _send_notification(self) -> Dict[str, Any]:
+        """Handle send notification request"""
+        try:
+            # Parse request data
+            with stage_timer("parse"):
+                data = request.get_json()
+            if not data:
+                raise ValidationException("Request body is required")
+            
+            # Extract channel configs from headers
+            data.update(self._header_channel_fields())
+            
+            # Deserialize and validate
+            with stage_timer("validate"):
+                dto = NotificationSerializer.deserialize_send_request(
+                    data,
+                    max_destinations=self.settings.FANOUT_MAX_DESTINATIONS
+                )
+            
+            wants_async = self._wants_async_delivery()
+            api_key = g.api_key
+            
+            async def deliver() -> Tuple[Dict[str, Any], int]:
+                # Admitted here, so a replayed Idempotency-Key is answered without using quota or capacity
+                with stage_timer("admission"):
+                    shed = self._admit(dto, api_key)
+                if shed is not None:
+                    raise shed
+                
+                try:
+                    # Opt-in asynchronous delivery: queue it and answer immediately
+                    if wants_async:
+                        result = await self.notification_service.enqueue_notification(dto)
+                        return {"success": True, "data": result}, 200 if result.get("suppressed") else 202
+                    
+                    result = await self.notification_service.send_notification(dto)
+                    
+                    # Suppressed duplicates were counted, not created
+                    return {"success": True, "data": result}, 200 if result.get("suppressed") else 201
+                finally:
+                    self._release(1)
+            
+            # Send notification on the worker's persistent event loop
+            return self._run_idempotent(deliver)
+            
+        except APIException:
+            raise
+        except InvalidNotificationDataException as e:
+            raise ValidationException(str(e))
+        except DeliveryQueueFullException as e:
+            raise ServiceUnavailableException(str(e))
+        except Exception as e:
+            logger.error("Error processing notification request: %s", e)
+            raise APIException(f"Failed to process notification: {str(e)}")
+    
+    def _list_notifications(self) -> Dict[str, Any]:
+        """Handle notification listing with filters and cursor pagination"""
+        if self.query_service is None:
+            raise NotFoundException("Notification queries are not enabled")
+        
+        try:
+            limit = int(request.args.get("limit", 50))
+        except ValueError:
+            raise ValidationException("limit must be an integer")
+        if not 1 <= limit <= self.settings.QUERY_MAX_LIMIT:
+            raise ValidationException(f"limit must be between 1 and {self.settings.QUERY_MAX_LIMIT}")
+        
+        try:
+            page = self.event_loop.run(self.query_service.list_notifications(
+                limit=limit,
+                cursor=request.args.get("cursor"),
+                level=request.args.get("level"),
+                source=request.args.get("source")
+            ))
+        except InvalidNotificationDataException as e:
+            raise ValidationException(str(e))
+        
+        return jsonify({"success": True, "data": page})
+    
+    def _send_batch(self) -> Dict[str, Any]:
+        """Handle batch send request"""
+        try:
+            with stage_timer("parse"):
+                data = request.get_json()
+            if not data:
+                raise ValidationException("Request body is required")
+            
+            # Header channel configs act as defaults for every item
+            with stage_timer("validate"):
+                items = NotificationSerializer.deserialize_batch_request(
+                    data,
+                    defaults=self._header_channel_fields(),
+                    max_size=self.settings.BATCH_MAX_SIZE,
+                    max_destinations=self.settings.FANOUT_MAX_DESTINATIONS
+                )
+            
+            api_key = g.api_key
+            
+            async def deliver() -> Tuple[Dict[str, Any], int]:
+                # Items shed by admission control are reported like invalid ones; a replay skips admission
+                with stage_timer("admission"):
+                    admitted = [
+                        self._admit(item, api_key) or item if isinstance(item, SendNotificationDTO) else item
+                        for item in items
+                    ]
+                dtos = [item for item in admitted if isinstance(item, SendNotificationDTO)]
+                if not dtos and all(isinstance(item, TooManyRequestsException) for item in admitted):
+                    raise admitted[0]
+                
+                try:
+                    sent = iter(await self.notification_service.send_batch(dtos) if dtos else [])
+                finally:
+                    self._release(len(dtos))
+                
+                # Merge validation errors and send results back into input order
+                results = []
+                for item in admitted:
+                    if isinstance(item, APIException):
+                        results.append({"success": False, **item.to_dict()})
+                    else:
+                        results.append(next(sent))
+                
+                succeeded = sum(1 for result in results if result["success"])
+                return {
+                    "success": True,
+                    "data": {
+                        "total": len(results),
+                        "succeeded": succeeded,
+                        "failed": len(results) - succeeded,
+                        "results": results
+                    }
+                }, 200
+            
+            return self._run_idempotent(deliver)
+            
+        except APIException:
+            raise
+        except Exception as e:
+            logger.error("Error processing batch request: %s", e)
+            raise APIException(f"Failed to process batch: {str(e)}")
+    
+    def _send_stream(self) -> Response:
+        """Handle an NDJSON stream: one notification per line, one result line back per line.
+        
+        Lines are read and dispatched while the body is still arriving. At most
+        STREAM_MAX_IN_FLIGHT deliveries are pending at a time and results are
+        written in input order, so memory stays flat however long the stream is.
+        """
+        if request.mimetype not in ("application/x-ndjson", "application/jsonl"):
+            raise ValidationException("Content-Type must be application/x-ndjson")
+        
+        defaults = self._header_channel_fields()
+        if self._wants_async_delivery():
+            deliver = self.notification_service.enqueue_notification
+        else:
+            deliver = self.notification_service.send_notification
+        max_line_bytes = self.settings.STREAM_MAX_LINE_BYTES
+        max_in_flight = self.settings.STREAM_MAX_IN_FLIGHT
+        stream = request.stream
+        
+        def generate() -> Iterator[str]:
+            pending: Deque[Tuple[int, Any]] = deque()
+            counts = {"succeeded": 0, "failed": 0}
+            
+            def result_line(number: int, outcome: Any) -> str:
+                if isinstance(outcome, dict):
+                    result = outcome
+                else:
+                    try:
+                        result = {"success": True, "data": outcome.result()}
+                    except Exception as e:
+                        result = {"success": False, "error": str(e)}
+                counts["succeeded" if result["success"] else "failed"] += 1
+                return json_codec.dumps({"line": number, **result}) + "\n"
+            
+            for number, line in enumerate(self._read_lines(stream, max_line_bytes), start=1):
+                if line is None:
+                    pending.append((number, {"success": False, "error": f"Line exceeds {max_line_bytes} bytes"}))
+                elif line.strip():
+                    try:
+                        dto = NotificationSerializer.deserialize_stream_line(
+                            line,
+                            defaults=defaults,
+                            max_destinations=self.settings.FANOUT_MAX_DESTINATIONS
+                        )
+                        shed = self._admit(dto, g.api_key)
+                        if shed is not None:
+                            pending.append((number, {"success": False, **shed.to_dict()}))
+                        else:
+                            future = self.event_loop.submit(deliver(dto))
+                            future.add_done_callback(lambda _: self._release(1))
+                            pending.append((number, future))
+                    except ValidationException as e:
+                        pending.append((number, {"success": False, **e.to_dict()}))
+                
+                # Write out finished results; block on the oldest only when the window is full
+                while pending and (len(pending) >= max_in_flight or self._is_finished(pending[0][1])):
+                    yield result_line(*pending.popleft())
+            
+            while pending:
+                yield result_line(*pending.popleft())
+            yield json_codec.dumps({"summary": {"total": sum(counts.values()), **counts}}) + "\n"
+        
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+    
+    @staticmethod
+    def _read_lines(stream: BinaryIO, max_bytes: int) -> Iterator[Optional[bytes]]:
+        """Yield body lines as they arrive; None stands for a line over max_bytes, which is skipped"""
+        while True:
+            line = stream.readline(max_bytes + 1)
+            if not line:
+                return
+            if len(line) > max_bytes and not line.endswith(b"\n"):
+                while line and not line.endswith(b"\n"):
+                    line = stream.readline(max_bytes + 1)
+                yield None
+                continue
+            yield line
+    
+    @staticmethod
+    def _is_finished(outcome: Any) -> bool:
+        return isinstance(outcome, dict) or outcome.done()
+    
+    def _run_idempotent(self, deliver: Callable[[], Awaitable[Tuple[Dict[str, Any], int]]]) -> Any:
+        """Run a send on the event loop, or replay the response cached for its Idempotency-Key"""
+        key = request.headers.get("Idempotency-Key")
+        if not key or self.idempotency_cache is None:
+            body, status = self.event_loop.run(deliver())
+            return jsonify(body), status
+        
+        if len(key) > 255:
+            raise ValidationException("Idempotency-Key must be at most 255 characters")
+        
+        # The same key must come with the same request
+        fingerprint = hashlib.sha256(json.dumps([
+            self._wants_async_delivery(),
+            self._header_channel_fields(),
+            request.get_data(as_text=True)
+        ]).encode()).hexdigest()
+        
+        # Keys are scoped to the API key, so producers cannot see or collide with each other's
+        # responses; the API key is hashed to keep it out of the shared state backend
+        producer = hashlib.sha256(g.api_key.encode()).hexdigest()[:16]
+        try:
+            (body, status), replayed = self.event_loop.run(
+                self.idempotency_cache.run(f"{producer}:{request.path}:{key}", fingerprint, deliver)
+            )
+        except IdempotencyKeyMismatchException:
+            raise UnprocessableEntityException(f"Idempotency-Key {key} was already used for a different request")
+        
+        response = jsonify(body)
+        if replayed:
+            response.headers["Idempotent-Replayed"] = "true"
+        return response, status
+    
+    def _admit(self, dto: SendNotificationDTO, api_key: str) -> Optional[TooManyRequestsException]:
+        """Run one notification through admission control; a returned exception means it was shed"""
+        if self.load_shedder is None:
+            return None
+        try:
+            self.load_shedder.admit(api_key, LogLevel(dto.level.upper()).priority)
+        except LoadShedException as e:
+            return TooManyRequestsException(e.message, e.retry_after)
+        return None
+    
+    def _release(self, count: int) -> None:
+        """Mark admitted notifications as finished"""
+        if self.load_shedder is not None and count:
+            self.load_shedder.release(count)
+    
+    @staticmethod
+    def _wants_async_delivery() -> bool:
+        """Async mode via ?async=true, X-Async-Delivery: true or Prefer: respond-async"""
+        if request.args.get("async", "").lower() in ("true", "1"):
+            return True
+        if request.headers.get("X-Async-Delivery", "").lower() in ("true", "1"):
+            return True
+        return "respond-async" in request.headers.get("Prefer", "")
+    
+    @staticmethod
+    def _header_channel_fields() -> Dict[str, str]:
+        """Extract channel configs passed as headers"""
+        headers = request.headers
+        fields = {}
+        if headers.get("Slack-Webhook-Url"):
+            fields["slack_webhook_url"] = headers.get("Slack-Webhook-Url")
+        if headers.get("Telegram-Bot-Token"):
+            fields["telegram_bot_token"] = headers.get("Telegram-Bot-Token")
+        if headers.get("Telegram-Chat-Id"):
+            fields["telegram_chat_id"] = headers.get("Telegram-Chat-Id")
+        return fields
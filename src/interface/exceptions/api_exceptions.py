@@ -1,16 +1,54 @@
-class APIException(Exception):
-    """Base API exception"""
-    def __init__(self, message: str, status_code: int = 500):
-        self.message = message
-        self.status_code = status_code
-        super().__init__(self.message)
-
-class AuthenticationException(APIException):
-    """Authentication failed exception"""
-    def __init__(self, message: str = "Invalid or missing API key"):
-        super().__init__(message, 401)
-
-class ValidationException(APIException):
-    """Request validation exception"""
-    def __init__(self, message: str):
-        super().__init__(message, 400)
\ No newline at end of file
+import math
+from typing import Any, Dict, List, Optional
+
+class APIException(Exception):
+    """Base API exception"""
+    def __init__(self, message: str, status_code: int = 500):
+        self.message = message
+        self.status_code = status_code
+        self.headers: Dict[str, str] = {}
+        super().__init__(self.message)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"error": self.message}
+
+class AuthenticationException(APIException):
+    """Authentication failed exception"""
+    def __init__(self, message: str = "Invalid or missing API key"):
+        super().__init__(message, 401)
+
+class ValidationException(APIException):
+    """Request validation exception, optionally with per-field details"""
+    def __init__(self, message: str, details: Optional[List[Dict[str, str]]] = None):
+        super().__init__(message, 400)
+        self.details = details
+    
+    def to_dict(self) -> Dict[str, Any]:
+        if not self.details:
+            return super().to_dict()
+        return {"error": self.message, "details": self.details}
+
+class NotFoundException(APIException):
+    """Resource not found exception"""
+    def __init__(self, message: str = "Resource not found"):
+        super().__init__(message, 404)
+
+class ServiceUnavailableException(APIException):
+    """Service temporarily unable to accept work"""
+    def __init__(self, message: str):
+        super().__init__(message, 503)
+
+class UnprocessableEntityException(APIException):
+    """Well-formed request that cannot be processed as sent"""
+    def __init__(self, message: str):
+        super().__init__(message, 422)
+
+class TooManyRequestsException(APIException):
+    """Request not admitted right now; the client should retry later"""
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message, 429)
+        self.retry_after = retry_after
+        self.headers = {"Retry-After": str(max(1, math.ceil(retry_after)))}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"error": self.message, "retry_after": round(self.retry_after, 3)}
@@ -1,27 +1,36 @@
-from functools import wraps
-from flask import request, jsonify
-from typing import Callable
-
-from interface.exceptions.api_exceptions import AuthenticationException
-from infrastructure.config.settings import Settings
-
-def require_api_key(settings: Settings) -> Callable:
-    """Decorator to require API key authentication"""
-    def decorator(f: Callable) -> Callable:
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            api_key = request.headers.get("X-API-Key") or request.headers.get("Authorization")
-            
-            if not api_key:
-                raise AuthenticationException("API key is required")
-            
-            # Remove 'Bearer ' prefix if present
-            if api_key.startswith("Bearer "):
-                api_key = api_key[7:]
-            
-            if api_key != settings.API_KEY:
-                raise AuthenticationException("Invalid API key")
-            
-            return f(*args, **kwargs)
-        return decorated_function
-    return decorator
+from functools import wraps
+from flask import g, request, jsonify
+from typing import Callable
+
+from application.services.request_timing import stage_timer
+from interface.exceptions.api_exceptions import AuthenticationException
+from infrastructure.config.settings import Settings
+
+def require_api_key(settings: Settings) -> Callable:
+    """Decorator to require API key authentication.
+    
+    Accepts API_KEY and any of API_KEYS; the key used is kept in g.api_key
+    for per-key quotas.
+    """
+    valid_keys = {settings.API_KEY, *(key.strip() for key in settings.API_KEYS.split(",") if key.strip())}
+    
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            with stage_timer("auth"):
+                api_key = request.headers.get("X-API-Key") or request.headers.get("Authorization")
+                
+                if not api_key:
+                    raise AuthenticationException("API key is required")
+                
+                # Remove 'Bearer ' prefix if present
+                if api_key.startswith("Bearer "):
+                    api_key = api_key[7:]
+                
+                if api_key not in valid_keys:
+                    raise AuthenticationException("Invalid API key")
+                g.api_key = api_key
+            
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
@@ -0,0 +1,20 @@
+import time
+from flask import Flask, Response, g, request
+
+from application.interfaces.metrics import MetricsInterface
+
+def track_request_metrics(app: Flask, metrics: MetricsInterface) -> None:
+    """Record latency and status of every request, labelled by route pattern"""
+    
+    @app.before_request
+    def start_request_timer() -> None:
+        g.request_started = time.perf_counter()
+    
+    @app.after_request
+    def record_request(response: Response) -> Response:
+        started = g.pop("request_started", None)
+        if started is not None:
+            # The route pattern, not the path, keeps label cardinality bounded
+            endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+            metrics.observe_request(endpoint, request.method, response.status_code, time.perf_counter() - started)
+        return response
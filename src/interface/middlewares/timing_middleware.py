@@ -0,0 +1,50 @@
+import logging
+from typing import Optional
+from flask import Flask, Response, g, request
+
+from application.services.request_timing import begin_request_timing, end_request_timing
+from infrastructure.runtime.sampling_profiler import SamplingProfiler
+
+logger = logging.getLogger(__name__)
+
+def track_request_timing(
+    app: Flask,
+    server_timing: bool = True,
+    slow_request_ms: float = 0.0,
+    profiler: Optional[SamplingProfiler] = None
+) -> None:
+    """Time the stages of every request, and profile a sample of them.
+    
+    The stage breakdown is returned in a Server-Timing header and logged for
+    requests slower than slow_request_ms (0 disables the log).
+    """
+    
+    @app.before_request
+    def start_request_timing() -> None:
+        g.request_timing = begin_request_timing()
+        if profiler is not None:
+            endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+            g.request_profile = profiler.start(f"{request.method} {endpoint}")
+    
+    @app.after_request
+    def report_request_timing(response: Response) -> Response:
+        timing = g.get("request_timing")
+        if timing is None:
+            return response
+        total = timing.elapsed
+        if server_timing:
+            response.headers["Server-Timing"] = timing.server_timing(total)
+        if slow_request_ms and total * 1000 >= slow_request_ms:
+            logger.warning(
+                "Slow request %s %s -> %s in %.1fms: %s",
+                request.method, request.path, response.status_code, total * 1000,
+                timing.summary() or "no stages recorded"
+            )
+        return response
+    
+    @app.teardown_request
+    def finish_request_timing(exc: Optional[BaseException]) -> None:
+        end_request_timing()
+        session = g.pop("request_profile", None)
+        if session is not None:
+            session.stop()
@@ -0,0 +1,62 @@
+import json
+from typing import Any, Union
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+from application.services.request_timing import stage_timer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj: Any) -> str:
+    """Compact JSON text, encoded with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, falling back to the default one without it.
+    
+    Dates are passed through to Flask's default hook, so responses keep the
+    same format as with the standard library encoder.
+    """
+    
+    def __init__(self, app: Flask):
+        super().__init__(app)
+        self.fast = orjson is not None
+    
+    def _options(self, indent: bool = False) -> int:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if not self.fast or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if not self.fast or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        with stage_timer("serialize"):
+            if not self.fast:
+                return super().response(*args, **kwargs)
+            obj = self._prepare_response_obj(args, kwargs)
+            indent = self.compact is False or (self.compact is None and self._app.debug)
+            body = orjson.dumps(obj, default=self.default, option=self._options(indent) | orjson.OPT_APPEND_NEWLINE)
+            return self._app.response_class(body, mimetype=self.mimetype)
@@ -0,0 +1,124 @@
+from typing import Annotated, Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, ValidationError, field_validator
+from pydantic_core import PydanticCustomError
+
+from domain.value_objects.log_level import LogLevel
+
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+
+# Union members are tagged so errors only describe the shape that was sent;
+# the tags are dropped again when errors are reported
+_UNION_TAGS = ("object", "list", "names")
+
+_LEVELS = frozenset(level.value for level in LogLevel)
+
+def _object_or_list(value: Any) -> str:
+    return "list" if isinstance(value, list) else "object"
+
+def _channels_or_names(value: Any) -> str:
+    return "names" if isinstance(value, list) else "object"
+
+class SlackChannelSchema(BaseModel):
+    """Slack config in a request: one webhook, or several via webhook_urls"""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    webhook_url: Optional[NonEmptyStr] = None
+    webhook_urls: Optional[List[NonEmptyStr]] = Field(None, min_length=1)
+    channel: Optional[str] = None
+    username: Optional[str] = None
+
+class TelegramChannelSchema(BaseModel):
+    """Telegram config in a request: one chat, or several via chat_ids"""
+    
+    model_config = ConfigDict(extra="forbid", coerce_numbers_to_str=True)
+    
+    bot_token: Optional[NonEmptyStr] = None
+    chat_id: Optional[NonEmptyStr] = None
+    chat_ids: Optional[List[NonEmptyStr]] = Field(None, min_length=1)
+    parse_mode: Optional[str] = None
+
+SlackChannelField = Annotated[
+    Union[
+        Annotated[SlackChannelSchema, Tag("object")],
+        Annotated[List[SlackChannelSchema], Tag("list"), Field(min_length=1)]
+    ],
+    Discriminator(_object_or_list)
+]
+
+TelegramChannelField = Annotated[
+    Union[
+        Annotated[TelegramChannelSchema, Tag("object")],
+        Annotated[List[TelegramChannelSchema], Tag("list"), Field(min_length=1)]
+    ],
+    Discriminator(_object_or_list)
+]
+
+# Channels added through entry points: their config is checked by the channel itself
+PluginChannelField = Annotated[
+    Union[
+        Annotated[Dict[str, Any], Tag("object")],
+        Annotated[List[Dict[str, Any]], Tag("list"), Field(min_length=1)]
+    ],
+    Discriminator(_object_or_list)
+]
+
+class ChannelsSchema(BaseModel):
+    """Channel configs in a request; keys other than the built-in ones are plugin channels"""
+    
+    model_config = ConfigDict(extra="allow")
+    
+    slack: Optional[SlackChannelField] = None
+    telegram: Optional[TelegramChannelField] = None
+    destinations: Optional[List[NonEmptyStr]] = Field(None, min_length=1)
+    
+    __pydantic_extra__: Dict[str, PluginChannelField]
+
+ChannelsField = Annotated[
+    Union[
+        Annotated[ChannelsSchema, Tag("object")],
+        Annotated[List[NonEmptyStr], Tag("names"), Field(min_length=1)]
+    ],
+    Discriminator(_channels_or_names)
+]
+
+class SendRequestSchema(BaseModel):
+    """Body of a send request, with header channel fields merged in as top-level fields"""
+    
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+    
+    title: str = Field(min_length=1, max_length=200)
+    message: str = Field(min_length=1, max_length=2000)
+    level: str
+    source: Optional[str] = Field(None, max_length=100)
+    metadata: Optional[Dict[str, Any]] = None
+    channels: Optional[ChannelsField] = None
+    slack_webhook_url: Optional[NonEmptyStr] = None
+    telegram_bot_token: Optional[NonEmptyStr] = None
+    telegram_chat_id: Optional[NonEmptyStr] = None
+    
+    @field_validator("level")
+    @classmethod
+    def _known_level(cls, value: str) -> str:
+        if value.upper() not in _LEVELS:
+            raise PydanticCustomError("log_level", "Invalid log level: {level}", {"level": value})
+        return value
+
+def field_errors(error: ValidationError) -> List[Dict[str, str]]:
+    """Flatten pydantic errors into {"field": "channels.slack[0].webhook_url", "message": ...}"""
+    details = []
+    for item in error.errors(include_url=False):
+        field = ""
+        for part in item["loc"]:
+            if part in _UNION_TAGS:
+                continue
+            if isinstance(part, int):
+                field += f"[{part}]"
+            else:
+                field += f".{part}" if field else part
+        message = item["msg"]
+        if item["type"] in ("model_type", "model_attributes_type", "dict_type"):
+            message = "Input should be an object"
+        details.append({"field": field, "message": message})
+    return details
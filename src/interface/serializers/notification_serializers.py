@@ -1,55 +1,176 @@
-from typing import Dict, Any, Optional
-from dataclasses import asdict
-
-from application.dtos.notification_dto import SendNotificationDTO
-from interface.exceptions.api_exceptions import ValidationException
-
-class NotificationSerializer:
-    
-    @staticmethod
-    def deserialize_send_request(data: Dict[str, Any]) -> SendNotificationDTO:
-        """Deserialize send notification request"""
-        try:
-            # Extract channel configs from headers and body
-            channels = {}
-            
-            # Slack configuration
-            slack_config = {}
-            if "slack_webhook_url" in data:
-                slack_config["webhook_url"] = data["slack_webhook_url"]
-            if "slack" in data.get("channels", {}):
-                slack_config.update(data["channels"]["slack"])
-            
-            # Only add slack channel if we have a webhook URL
-            if slack_config.get("webhook_url"):
-                channels["slack"] = slack_config
-            
-            # Telegram configuration
-            telegram_config = {}
-            if "telegram_bot_token" in data:
-                telegram_config["bot_token"] = data["telegram_bot_token"]
-            if "telegram_chat_id" in data:
-                telegram_config["chat_id"] = data["telegram_chat_id"]
-            if "telegram" in data.get("channels", {}):
-                telegram_config.update(data["channels"]["telegram"])
-            
-            # Only add telegram channel if we have both bot_token and chat_id
-            if telegram_config.get("bot_token") and telegram_config.get("chat_id"):
-                channels["telegram"] = telegram_config
-            
-            if not channels:
-                raise ValidationException("At least one notification channel must be configured with valid parameters")
-            
-            return SendNotificationDTO(
-                title=data["title"],
-                message=data["message"],
-                level=data["level"],
-                channels=channels,
-                metadata=data.get("metadata"),
-                source=data.get("source")
-            )
-            
-        except KeyError as e:
-            raise ValidationException(f"Missing required field: {e}")
-        except Exception as e:
-            raise ValidationException(f"Invalid request data: {str(e)}")
\ No newline at end of file
+from typing import Dict, Any, List, Optional, Tuple, Union
+from dataclasses import asdict
+
+from pydantic import BaseModel, ValidationError
+
+from application.dtos.notification_dto import SendNotificationDTO
+from application.services.destination_registry import NAMED_DESTINATIONS
+from interface.exceptions.api_exceptions import ValidationException
+from interface.serializers import json_codec
+from interface.serializers.notification_schemas import ChannelsSchema, SendRequestSchema, field_errors
+
+class NotificationSerializer:
+    
+    @staticmethod
+    def deserialize_send_request(data: Dict[str, Any], max_destinations: Optional[int] = None) -> SendNotificationDTO:
+        """Deserialize send notification request.
+        
+        The payload is checked against SendRequestSchema first, so every
+        problem is reported with the field it belongs to. A channel in
+        "channels" may be a single config, a list of configs or a config with
+        "webhook_urls" (Slack) / "chat_ids" (Telegram) to fan out to several
+        destinations. Top-level and header fields act as defaults.
+        Server-side destinations are referenced by name, either as a list in
+        place of "channels" or under "channels.destinations". Any other key
+        of "channels" names a plugin channel and is passed through as is.
+        """
+        try:
+            request = SendRequestSchema.model_validate(data)
+        except ValidationError as e:
+            details = field_errors(e)
+            raise ValidationException(
+                "; ".join(f"{detail['field']}: {detail['message']}" if detail["field"] else detail["message"] for detail in details),
+                details=details
+            )
+        
+        # Extract channel configs from headers and body
+        channels = {}
+        body_channels = request.channels
+        if isinstance(body_channels, list):
+            body_channels = ChannelsSchema(destinations=body_channels)
+        elif body_channels is None:
+            body_channels = ChannelsSchema()
+        
+        # Slack configuration
+        slack_defaults = {}
+        if request.slack_webhook_url:
+            slack_defaults["webhook_url"] = request.slack_webhook_url
+        slack_config = NotificationSerializer._channel_configs(
+            body_channels.slack, slack_defaults, "slack", "webhook_urls", "webhook_url", ("webhook_url",)
+        )
+        
+        # Only add slack channel if we have a webhook URL
+        if isinstance(slack_config, list) or slack_config.get("webhook_url"):
+            channels["slack"] = slack_config
+        
+        # Telegram configuration
+        telegram_defaults = {}
+        if request.telegram_bot_token:
+            telegram_defaults["bot_token"] = request.telegram_bot_token
+        if request.telegram_chat_id:
+            telegram_defaults["chat_id"] = request.telegram_chat_id
+        telegram_config = NotificationSerializer._channel_configs(
+            body_channels.telegram, telegram_defaults, "telegram", "chat_ids", "chat_id", ("bot_token", "chat_id")
+        )
+        
+        # Only add telegram channel if we have both bot_token and chat_id
+        if isinstance(telegram_config, list) or (telegram_config.get("bot_token") and telegram_config.get("chat_id")):
+            channels["telegram"] = telegram_config
+        
+        # Plugin channels, passed through as sent; the service skips unknown names
+        channels.update(body_channels.model_extra or {})
+        
+        # Named destinations, resolved by the service
+        if body_channels.destinations:
+            channels[NAMED_DESTINATIONS] = list(dict.fromkeys(body_channels.destinations))
+        
+        if not channels:
+            raise ValidationException("At least one notification channel must be configured with valid parameters")
+        
+        destinations = sum(len(config) if isinstance(config, list) else 1 for config in channels.values())
+        if max_destinations is not None and destinations > max_destinations:
+            raise ValidationException(f"Request exceeds maximum of {max_destinations} destinations")
+        
+        return SendNotificationDTO(
+            title=request.title,
+            message=request.message,
+            level=request.level,
+            channels=channels,
+            metadata=request.metadata,
+            source=request.source
+        )
+    
+    @staticmethod
+    def _channel_configs(
+        body: Union[None, BaseModel, List[BaseModel]],
+        defaults: Dict[str, Any],
+        channel_name: str,
+        list_field: str,
+        item_field: str,
+        required: Tuple[str, ...]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Merge a channel's body config over its defaults, expanding destination lists.
+        
+        A single config is returned as is, to be used only if complete; every
+        entry of a destination list must be complete.
+        """
+        if body is None:
+            return dict(defaults)
+        if not isinstance(body, list) and getattr(body, list_field) is None:
+            return {**defaults, **body.model_dump(exclude_none=True)}
+        
+        configs = []
+        for index, item in enumerate(body if isinstance(body, list) else [body]):
+            config = {**defaults, **item.model_dump(exclude_none=True)}
+            values = config.pop(list_field, None)
+            missing = [name for name in required if not config.get(name) and not (name == item_field and values)]
+            if missing:
+                field = f"channels.{channel_name}[{index}]" if isinstance(body, list) else f"channels.{channel_name}"
+                details = [{"field": f"{field}.{name}", "message": "Field required"} for name in missing]
+                raise ValidationException(
+                    "; ".join(f"{detail['field']}: {detail['message']}" for detail in details),
+                    details=details
+                )
+            if values is None:
+                configs.append(config)
+            else:
+                configs.extend({**config, item_field: value} for value in values)
+        return configs
+    
+    @staticmethod
+    def deserialize_batch_request(
+        data: Any,
+        defaults: Optional[Dict[str, Any]] = None,
+        max_size: Optional[int] = None,
+        max_destinations: Optional[int] = None
+    ) -> List[Union[SendNotificationDTO, ValidationException]]:
+        """Deserialize batch send request.
+        
+        Accepts a JSON array or an object with a "notifications" array. Items that
+        fail validation are returned as ValidationException at their position so
+        one bad item does not reject the whole batch.
+        """
+        items = data.get("notifications") if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            raise ValidationException("Batch request must be an array of notifications or an object with a 'notifications' array")
+        if not items:
+            raise ValidationException("Batch request must contain at least one notification")
+        if max_size is not None and len(items) > max_size:
+            raise ValidationException(f"Batch request exceeds maximum size of {max_size} notifications")
+        
+        defaults = defaults or {}
+        results: List[Union[SendNotificationDTO, ValidationException]] = []
+        for item in items:
+            if not isinstance(item, dict):
+                results.append(ValidationException("Notification must be an object"))
+                continue
+            try:
+                results.append(NotificationSerializer.deserialize_send_request({**defaults, **item}, max_destinations))
+            except ValidationException as e:
+                results.append(e)
+        return results
+    
+    @staticmethod
+    def deserialize_stream_line(
+        line: bytes,
+        defaults: Optional[Dict[str, Any]] = None,
+        max_destinations: Optional[int] = None
+    ) -> SendNotificationDTO:
+        """Deserialize one line of an NDJSON stream; defaults apply as for batch items"""
+        try:
+            item = json_codec.loads(line)
+        except ValueError as e:
+            raise ValidationException(f"Invalid JSON: {str(e)}")
+        if not isinstance(item, dict):
+            raise ValidationException("Notification must be an object")
+        return NotificationSerializer.deserialize_send_request({**(defaults or {}), **item}, max_destinations)
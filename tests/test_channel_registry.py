@@ -0,0 +1,160 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from application.dtos.notification_dto import SendNotificationDTO
+from application.services.channel_registry import ChannelRegistry
+from application.use_cases.send_notification import SendNotificationUseCase
+from domain.exceptions.domain_exceptions import UnsupportedChannelException
+from domain.services.payload_renderer import PayloadRenderer
+from infrastructure.channels.channel_loader import ChannelContext, channel_loaders, discover_channels, load_channel
+from infrastructure.config.settings import Settings
+from infrastructure.repositories.in_memory_notification_repository import InMemoryNotificationRepository
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+IMPORT_TIME = 0.2
+
+# Imported by create_app before channels were loaded on first use
+EAGER_MODULES = (
+    "aiohttp",
+    "infrastructure.external_services.http_session",
+    "infrastructure.external_services.slack_service",
+    "infrastructure.external_services.telegram_service"
+)
+
+CREATE_APP = f"""
+import json, sys
+from app_factory import create_app
+from infrastructure.config.settings import Settings
+from infrastructure.repositories.in_memory_notification_repository import InMemoryNotificationRepository
+app = create_app(Settings(API_KEY="test-key", LOG_LEVEL="WARNING"))
+print(json.dumps([name for name in {EAGER_MODULES!r} if name in sys.modules]))
+app.extensions["notification_broker"]["shutdown"]()
+"""
+
+ECHO_CHANNEL = """
+from domain.services.notification_channel import NotificationChannelInterface
+
+built = []
+
+class EchoChannel(NotificationChannelInterface):
+    name = "echo"
+
+    def render(self, notification, config):
+        return {"message": notification.message}
+
+    async def send(self, notification, config):
+        return self.render(notification, config)
+
+    def validate_config(self, config):
+        return True
+
+def create_channel(context):
+    built.append(context)
+    return EchoChannel()
+"""
+
+@pytest.fixture
+def echo_plugin(tmp_path, monkeypatch):
+    """An installed package declaring the "echo" channel entry point"""
+    (tmp_path / "echo_channel.py").write_text(ECHO_CHANNEL)
+    dist_info = tmp_path / "echo_plugin-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: echo-plugin\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text("[notification_broker.channels]\necho = echo_channel:create_channel\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "echo_channel", raising=False)
+    yield
+    sys.modules.pop("echo_channel", None)
+
+def make_context() -> ChannelContext:
+    return ChannelContext(settings=Settings(API_KEY="test-key"), renderer=PayloadRenderer(), http_session=lambda name: None)
+
+def test_create_app_imports_no_channel_adapter():
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    env.pop("CHANNELS_PRELOAD", None)
+    output = subprocess.run(
+        [sys.executable, "-c", CREATE_APP],
+        capture_output=True, text=True, check=True, env=env
+    ).stdout
+
+    assert json.loads(output.strip().splitlines()[-1]) == []
+
+def test_entry_point_channel_is_loaded_on_first_use(echo_plugin):
+    specs = discover_channels()
+    assert specs["echo"] == "echo_channel:create_channel"
+    assert "slack" in specs and "telegram" in specs
+
+    context = make_context()
+    registry = ChannelRegistry(channel_loaders(specs, context))
+
+    assert "echo" in registry
+    assert "echo_channel" not in sys.modules
+    assert registry.loaded() == {}
+
+    channel = registry.get("echo")
+
+    assert channel.name == "echo"
+    assert registry.get("echo") is channel
+    assert sys.modules["echo_channel"].built == [context]
+    assert list(registry.loaded()) == ["echo"]
+
+def test_unknown_channel_is_rejected():
+    registry = ChannelRegistry(channel_loaders(discover_channels(group=None), make_context()))
+
+    assert "echo" not in registry
+    with pytest.raises(UnsupportedChannelException):
+        registry.get("echo")
+
+async def test_load_builds_channels_off_the_event_loop():
+    threads = []
+
+    def loader():
+        threads.append(threading.get_ident())
+        return object()
+
+    registry = ChannelRegistry({"echo": loader})
+
+    await registry.load(["echo", "echo"])
+
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+    assert list(registry.loaded()) == ["echo"]
+
+async def test_first_send_loads_its_channel_without_stalling_the_loop(echo_plugin):
+    def slow_loader():
+        # Stands in for importing a large client library
+        time.sleep(IMPORT_TIME)
+        return load_channel("echo_channel:create_channel", make_context())
+
+    use_case = SendNotificationUseCase(
+        notification_repository=InMemoryNotificationRepository(),
+        channels=ChannelRegistry({"echo": slow_loader})
+    )
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.ensure_future(ticker())
+    try:
+        result = await use_case.send_notification(SendNotificationDTO(
+            title="Deploy", message="v2", level="INFO", channels={"echo": {}}
+        ))
+    finally:
+        ticking.cancel()
+    ticks.append(time.monotonic())
+
+    assert result["channels"]["echo"]["success"] is True
+    # The loop kept ticking while the channel was built
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < IMPORT_TIME / 2
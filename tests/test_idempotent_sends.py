@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+from flask import Flask
+
+from application.services.idempotency_cache import IdempotencyCache
+from application.services.load_shedder import LoadShedder
+from infrastructure.config.settings import Settings
+from infrastructure.runtime.event_loop import BackgroundEventLoop
+from interface.controllers.notification_controller import NotificationController
+
+API_KEY = "test-key"
+
+class RecordingService:
+    """Records every delivery; while hold is set, deliveries wait for it to clear"""
+
+    def __init__(self):
+        self.sent: List[str] = []
+        self.hold = threading.Event()
+
+    async def send_notification(self, dto) -> Dict[str, Any]:
+        self.sent.append(dto.title)
+        while self.hold.is_set():
+            await asyncio.sleep(0.005)
+        return {"notification_id": f"n-{len(self.sent)}", "title": dto.title}
+
+    async def send_batch(self, dtos) -> List[Dict[str, Any]]:
+        return [{"success": True, "data": await self.send_notification(dto)} for dto in dtos]
+
+@pytest.fixture
+def broker():
+    event_loop = BackgroundEventLoop("test-loop")
+    event_loop.start()
+    service = RecordingService()
+    # One request in flight and one notification per key: a replay that used either would be shed
+    shedder = LoadShedder(max_in_flight=1, key_rate=0.001, key_burst=1)
+    controller = NotificationController(
+        service,
+        Settings(API_KEY=API_KEY),
+        event_loop,
+        idempotency_cache=IdempotencyCache(),
+        load_shedder=shedder
+    )
+    app = Flask("test")
+    app.register_blueprint(controller.blueprint)
+    yield app, service, shedder
+    event_loop.stop()
+
+def send(app: Flask, title: str, key: str = "retry-1", path: str = "/api/v1/notifications/send"):
+    body: Any = {"title": title, "message": "m", "level": "INFO", "slack_webhook_url": "https://hooks.slack.com/services/T/B/X"}
+    if path.endswith("/batch"):
+        body = {"notifications": [body]}
+    headers = {"X-API-Key": API_KEY}
+    if key:
+        headers["Idempotency-Key"] = key
+    return app.test_client().post(path, json=body, headers=headers)
+
+def test_replay_skips_admission(broker):
+    app, service, shedder = broker
+    first = send(app, "Disk full")
+
+    replay = send(app, "Disk full")
+
+    assert first.status_code == replay.status_code == 201
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert replay.get_json() == first.get_json()
+    assert service.sent == ["Disk full"]
+    assert shedder.get_stats()["admitted"] == 1
+    assert shedder.get_stats()["in_flight"] == 0
+    # The key's quota went to the first request alone
+    assert send(app, "Disk full", key="").status_code == 429
+
+def test_batch_replay_skips_admission(broker):
+    app, service, shedder = broker
+    first = send(app, "Disk full", path="/api/v1/notifications/send/batch")
+
+    replay = send(app, "Disk full", path="/api/v1/notifications/send/batch")
+
+    assert first.get_json()["data"]["succeeded"] == 1
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert replay.get_json() == first.get_json()
+    assert service.sent == ["Disk full"]
+    assert shedder.get_stats()["admitted"] == 1
+
+def test_concurrent_duplicate_waits_for_the_first_request(broker):
+    app, service, shedder = broker
+    service.hold.set()
+    with ThreadPoolExecutor(2) as pool:
+        try:
+            first = pool.submit(send, app, "Disk full")
+            while not service.sent and not first.done():
+                time.sleep(0.005)
+            duplicate = pool.submit(send, app, "Disk full")
+            time.sleep(0.1)
+            assert not duplicate.done(), duplicate.result().get_json()
+        finally:
+            service.hold.clear()
+        first, duplicate = first.result(timeout=5), duplicate.result(timeout=5)
+
+    assert first.status_code == duplicate.status_code == 201
+    assert duplicate.headers["Idempotent-Replayed"] == "true"
+    assert duplicate.get_json() == first.get_json()
+    assert service.sent == ["Disk full"]
+    assert shedder.get_stats()["admitted"] == 1
+
+def test_key_reused_for_a_different_request_is_rejected(broker):
+    app, service, _ = broker
+    assert send(app, "Disk full").status_code == 201
+
+    reused = send(app, "CPU high")
+
+    assert reused.status_code == 422
+    assert "retry-1" in reused.get_json()["error"]
+    assert service.sent == ["Disk full"]
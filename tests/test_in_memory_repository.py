@@ -0,0 +1,88 @@
+import gc
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from domain.entities.notification import Notification
+from domain.value_objects.log_level import LogLevel
+from infrastructure.repositories.in_memory_notification_repository import InMemoryNotificationRepository
+
+# Full Notification objects with an id index took about 790 bytes each
+MAX_BYTES_PER_NOTIFICATION = 640
+
+def make_notification(i: int, **fields) -> Notification:
+    """A typical alert: short title and message, metadata on half of them"""
+    levels = list(LogLevel)
+    return Notification.create(
+        title=fields.pop("title", f"High CPU usage on web-{i % 50}"),
+        message=f"CPU usage above 90% for the last 5 minutes (sample {i})",
+        level=fields.pop("level", levels[i % len(levels)]),
+        metadata={"cpu": "93%", "host": f"web-{i % 50}"} if i % 2 else None,
+        source=fields.pop("source", f"service-{i % 10}")
+    )
+
+def resident_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="reads resident memory from /proc")
+async def test_one_million_notifications_stay_compact():
+    count = 1_000_000
+    gc.collect()
+    before = resident_bytes()
+
+    repository = InMemoryNotificationRepository(max_items=count)
+    for i in range(count):
+        await repository.save(make_notification(i))
+    gc.collect()
+    per_notification = (resident_bytes() - before) / count
+
+    assert await repository.count() == count
+    assert per_notification < MAX_BYTES_PER_NOTIFICATION, f"{per_notification:.0f} bytes per notification"
+
+async def test_evicts_oldest_beyond_max_items():
+    repository = InMemoryNotificationRepository(max_items=3)
+    notifications = [make_notification(i, level=LogLevel.ERROR, source="api") for i in range(5)]
+    for notification in notifications:
+        await repository.save(notification)
+
+    assert await repository.count() == 3
+    assert await repository.find_by_id(notifications[0].id) is None
+    assert await repository.find_by_id(notifications[1].id) is None
+    assert (await repository.find_by_id(notifications[4].id)).message == notifications[4].message
+    # Indexes are trimmed with the arrival log
+    for page in (
+        await repository.find_page(),
+        await repository.find_page(level=LogLevel.ERROR),
+        await repository.find_page(source="api")
+    ):
+        assert [n.id for n in page.items] == [n.id for n in reversed(notifications[2:])]
+
+async def test_evicts_notifications_older_than_max_age():
+    repository = InMemoryNotificationRepository(max_items=100, max_age=60)
+    old = make_notification(0, level=LogLevel.WARNING, source="batch")
+    old.timestamp = datetime.utcnow() - timedelta(seconds=120)
+    await repository.save(old)
+    recent = make_notification(1, level=LogLevel.WARNING, source="batch")
+    await repository.save(recent)
+
+    assert await repository.count() == 1
+    assert await repository.find_by_id(old.id) is None
+    page = await repository.find_page(level=LogLevel.WARNING, source="batch")
+    assert [n.id for n in page.items] == [recent.id]
+
+async def test_round_trips_stored_notifications():
+    repository = InMemoryNotificationRepository()
+    notification = make_notification(1, source="billing")
+    await repository.save(notification)
+
+    stored = await repository.find_by_id(notification.id)
+
+    assert stored.id == notification.id
+    assert stored.title == notification.title
+    assert stored.message == notification.message
+    assert stored.level is notification.level
+    assert stored.metadata == notification.metadata
+    assert stored.source == "billing"
+    assert abs(stored.timestamp - notification.timestamp) < timedelta(microseconds=1)
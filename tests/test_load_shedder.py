@@ -0,0 +1,95 @@
+import pytest
+
+from application.services.load_shedder import SHED_IN_FLIGHT, SHED_QUEUE_DEPTH, SHED_QUOTA, LoadShedder
+from domain.exceptions.domain_exceptions import LoadShedException
+from domain.value_objects.log_level import LogLevel
+
+INFO = LogLevel.INFO.priority
+ERROR = LogLevel.ERROR.priority
+
+def test_first_notification_of_a_key_is_admitted_with_a_burst_of_one():
+    shedder = LoadShedder(key_rate=0.001, key_burst=1)
+
+    shedder.admit("key", INFO)
+
+    with pytest.raises(LoadShedException) as shed:
+        shedder.admit("key", INFO)
+    assert shed.value.reason == SHED_QUOTA
+    assert shed.value.retry_after == pytest.approx(1000, rel=0.01)
+
+def test_quota_sheds_low_severity_over_the_burst():
+    shedder = LoadShedder(key_rate=1, key_burst=3)
+
+    for _ in range(3):
+        shedder.admit("key", INFO)
+    with pytest.raises(LoadShedException) as shed:
+        shedder.admit("key", LogLevel.WARNING.priority)
+
+    assert shed.value.reason == SHED_QUOTA
+    assert 0 < shed.value.retry_after <= 1
+    # Quotas are per API key
+    shedder.admit("other-key", INFO)
+    stats = shedder.get_stats()
+    assert stats["admitted"] == 4
+    assert stats["shed"][SHED_QUOTA] == 1
+    assert stats["keys"] == 2
+
+def test_protected_notifications_are_admitted_over_the_quota():
+    shedder = LoadShedder(key_rate=0.001, key_burst=1)
+    shedder.admit("key", INFO)
+
+    shedder.admit("key", ERROR)
+    shedder.admit("key", LogLevel.DISASTER.priority)
+
+    assert shedder.get_stats()["admitted"] == 3
+
+def test_in_flight_overload_sheds_until_released():
+    shedder = LoadShedder(max_in_flight=2, retry_after=2.5)
+    shedder.admit("key", INFO)
+    shedder.admit("key", INFO)
+
+    with pytest.raises(LoadShedException) as shed:
+        shedder.admit("key", INFO)
+    assert shed.value.reason == SHED_IN_FLIGHT
+    assert shed.value.retry_after == 2.5
+    shedder.admit("key", ERROR)
+
+    shedder.release(2)
+
+    shedder.admit("key", INFO)
+    assert shedder.get_stats()["in_flight"] == 2
+
+def test_queue_depth_overload_sheds_below_the_protected_level():
+    shedder = LoadShedder(max_queue_depth=100, protected_priority=LogLevel.WARNING.priority)
+    shedder.set_queue_depth(100)
+
+    with pytest.raises(LoadShedException) as shed:
+        shedder.admit("key", INFO)
+    assert shed.value.reason == SHED_QUEUE_DEPTH
+    shedder.admit("key", LogLevel.WARNING.priority)
+
+    shedder.set_queue_depth(99)
+    shedder.admit("key", INFO)
+
+def test_sampled_notifications_get_through_an_overload():
+    shedder = LoadShedder(max_in_flight=1, sample_rate=1.0)
+    shedder.admit("key", INFO)
+
+    shedder.admit("key", INFO)
+
+    stats = shedder.get_stats()
+    assert stats["sampled"] == 1
+    assert stats["shed"] == {SHED_IN_FLIGHT: 0, SHED_QUEUE_DEPTH: 0, SHED_QUOTA: 0}
+
+def test_protected_notifications_do_not_use_up_the_quota():
+    shedder = LoadShedder(key_rate=0.001, key_burst=2)
+    shedder.admit("key", INFO)
+    shedder.admit("key", ERROR)
+    # Over the quota: admitted without being charged
+    for _ in range(3):
+        shedder.admit("key", ERROR)
+
+    with pytest.raises(LoadShedException) as shed:
+        shedder.admit("key", INFO)
+    # One token away, not four
+    assert shed.value.retry_after == pytest.approx(1000, rel=0.01)
@@ -0,0 +1,87 @@
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from application.dtos.delivery_job_dto import DeliveryJobDTO
+from application.services.priority_scheduler import PriorityScheduler
+from domain.value_objects.log_level import LogLevel
+from infrastructure.queues.delivery_worker_pool import DeliveryWorkerPool
+from infrastructure.queues.in_memory_delivery_queue import InMemoryDeliveryQueue
+
+UPSTREAM_LATENCY = 0.02
+
+class SlowUpstreamService:
+    """Delivers every job after UPSTREAM_LATENCY, recording when each delivery started"""
+
+    def __init__(self):
+        self.started: Dict[str, float] = {}
+
+    async def deliver_job(self, job: DeliveryJobDTO, last_attempt: bool = True) -> Dict[str, Any]:
+        self.started[job.job_id] = time.monotonic()
+        await asyncio.sleep(UPSTREAM_LATENCY)
+        return {"channels": {"slack": {"success": True}}}
+
+async def claim_wait(service: SlowUpstreamService, job_id: str, enqueued: float, timeout: float = 5.0) -> float:
+    """Seconds from enqueue until the job's delivery started"""
+    while job_id not in service.started:
+        assert time.monotonic() - enqueued < timeout, f"{job_id} not claimed within {timeout}s"
+        await asyncio.sleep(0.001)
+    return service.started[job_id] - enqueued
+
+def make_job(job_id: str, level: LogLevel) -> DeliveryJobDTO:
+    return DeliveryJobDTO(job_id=job_id, notification={"level": level.value}, channels={"slack": {}}, priority=level.priority)
+
+async def test_urgent_jobs_are_claimed_before_an_info_backlog():
+    queue = InMemoryDeliveryQueue(scheduler=PriorityScheduler(fairness_interval=10))
+    for i in range(1000):
+        await queue.enqueue(make_job(f"info-{i}", LogLevel.INFO))
+    await queue.enqueue(make_job("error", LogLevel.ERROR))
+    await queue.enqueue(make_job("disaster", LogLevel.DISASTER))
+
+    assert (await queue.dequeue()).job_id == "disaster"
+    assert (await queue.dequeue()).job_id == "error"
+    assert (await queue.dequeue()).job_id == "info-0"
+
+async def test_info_is_not_starved_by_an_urgent_flood():
+    queue = InMemoryDeliveryQueue(scheduler=PriorityScheduler(fairness_interval=10))
+    await queue.enqueue(make_job("info", LogLevel.INFO))
+    for i in range(1000):
+        await queue.enqueue(make_job(f"critical-{i}", LogLevel.CRITICAL))
+
+    claimed = [(await queue.dequeue()).job_id for _ in range(10)]
+
+    # Every 10th claim takes the oldest job of any level
+    assert claimed.index("info") == 9
+
+async def test_urgent_latency_stays_flat_while_info_floods_the_pool():
+    queue = InMemoryDeliveryQueue(max_size=100000)
+    service = SlowUpstreamService()
+    pool = DeliveryWorkerPool(
+        queue,
+        service,
+        workers=4,
+        reserved_workers=1,
+        reserved_min_priority=LogLevel.ERROR.priority
+    )
+    await pool.start()
+    try:
+        # Idle baseline
+        await queue.enqueue(make_job("baseline", LogLevel.ERROR))
+        baseline = await claim_wait(service, "baseline", time.monotonic())
+
+        # The backlog takes 2000 * 20ms / 4 workers = 10s to drain in arrival order
+        for i in range(2000):
+            await queue.enqueue(make_job(f"info-{i}", LogLevel.INFO))
+
+        waits: List[float] = []
+        for i in range(5):
+            await asyncio.sleep(0.1)
+            job_id = f"error-{i}"
+            await queue.enqueue(make_job(job_id, LogLevel.ERROR))
+            waits.append(await claim_wait(service, job_id, time.monotonic()))
+
+        assert await queue.depth() > 1000, "the INFO backlog drained before the urgent jobs were measured"
+        # A reserved worker is free for each urgent job: it waits at most about one delivery, never on the backlog
+        assert max(waits) < baseline + 0.25, f"urgent waits {waits}, idle {baseline}"
+    finally:
+        await pool.stop()
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from application.dtos.delivery_job_dto import DeliveryJobDTO
+from domain.value_objects.delivery_status import DeliveryStatus
+from domain.value_objects.log_level import LogLevel
+from infrastructure.queues import redis_delivery_queue
+from infrastructure.queues.redis_delivery_queue import RedisDeliveryQueue
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+@pytest.fixture
+def server(monkeypatch):
+    """One in-process Redis server shared by every queue a test creates"""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        redis_delivery_queue.redis,
+        "from_url",
+        lambda url, **kwargs: fakeredis.aioredis.FakeRedis(server=server, **kwargs)
+    )
+    return server
+
+@pytest.fixture
+async def queue(server):
+    queue = RedisDeliveryQueue("redis://fake", block_timeout=0.05)
+    await queue.start()
+    yield queue
+    await queue.close()
+
+def make_job(job_id: str, level: LogLevel) -> DeliveryJobDTO:
+    return DeliveryJobDTO(job_id=job_id, notification={"level": level.value}, channels={"slack": {}}, priority=level.priority)
+
+async def test_requeued_job_is_promoted_onto_its_priority_list(queue):
+    await queue.enqueue(make_job("error", LogLevel.ERROR))
+    job = await queue.dequeue()
+
+    await queue.requeue(job, delay=0)
+
+    assert (await queue.depth_by_level())["ERROR"] == 0
+    promoted = await asyncio.wait_for(queue.dequeue(), timeout=1)
+    assert promoted.job_id == "error"
+    assert promoted.attempts == 2
+    assert promoted.status == DeliveryStatus.PROCESSING.value
+    assert await queue._client.zcard(queue._delayed_key) == 0
+
+async def test_delayed_job_waits_for_its_time(queue):
+    await queue.enqueue(make_job("warning", LogLevel.WARNING))
+    await queue.requeue(await queue.dequeue(), delay=60)
+
+    await queue._promote_delayed()
+
+    assert await queue.depth() == 0
+    assert await queue._client.zcard(queue._delayed_key) == 1
+
+async def test_concurrent_promotions_push_a_job_once(server, queue):
+    others = [RedisDeliveryQueue("redis://fake") for _ in range(3)]
+    for other in others:
+        await other.start()
+    await queue.enqueue(make_job("critical", LogLevel.CRITICAL))
+    await queue.requeue(await queue.dequeue(), delay=0)
+
+    await asyncio.gather(queue._promote_delayed(), *(other._promote_delayed() for other in others))
+
+    assert await queue.depth_by_level() == {level.value: int(level is LogLevel.CRITICAL) for level in LogLevel}
+    for other in others:
+        await other.close()
+
+async def test_stale_claims_are_requeued(server):
+    queue = RedisDeliveryQueue("redis://fake", block_timeout=0.05, visibility_timeout=0)
+    await queue.enqueue(make_job("info", LogLevel.INFO))
+    await queue.dequeue()
+
+    assert await queue.recover_stale() == 1
+
+    recovered = await asyncio.wait_for(queue.dequeue(), timeout=1)
+    assert recovered.job_id == "info"
+    assert recovered.attempts == 2
+    await queue.close()
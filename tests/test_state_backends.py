@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from infrastructure.state.redis_state_backend import RedisStateBackend
+from infrastructure.state.sqlite_state_backend import SqliteStateBackend
+
+@pytest.fixture(params=["sqlite", "redis"])
+async def backend(request, tmp_path):
+    if request.param == "redis":
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        state = RedisStateBackend("", client=fakeredis.aioredis.FakeRedis(decode_responses=True))
+    else:
+        state = SqliteStateBackend(str(tmp_path / "state.db"))
+    await state.start()
+    yield state
+    await state.close()
+
+async def test_set_if_absent_keeps_the_live_value(backend):
+    assert await backend.set("key", "first", ttl=0.2, only_if_absent=True) is None
+    assert await backend.set("key", "second", ttl=0.2, only_if_absent=True) == "first"
+    assert await backend.get("key") == "first"
+
+    await asyncio.sleep(0.3)
+
+    assert await backend.get("key") is None
+    assert await backend.set("key", "third", ttl=0.2, only_if_absent=True) is None
+    assert await backend.pop("key") == "third"
+    assert await backend.get("key") is None
+
+async def test_incr_sets_the_ttl_only_when_the_counter_is_created(backend):
+    assert await backend.incr("counter", ttl=0.3) == 1
+    await asyncio.sleep(0.2)
+    assert await backend.incr("counter", 2, ttl=0.3) == 3
+
+    # Had the second incr refreshed the TTL, the counter would still be live
+    await asyncio.sleep(0.2)
+
+    assert await backend.incr("counter", ttl=0.3) == 1
+
+async def test_pace_allows_a_burst_then_spaces_slots_at_the_rate(backend):
+    limit = ("webhook", 10.0, 3)
+
+    waits = [await backend.pace([limit], max_wait=5) for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.1, abs=0.02)
+    assert waits[4] == pytest.approx(0.2, abs=0.02)
+
+async def test_pace_reserves_every_limit_or_none(backend):
+    fast = ("chat", 100.0, 2)
+    slow = ("bot", 1.0, 1)
+
+    assert await backend.pace([fast, slow], max_wait=0.5) == 0.0
+    # The slow limit is 1s away: over max_wait, so neither limit is reserved
+    first = await backend.pace([fast, slow], max_wait=0.5)
+    second = await backend.pace([fast, slow], max_wait=0.5)
+
+    assert first == pytest.approx(1.0, abs=0.05)
+    assert second == pytest.approx(first, abs=0.05)
+    # One slot of the fast burst is left: the rejected calls took none
+    assert await backend.pace([fast], max_wait=0.5) == 0.0
+
+async def test_block_holds_the_next_slot(backend):
+    limit = ("webhook", 10.0, 3)
+
+    await backend.block(limit, 1.0)
+
+    assert await backend.pace([limit], max_wait=0) == pytest.approx(1.0, abs=0.05)
+    # A shorter block does not shorten a longer one
+    await backend.block(limit, 0.1)
+    assert await backend.pace([limit], max_wait=0) == pytest.approx(1.0, abs=0.05)
+
+async def test_a_failing_op_fails_alone_in_its_batch(backend):
+    await backend.set("text", "not a number")
+    batches = backend.get_stats()["batches"]
+
+    results = await asyncio.gather(
+        backend.set("a", "1"),
+        backend.incr("text"),
+        backend.incr("counter"),
+        backend.get("a"),
+        return_exceptions=True
+    )
+
+    assert backend.get_stats()["batches"] == batches + 1
+    assert results[0] is None
+    assert isinstance(results[1], Exception)
+    assert results[2:] == [1, "1"]
+    assert await backend.get("text") == "not a number"